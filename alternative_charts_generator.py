@@ -1,310 +1,442 @@
 """
 Alternative Chart Options for Phone Addiction Dashboard
 This script provides cleaner, alternative visualizations you can use
+
+Only charts whose input columns or builder code changed since the last
+run are re-rendered (see build_manifest.py).
+
+Usage:
+    python alternative_charts_generator.py [--force]
 """
 
+import argparse
+import os
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
-# Load data
-df_addiction = pd.read_csv('Students_Social_Media_Addiction.csv')
-df_addiction['Addiction_Category'] = pd.cut(
-    df_addiction['Addicted_Score'], 
-    bins=[0, 3, 6, 9], 
-    labels=['Low', 'Moderate', 'High']
-)
+import data_cache
+import quantile_sketch
+from build_manifest import BuildManifest, chart_fingerprint
+
+OUTPUT_DIR = 'alternative_charts'
+EXPORT_PARAMS = {'formats': ['html']}
+
+# Fixed grids for the box/violin sketches (values outside fall into the edge bins)
+USAGE_GRID = np.linspace(0, 12, 241)
+SCORE_GRID = np.linspace(0, 10, 201)
+
+
+def load_data():
+    """Load and preprocess the addiction dataset"""
+    df_addiction = data_cache.read_dataset('addiction')
+    df_addiction['Addiction_Category'] = pd.cut(
+        df_addiction['Addicted_Score'], 
+        bins=[0, 3, 6, 9], 
+        labels=['Low', 'Moderate', 'High']
+    )
+    
+    # Create usage categories
+    df_addiction['Usage_Category'] = pd.cut(
+        df_addiction['Avg_Daily_Usage_Hours'],
+        bins=[0, 3, 5, 10],
+        labels=['Light (0-3h)', 'Moderate (3-5h)', 'Heavy (5h+)']
+    )
+    
+    return df_addiction
 
-print("Creating alternative chart options...\n")
 
 # ============================================================================
 # ALTERNATIVE 1: Box Plot for Usage vs Addiction Category (Cleaner!)
 # ============================================================================
-print("1. Box Plot - Usage Distribution by Addiction Level")
-fig = go.Figure()
-
-colors = {'Low': '#00CC96', 'Moderate': '#FFA15A', 'High': '#EF553B'}
-
-for category in ['Low', 'Moderate', 'High']:
-    data = df_addiction[df_addiction['Addiction_Category'] == category]['Avg_Daily_Usage_Hours']
-    fig.add_trace(go.Box(
-        y=data,
-        name=category,
-        marker_color=colors[category],
-        boxmean='sd'  # Show mean and standard deviation
-    ))
+def build_box_plot_usage_addiction(df_addiction):
+    """Box plot of daily usage by addiction level (drawn from per-category quantile sketches)"""
+    fig = go.Figure()
+
+    colors = {'Low': '#00CC96', 'Moderate': '#FFA15A', 'High': '#EF553B'}
+    sketches = quantile_sketch.grouped_sketches(
+        df_addiction, 'Addiction_Category', 'Avg_Daily_Usage_Hours', USAGE_GRID
+    )
 
-fig.update_layout(
-    title='Daily Usage Distribution by Addiction Level<br><sub>Box plot showing median, quartiles, and outliers</sub>',
-    yaxis_title='Average Daily Usage (Hours)',
-    xaxis_title='Addiction Category',
-    template='plotly_white',
-    height=600,
-    width=1200,
-    showlegend=True
-)
+    for category in ['Low', 'Moderate', 'High']:
+        if category not in sketches:
+            continue
+        stats = sketches[category].box_stats()
+        fig.add_trace(go.Box(
+            x=[category],
+            name=category,
+            marker_color=colors[category],
+            boxmean='sd',  # Show mean and standard deviation
+            **{key: [value] for key, value in stats.items()}
+        ))
+
+    fig.update_layout(
+        title='Daily Usage Distribution by Addiction Level<br><sub>Box plot showing median, quartiles and 1.5 IQR whiskers</sub>',
+        yaxis_title='Average Daily Usage (Hours)',
+        xaxis_title='Addiction Category',
+        template='plotly_white',
+        height=600,
+        width=1200,
+        showlegend=True
+    )
+
+    return fig
 
-fig.write_html('alternative_charts/1_box_plot_usage_addiction.html')
-print("   ✓ Saved: 1_box_plot_usage_addiction.html")
 
 # ============================================================================
 # ALTERNATIVE 2: Grouped Bar Chart - Clear Comparison
 # ============================================================================
-print("2. Grouped Bar Chart - Health Metrics Comparison")
-
-health_stats = df_addiction.groupby('Addiction_Category').agg({
-    'Mental_Health_Score': 'mean',
-    'Sleep_Hours_Per_Night': 'mean',
-    'Avg_Daily_Usage_Hours': 'mean'
-}).reset_index()
-
-fig = go.Figure()
-
-# Normalize values for fair comparison (scale to 0-10)
-fig.add_trace(go.Bar(
-    name='Mental Health Score',
-    x=health_stats['Addiction_Category'],
-    y=health_stats['Mental_Health_Score'],
-    marker_color='#636EFA',
-    text=health_stats['Mental_Health_Score'].round(2),
-    textposition='outside'
-))
-
-fig.add_trace(go.Bar(
-    name='Sleep Hours',
-    x=health_stats['Addiction_Category'],
-    y=health_stats['Sleep_Hours_Per_Night'],
-    marker_color='#EF553B',
-    text=health_stats['Sleep_Hours_Per_Night'].round(2),
-    textposition='outside'
-))
-
-fig.update_layout(
-    title='Health Metrics by Addiction Level<br><sub>Comparing mental health scores and sleep hours</sub>',
-    yaxis_title='Value',
-    xaxis_title='Addiction Category',
-    barmode='group',
-    template='plotly_white',
-    height=600,
-    width=1200,
-    legend=dict(x=0.01, y=0.99)
-)
-
-fig.write_html('alternative_charts/2_grouped_bar_health_metrics.html')
-print("   ✓ Saved: 2_grouped_bar_health_metrics.html")
+def build_grouped_bar_health_metrics(df_addiction):
+    """Grouped bar chart of health metrics by addiction level"""
+    health_stats = df_addiction.groupby('Addiction_Category').agg({
+        'Mental_Health_Score': 'mean',
+        'Sleep_Hours_Per_Night': 'mean',
+        'Avg_Daily_Usage_Hours': 'mean'
+    }).reset_index()
+
+    fig = go.Figure()
+
+    # Normalize values for fair comparison (scale to 0-10)
+    fig.add_trace(go.Bar(
+        name='Mental Health Score',
+        x=health_stats['Addiction_Category'],
+        y=health_stats['Mental_Health_Score'],
+        marker_color='#636EFA',
+        text=health_stats['Mental_Health_Score'].round(2),
+        textposition='outside'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Sleep Hours',
+        x=health_stats['Addiction_Category'],
+        y=health_stats['Sleep_Hours_Per_Night'],
+        marker_color='#EF553B',
+        text=health_stats['Sleep_Hours_Per_Night'].round(2),
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        title='Health Metrics by Addiction Level<br><sub>Comparing mental health scores and sleep hours</sub>',
+        yaxis_title='Value',
+        xaxis_title='Addiction Category',
+        barmode='group',
+        template='plotly_white',
+        height=600,
+        width=1200,
+        legend=dict(x=0.01, y=0.99)
+    )
+
+    return fig
+
 
 # ============================================================================
 # ALTERNATIVE 3: Heatmap - Platform vs Usage Hours
 # ============================================================================
-print("3. Heatmap - Platform Usage Patterns")
-
-# Create usage categories
-df_addiction['Usage_Category'] = pd.cut(
-    df_addiction['Avg_Daily_Usage_Hours'],
-    bins=[0, 3, 5, 10],
-    labels=['Light (0-3h)', 'Moderate (3-5h)', 'Heavy (5h+)']
-)
-
-# Get top 8 platforms
-top_platforms = df_addiction['Most_Used_Platform'].value_counts().head(8).index
-
-# Create crosstab
-heatmap_data = pd.crosstab(
-    df_addiction[df_addiction['Most_Used_Platform'].isin(top_platforms)]['Most_Used_Platform'],
-    df_addiction[df_addiction['Most_Used_Platform'].isin(top_platforms)]['Usage_Category']
-)
-
-fig = go.Figure(data=go.Heatmap(
-    z=heatmap_data.values,
-    x=heatmap_data.columns,
-    y=heatmap_data.index,
-    colorscale='Reds',
-    text=heatmap_data.values,
-    texttemplate='%{text}',
-    textfont={"size": 14},
-    colorbar=dict(title="Student Count")
-))
-
-fig.update_layout(
-    title='Platform Usage Patterns<br><sub>Distribution of users across usage categories</sub>',
-    xaxis_title='Usage Category',
-    yaxis_title='Platform',
-    template='plotly_white',
-    height=600,
-    width=1200
-)
-
-fig.write_html('alternative_charts/3_heatmap_platform_usage.html')
-print("   ✓ Saved: 3_heatmap_platform_usage.html")
+def build_heatmap_platform_usage(df_addiction):
+    """Heatmap of platform vs usage category"""
+    # Get top 8 platforms
+    top_platforms = df_addiction['Most_Used_Platform'].value_counts().head(8).index
+
+    # Create crosstab
+    heatmap_data = pd.crosstab(
+        df_addiction[df_addiction['Most_Used_Platform'].isin(top_platforms)]['Most_Used_Platform'],
+        df_addiction[df_addiction['Most_Used_Platform'].isin(top_platforms)]['Usage_Category']
+    )
+
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values,
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale='Reds',
+        text=heatmap_data.values,
+        texttemplate='%{text}',
+        textfont={"size": 14},
+        colorbar=dict(title="Student Count")
+    ))
+
+    fig.update_layout(
+        title='Platform Usage Patterns<br><sub>Distribution of users across usage categories</sub>',
+        xaxis_title='Usage Category',
+        yaxis_title='Platform',
+        template='plotly_white',
+        height=600,
+        width=1200
+    )
+
+    return fig
+
 
 # ============================================================================
 # ALTERNATIVE 4: Bubble Chart - Multi-dimensional View
 # ============================================================================
-print("4. Bubble Chart - Comprehensive View")
-
-# Get platform averages
-platform_stats = df_addiction.groupby('Most_Used_Platform').agg({
-    'Avg_Daily_Usage_Hours': 'mean',
-    'Addicted_Score': 'mean',
-    'Mental_Health_Score': 'mean',
-    'Student_ID': 'count'
-}).reset_index()
-platform_stats.columns = ['Platform', 'Avg_Usage', 'Avg_Addiction', 'Avg_Mental_Health', 'User_Count']
-
-# Filter to top platforms
-platform_stats = platform_stats.nlargest(10, 'User_Count')
-
-fig = px.scatter(
-    platform_stats,
-    x='Avg_Usage',
-    y='Avg_Addiction',
-    size='User_Count',
-    color='Avg_Mental_Health',
-    hover_name='Platform',
-    title='Platform Analysis: Usage, Addiction & Mental Health<br><sub>Bubble size = user count, Color = mental health score</sub>',
-    labels={
-        'Avg_Usage': 'Average Daily Usage (Hours)',
-        'Avg_Addiction': 'Average Addiction Score',
-        'Avg_Mental_Health': 'Mental Health Score'
-    },
-    color_continuous_scale='RdYlGn',
-    size_max=60,
-    height=600,
-    width=1200
-)
-
-fig.update_layout(template='plotly_white')
-fig.write_html('alternative_charts/4_bubble_chart_comprehensive.html')
-print("   ✓ Saved: 4_bubble_chart_comprehensive.html")
+def build_bubble_chart_comprehensive(df_addiction):
+    """Bubble chart of platform usage, addiction and mental health"""
+    # Get platform averages
+    platform_stats = df_addiction.groupby('Most_Used_Platform').agg({
+        'Avg_Daily_Usage_Hours': 'mean',
+        'Addicted_Score': 'mean',
+        'Mental_Health_Score': 'mean',
+        'Student_ID': 'count'
+    }).reset_index()
+    platform_stats.columns = ['Platform', 'Avg_Usage', 'Avg_Addiction', 'Avg_Mental_Health', 'User_Count']
+
+    # Filter to top platforms
+    platform_stats = platform_stats.nlargest(10, 'User_Count')
+
+    fig = px.scatter(
+        platform_stats,
+        x='Avg_Usage',
+        y='Avg_Addiction',
+        size='User_Count',
+        color='Avg_Mental_Health',
+        hover_name='Platform',
+        title='Platform Analysis: Usage, Addiction & Mental Health<br><sub>Bubble size = user count, Color = mental health score</sub>',
+        labels={
+            'Avg_Usage': 'Average Daily Usage (Hours)',
+            'Avg_Addiction': 'Average Addiction Score',
+            'Avg_Mental_Health': 'Mental Health Score'
+        },
+        color_continuous_scale='RdYlGn',
+        size_max=60,
+        height=600,
+        width=1200
+    )
+
+    fig.update_layout(template='plotly_white')
+
+    return fig
+
 
 # ============================================================================
 # ALTERNATIVE 5: Violin Plot - Distribution Comparison
 # ============================================================================
-print("5. Violin Plot - Addiction Score Distribution by Platform")
+def build_violin_plot_addiction(df_addiction):
+    """Violin plot of addiction score by platform (KDE and box from per-platform sketches)"""
+    top_5_platforms = df_addiction['Most_Used_Platform'].value_counts().head(5).index
+    sketches = quantile_sketch.grouped_sketches(
+        df_addiction, 'Most_Used_Platform', 'Addicted_Score', SCORE_GRID
+    )
+    points = (SCORE_GRID[:-1] + SCORE_GRID[1:]) / 2
+
+    fig = go.Figure()
+
+    for position, platform in enumerate(top_5_platforms):
+        sketch = sketches[platform]
+        color = px.colors.qualitative.Plotly[position % len(px.colors.qualitative.Plotly)]
+
+        # Mirrored KDE outline, trimmed to the observed range like plotly's violins
+        inside = (points >= sketch.min) & (points <= sketch.max)
+        y = points[inside]
+        if len(y) == 0:
+            # Every value is the same (min == max) and falls between grid points: a flat violin
+            y = np.array([sketch.min, sketch.max])
+        half_width = sketch.kde(y)
+        peak = half_width.max()
+        half_width = 0.4 * half_width / peak if peak > 0 else np.full(len(y), 0.4)
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([position - half_width, (position + half_width)[::-1]]),
+            y=np.concatenate([y, y[::-1]]),
+            fill='toself',
+            mode='lines',
+            line=dict(color=color, width=1),
+            name=platform,
+            hoverinfo='name'
+        ))
+
+        # Inner box (quartiles), median and mean lines
+        stats = sketch.box_stats()
+        fig.add_trace(go.Box(
+            x=[position],
+            q1=[stats['q1']],
+            median=[stats['median']],
+            q3=[stats['q3']],
+            lowerfence=[stats['lowerfence']],
+            upperfence=[stats['upperfence']],
+            mean=[stats['mean']],
+            boxmean=True,
+            width=0.1,
+            marker_color=color,
+            name=platform,
+            showlegend=False
+        ))
+
+    fig.update_layout(
+        title='Addiction Score Distribution by Platform<br><sub>Violin plots show full distribution shape</sub>',
+        yaxis_title='Addiction Score (0-9)',
+        xaxis=dict(
+            title='Platform',
+            tickmode='array',
+            tickvals=list(range(len(top_5_platforms))),
+            ticktext=list(top_5_platforms)
+        ),
+        template='plotly_white',
+        height=600,
+        width=1200
+    )
+
+    return fig
 
-top_5_platforms = df_addiction['Most_Used_Platform'].value_counts().head(5).index
-df_filtered = df_addiction[df_addiction['Most_Used_Platform'].isin(top_5_platforms)]
 
-fig = go.Figure()
+# ============================================================================
+# ALTERNATIVE 6: Stacked Area Chart - Cumulative Impact
+# ============================================================================
+def build_stacked_bar_academic_impact(df_addiction):
+    """Stacked bar chart of academic impact by platform"""
+    academic_breakdown = pd.crosstab(
+        df_addiction['Most_Used_Platform'],
+        df_addiction['Affects_Academic_Performance']
+    ).sort_values('Yes', ascending=False).head(8)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='No Impact',
+        x=academic_breakdown.index,
+        y=academic_breakdown['No'],
+        marker_color='#00CC96'
+    ))
 
-for platform in top_5_platforms:
-    data = df_filtered[df_filtered['Most_Used_Platform'] == platform]['Addicted_Score']
-    fig.add_trace(go.Violin(
-        y=data,
-        name=platform,
-        box_visible=True,
-        meanline_visible=True
+    fig.add_trace(go.Bar(
+        name='Academic Impact',
+        x=academic_breakdown.index,
+        y=academic_breakdown['Yes'],
+        marker_color='#EF553B'
     ))
 
-fig.update_layout(
-    title='Addiction Score Distribution by Platform<br><sub>Violin plots show full distribution shape</sub>',
-    yaxis_title='Addiction Score (0-9)',
-    xaxis_title='Platform',
-    template='plotly_white',
-    height=600,
-    width=1200
-)
+    fig.update_layout(
+        title='Academic Performance Impact by Platform<br><sub>Number of students affected vs. unaffected</sub>',
+        xaxis_title='Platform',
+        yaxis_title='Number of Students',
+        barmode='stack',
+        template='plotly_white',
+        height=600,
+        width=1200
+    )
 
-fig.write_html('alternative_charts/5_violin_plot_addiction.html')
-print("   ✓ Saved: 5_violin_plot_addiction.html")
+    return fig
 
-# ============================================================================
-# ALTERNATIVE 6: Stacked Area Chart - Cumulative Impact
-# ============================================================================
-print("6. Stacked Bar - Academic Impact Breakdown")
-
-academic_breakdown = pd.crosstab(
-    df_addiction['Most_Used_Platform'],
-    df_addiction['Affects_Academic_Performance']
-).sort_values('Yes', ascending=False).head(8)
-
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    name='No Impact',
-    x=academic_breakdown.index,
-    y=academic_breakdown['No'],
-    marker_color='#00CC96'
-))
-
-fig.add_trace(go.Bar(
-    name='Academic Impact',
-    x=academic_breakdown.index,
-    y=academic_breakdown['Yes'],
-    marker_color='#EF553B'
-))
-
-fig.update_layout(
-    title='Academic Performance Impact by Platform<br><sub>Number of students affected vs. unaffected</sub>',
-    xaxis_title='Platform',
-    yaxis_title='Number of Students',
-    barmode='stack',
-    template='plotly_white',
-    height=600,
-    width=1200
-)
-
-fig.write_html('alternative_charts/6_stacked_bar_academic_impact.html')
-print("   ✓ Saved: 6_stacked_bar_academic_impact.html")
 
 # ============================================================================
 # ALTERNATIVE 7: Parallel Coordinates - Multi-variable Analysis
 # ============================================================================
-print("7. Parallel Coordinates - Multi-dimensional Analysis")
-
-# Prepare data - normalize values
-df_normalized = df_addiction.copy()
-df_normalized['Usage_Normalized'] = (df_normalized['Avg_Daily_Usage_Hours'] - df_normalized['Avg_Daily_Usage_Hours'].min()) / (df_normalized['Avg_Daily_Usage_Hours'].max() - df_normalized['Avg_Daily_Usage_Hours'].min()) * 10
-df_normalized['Sleep_Normalized'] = df_normalized['Sleep_Hours_Per_Night']
-df_normalized['MH_Normalized'] = df_normalized['Mental_Health_Score']
-df_normalized['Addiction_Normalized'] = df_normalized['Addicted_Score']
-
-# Sample for cleaner visualization
-df_sample = df_normalized.sample(min(200, len(df_normalized)), random_state=42)
-
-fig = go.Figure(data=
-    go.Parcoords(
-        line=dict(
-            color=df_sample['Addicted_Score'],
-            colorscale='Reds',
-            showscale=True,
-            cmin=2,
-            cmax=9
-        ),
-        dimensions=[
-            dict(range=[0, 10],
-                 label='Daily Usage (0-10h)', values=df_sample['Usage_Normalized']),
-            dict(range=[2, 9],
-                 label='Addiction Score', values=df_sample['Addiction_Normalized']),
-            dict(range=[0, 10],
-                 label='Mental Health', values=df_sample['MH_Normalized']),
-            dict(range=[4, 9],
-                 label='Sleep Hours', values=df_sample['Sleep_Normalized'])
-        ]
+def build_parallel_coordinates(df_addiction):
+    """Parallel coordinates of usage, addiction, mental health and sleep"""
+    # Prepare data - normalize values
+    df_normalized = df_addiction.copy()
+    df_normalized['Usage_Normalized'] = (df_normalized['Avg_Daily_Usage_Hours'] - df_normalized['Avg_Daily_Usage_Hours'].min()) / (df_normalized['Avg_Daily_Usage_Hours'].max() - df_normalized['Avg_Daily_Usage_Hours'].min()) * 10
+    df_normalized['Sleep_Normalized'] = df_normalized['Sleep_Hours_Per_Night']
+    df_normalized['MH_Normalized'] = df_normalized['Mental_Health_Score']
+    df_normalized['Addiction_Normalized'] = df_normalized['Addicted_Score']
+
+    # Sample for cleaner visualization
+    df_sample = df_normalized.sample(min(200, len(df_normalized)), random_state=42)
+
+    fig = go.Figure(data=
+        go.Parcoords(
+            line=dict(
+                color=df_sample['Addicted_Score'],
+                colorscale='Reds',
+                showscale=True,
+                cmin=2,
+                cmax=9
+            ),
+            dimensions=[
+                dict(range=[0, 10],
+                     label='Daily Usage (0-10h)', values=df_sample['Usage_Normalized']),
+                dict(range=[2, 9],
+                     label='Addiction Score', values=df_sample['Addiction_Normalized']),
+                dict(range=[0, 10],
+                     label='Mental Health', values=df_sample['MH_Normalized']),
+                dict(range=[4, 9],
+                     label='Sleep Hours', values=df_sample['Sleep_Normalized'])
+            ]
+        )
     )
-)
-
-fig.update_layout(
-    title='Multi-dimensional Analysis<br><sub>Interactive parallel coordinates showing relationships</sub>',
-    template='plotly_white',
-    height=600,
-    width=1200
-)
-
-fig.write_html('alternative_charts/7_parallel_coordinates.html')
-print("   ✓ Saved: 7_parallel_coordinates.html")
-
-print("\n" + "="*70)
-print("✓ All alternative charts created successfully!")
-print("="*70)
-print("\nCharts saved in 'alternative_charts' directory:")
-print("  1. Box Plot - Usage distribution (cleaner than scatter)")
-print("  2. Grouped Bar - Health metrics side-by-side")
-print("  3. Heatmap - Platform usage patterns")
-print("  4. Bubble Chart - Multi-dimensional platform view")
-print("  5. Violin Plot - Distribution shapes")
-print("  6. Stacked Bar - Academic impact breakdown")
-print("  7. Parallel Coordinates - Multi-variable exploration")
-print("\nUse these for variety in your presentation!")
+
+    fig.update_layout(
+        title='Multi-dimensional Analysis<br><sub>Interactive parallel coordinates showing relationships</sub>',
+        template='plotly_white',
+        height=600,
+        width=1200
+    )
+
+    return fig
+
+
+# Charts: output name -> (builder, description, columns the chart reads)
+ALTERNATIVE_CHARTS = {
+    '1_box_plot_usage_addiction': (
+        build_box_plot_usage_addiction, "1. Box Plot - Usage Distribution by Addiction Level",
+        ['Addiction_Category', 'Avg_Daily_Usage_Hours']
+    ),
+    '2_grouped_bar_health_metrics': (
+        build_grouped_bar_health_metrics, "2. Grouped Bar Chart - Health Metrics Comparison",
+        ['Addiction_Category', 'Mental_Health_Score', 'Sleep_Hours_Per_Night', 'Avg_Daily_Usage_Hours']
+    ),
+    '3_heatmap_platform_usage': (
+        build_heatmap_platform_usage, "3. Heatmap - Platform Usage Patterns",
+        ['Most_Used_Platform', 'Usage_Category']
+    ),
+    '4_bubble_chart_comprehensive': (
+        build_bubble_chart_comprehensive, "4. Bubble Chart - Comprehensive View",
+        ['Most_Used_Platform', 'Avg_Daily_Usage_Hours', 'Addicted_Score', 'Mental_Health_Score', 'Student_ID']
+    ),
+    '5_violin_plot_addiction': (
+        build_violin_plot_addiction, "5. Violin Plot - Addiction Score Distribution by Platform",
+        ['Most_Used_Platform', 'Addicted_Score']
+    ),
+    '6_stacked_bar_academic_impact': (
+        build_stacked_bar_academic_impact, "6. Stacked Bar - Academic Impact Breakdown",
+        ['Most_Used_Platform', 'Affects_Academic_Performance']
+    ),
+    '7_parallel_coordinates': (
+        build_parallel_coordinates, "7. Parallel Coordinates - Multi-dimensional Analysis",
+        ['Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 'Mental_Health_Score', 'Addicted_Score']
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create the alternative chart options')
+    parser.add_argument('--force', action='store_true',
+                        help='re-render every chart even if its inputs are unchanged')
+    args = parser.parse_args()
+    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    df_addiction = load_data()
+    manifest = BuildManifest(OUTPUT_DIR)
+    
+    print("Creating alternative chart options...\n")
+    
+    for name, (builder, description, columns) in ALTERNATIVE_CHARTS.items():
+        fingerprint = chart_fingerprint(df_addiction[columns], EXPORT_PARAMS, builder)
+        if not args.force and manifest.is_fresh(name, fingerprint, [f'{name}.html']):
+            print(f"{description} (up to date, skipped)")
+            continue
+        
+        print(description)
+        fig = builder(df_addiction)
+        fig.write_html(os.path.join(OUTPUT_DIR, f'{name}.html'))
+        manifest.record(name, fingerprint)
+        manifest.save()
+        print(f"   ✓ Saved: {name}.html")
+    
+    print("\n" + "="*70)
+    print("✓ All alternative charts created successfully!")
+    print("="*70)
+    print(f"\nCharts saved in '{OUTPUT_DIR}' directory:")
+    print("  1. Box Plot - Usage distribution (cleaner than scatter)")
+    print("  2. Grouped Bar - Health metrics side-by-side")
+    print("  3. Heatmap - Platform usage patterns")
+    print("  4. Bubble Chart - Multi-dimensional platform view")
+    print("  5. Violin Plot - Distribution shapes")
+    print("  6. Stacked Bar - Academic impact breakdown")
+    print("  7. Parallel Coordinates - Multi-variable exploration")
+    print("\nUse these for variety in your presentation!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+"""
+Benchmark Suite
+Timings of data loading, preprocessing, every dashboard chart and every page
+
+Each dataset scale gets its own workspace (.benchmarks/scale-<k>/) holding
+synthetic datasets with k times the bundled row counts (see
+synthetic_data.py) under the original file names.
+Stages run with the workspace as the working directory, so the Parquet
+cache, event store and page renders all see the scaled data. Every
+stage is timed several times and its median is written to a JSON file.
+A stage regresses against the stored baseline when its median grows by
+more than the threshold and by more than MIN_REGRESSION_S. Timings only
+compare on the same machine, so no baseline is shipped: without one the
+check fails until --save-baseline records it.
+
+Usage:
+    python benchmarks.py [--scales 1 10] [--repeat 3] [--output PATH]
+                         [--baseline PATH] [--threshold 0.25] [--save-baseline]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+
+import chunked_aggregation
+import data_cache
+import synthetic_data
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD_PATH = os.path.join(REPO_DIR, 'phone_addiction_dashboard.py')
+WORKSPACE_DIR = os.path.join(REPO_DIR, '.benchmarks')
+DEFAULT_OUTPUT = os.path.join(WORKSPACE_DIR, 'results.json')
+DEFAULT_BASELINE = os.path.join(REPO_DIR, 'benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.25
+MIN_REGRESSION_S = 0.005
+PAGE_TIMEOUT_S = 600
+CONCURRENT_WORKERS = 4
+
+PAGES = ["Overview", "Social Media Addiction", "Screen Time Patterns", "Comparative Analysis"]
+
+# Dashboard chart queries, timed on every available backend
+QUERIES = ['platform_counts', 'academic_impact_counts', 'health_by_addiction', 'gender_addiction_counts']
+
+# Dashboard chart -> arguments it is benchmarked with (every create_* must be listed)
+CHART_ARGS = {
+    'create_platform_distribution': lambda inputs: (inputs['platform_counts'],),
+    'create_addiction_correlation': lambda inputs: (inputs['addiction'], inputs['kpis']),
+    'create_mental_health_impact': lambda inputs: (inputs['health_by_addiction'],),
+    'create_category_distribution': lambda inputs: (inputs['screentime'],),
+    'create_hourly_usage_pattern': lambda inputs: (inputs['screentime'],),
+    'create_productivity_comparison': lambda inputs: (inputs['screentime'],),
+    'create_academic_impact': lambda inputs: (inputs['academic_impact_counts'],),
+    'create_top_apps_usage': lambda inputs: (inputs['screentime'],),
+    'create_daily_usage_trend': lambda inputs: (inputs['screentime'],),
+    'create_gender_comparison': lambda inputs: (inputs['gender_addiction_counts'],),
+    'create_correlation_matrix': lambda inputs: (inputs['kpis'],),
+}
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def write_scaled_sources(workspace, scale):
+    """Write synthetic datasets scale times the bundled row counts into a workspace"""
+    os.makedirs(workspace, exist_ok=True)
+    marker = os.path.join(workspace, 'sources.json')
+    with working_directory(REPO_DIR):
+        fingerprints = {name: data_cache.dataset_version(name) for name in data_cache.DATASETS}
+    with open(synthetic_data.__file__, 'rb') as f:
+        fingerprints['generator'] = hashlib.sha1(f.read()).hexdigest()
+    if os.path.exists(marker):
+        with open(marker) as f:
+            if json.load(f) == fingerprints:
+                return
+
+    with working_directory(REPO_DIR):
+        for name, spec in data_cache.DATASETS.items():
+            rows = data_cache.read_table(name, columns=[]).num_rows * scale
+            synthetic_data.write_dataset(name, rows, os.path.join(workspace, spec['source']))
+
+    # Stale caches from a previous run of this scale would be reused otherwise
+    shutil.rmtree(os.path.join(workspace, data_cache.CACHE_DIR), ignore_errors=True)
+    shutil.rmtree(os.path.join(workspace, '.event_store'), ignore_errors=True)
+    with open(marker, 'w') as f:
+        json.dump(fingerprints, f)
+
+
+def time_call(fn, repeat, setup=None):
+    """Run fn(*setup()) once untimed (warm-up), then repeat times and return the timings in seconds"""
+    fn(*(setup() if setup else ()))
+    timings = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def benchmark_stages(dashboard, repeat):
+    """Time loading, preprocessing, filtering and every create_* chart in the current workspace"""
+    results = {}
+
+    def record(stage, timings):
+        results[stage] = timings
+        print(f"   {stage:<48}{statistics.median(timings) * 1000:>10.1f} ms")
+
+    record('load/addiction_parquet_cache', time_call(lambda: data_cache.build_cache('addiction'), repeat))
+    record('load/addiction', time_call(
+        lambda: data_cache.read_dataset('addiction', dashboard.ADDICTION_COLUMNS), repeat
+    ))
+    record('load/screentime_aggregates', time_call(chunked_aggregation.aggregate_dataset, repeat))
+
+    raw = data_cache.read_dataset('addiction', dashboard.ADDICTION_COLUMNS)
+    preprocess = dashboard.preprocess_addiction_data
+    record('preprocess/addiction', time_call(lambda: preprocess(raw), repeat))
+    df = preprocess(raw)
+    record('preprocess/filter_index', time_call(
+        lambda: dashboard.FilterIndex(df, ('Most_Used_Platform', 'Gender'), ('Age',)), repeat
+    ))
+    record('preprocess/kpi_cube', time_call(lambda: dashboard.KPICube(df), repeat))
+
+    index = dashboard.FilterIndex(df, ('Most_Used_Platform', 'Gender'), ('Age',))
+    platform_value = index.values('Most_Used_Platform')[0]
+    record('filter/addiction', time_call(
+        lambda: index.apply(df, equals={'Most_Used_Platform': platform_value, 'Gender': None},
+                            ranges={'Age': (19, 22)}),
+        repeat
+    ))
+    screentime = chunked_aggregation.aggregate_dataset()
+    category = screentime.categories()[0]
+    record('filter/screentime_category', time_call(lambda: screentime.for_category(category), repeat))
+
+    backends = [dashboard.PandasBackend({'addiction': df}, indexes={'addiction': index})]
+    try:
+        backends.append(dashboard.DuckDBBackend(
+            {'addiction': data_cache.ensure_cache('addiction')},
+            buckets={'addiction': dashboard.ADDICTION_BUCKETS}
+        ))
+    except ImportError:
+        print("   (duckdb not installed, skipping the DuckDB query backend)")
+    where = dashboard.addiction_where({'platform': platform_value, 'gender': None, 'age': (19, 22)})
+    for backend in backends:
+        for name in QUERIES:
+            query = getattr(dashboard, name)
+            record(f'query/{backend.name}/{name}', time_call(lambda: query(backend, where), repeat))
+
+    inputs = {'addiction': df, 'kpis': dashboard.KPICube(df).slice(), 'screentime': screentime}
+    inputs.update({name: getattr(dashboard, name)(backends[0], {}) for name in QUERIES})
+    charts = sorted(name for name, _ in inspect.getmembers(dashboard, inspect.isfunction)
+                    if name.startswith('create_'))
+    missing = [name for name in charts if name not in CHART_ARGS]
+    if missing:
+        raise KeyError(f"No benchmark arguments for chart(s): {', '.join(missing)}")
+    for name in charts:
+        create_chart = getattr(dashboard, name)
+        args = CHART_ARGS[name](inputs)
+        record(f'chart/{name}', time_call(lambda: create_chart(*args), repeat))
+
+    # Each page's charts built one after another vs concurrently (on the dashboard's pool size when
+    # it is concurrent, else on CONCURRENT_WORKERS, to show whether enabling it would pay off)
+    data = dashboard.DashboardData(
+        addiction=dashboard.SharedFrame(df), addiction_version=None, addiction_index=index,
+        addiction_cube=dashboard.KPICube(df), query=backends[0],
+        screentime=screentime, screentime_version=None
+    )
+    with ThreadPoolExecutor(max_workers=max(dashboard.CHART_WORKERS, CONCURRENT_WORKERS)) as pool:
+        for page, page_charts in dashboard.default_charts(data).items():
+            builds = [partial(dashboard.build_chart, create_chart, *args) for create_chart, _, _, args in page_charts]
+            record(f'page_charts/{page}/serial', time_call(lambda: [build() for build in builds], repeat))
+            record(f'page_charts/{page}/concurrent', time_call(
+                lambda: [future.result() for future in [pool.submit(build) for build in builds]], repeat
+            ))
+            speedup = (statistics.median(results[f'page_charts/{page}/serial'])
+                       / statistics.median(results[f'page_charts/{page}/concurrent']))
+            print(f"   {f'page_charts/{page}/speedup':<48}{speedup:>10.2f} x")
+    return results
+
+
+def benchmark_pages(repeat):
+    """Time a cold (all caches cleared) and a warm rerun of every dashboard page"""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for page in PAGES:
+        app = AppTest.from_file(DASHBOARD_PATH, default_timeout=PAGE_TIMEOUT_S)
+        app.run()
+        app.sidebar.radio[0].set_value(page).run()
+
+        def rerun(clear):
+            if clear:
+                st.cache_data.clear()
+                st.cache_resource.clear()
+            start = time.perf_counter()
+            app.run()
+            elapsed = time.perf_counter() - start
+            if app.exception:
+                raise RuntimeError(f"{page} page failed: {app.exception[0].value}")
+            return elapsed
+
+        for mode, clear in [('cold', True), ('warm', False)]:
+            timings = [rerun(clear) for _ in range(repeat)]
+            results[f'page/{page}/{mode}'] = timings
+            print(f"   {f'page/{page}/{mode}':<48}{statistics.median(timings) * 1000:>10.1f} ms")
+    return results
+
+
+def summarize(timings):
+    return {
+        'median_s': statistics.median(timings),
+        'min_s': min(timings),
+        'runs': timings,
+    }
+
+
+def run_benchmarks(scales, repeat):
+    """Run every stage at every scale and return the results document"""
+    import phone_addiction_dashboard as dashboard
+
+    document = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'scales': {},
+        'results': {},
+    }
+    for scale in scales:
+        workspace = os.path.join(WORKSPACE_DIR, f'scale-{scale}')
+        write_scaled_sources(workspace, scale)
+        print(f"\nScale {scale}x ({workspace})")
+        with working_directory(workspace):
+            timings = benchmark_stages(dashboard, repeat)
+            timings.update(benchmark_pages(repeat))
+            document['scales'][str(scale)] = {
+                name: data_cache.read_table(name, columns=[]).num_rows for name in data_cache.DATASETS
+            }
+        for stage, runs in timings.items():
+            document['results'][f'scale-{scale}/{stage}'] = summarize(runs)
+    return document
+
+
+def compare(results, baseline, threshold):
+    """Print current vs baseline medians and return the regressed stage names"""
+    regressions = []
+    print(f"\n{'stage':<64}{'baseline':>10}{'current':>10}{'change':>9}")
+    for stage, current in results['results'].items():
+        previous = baseline['results'].get(stage)
+        if previous is None:
+            continue
+        before, after = previous['median_s'], current['median_s']
+        change = (after - before) / before if before else 0.0
+        regressed = after > before * (1 + threshold) and after - before > MIN_REGRESSION_S
+        flag = '  ✗' if regressed else ''
+        print(f"{stage:<64}{before * 1000:>8.1f}ms{after * 1000:>8.1f}ms{change:>+8.0%}{flag}")
+        if regressed:
+            regressions.append(stage)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard stages, charts and pages')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10],
+                        help='dataset scale factors (synthetic rows = bundled rows x k)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per stage')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='where to write the JSON results')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='stored baseline to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative slowdown of a stage median (0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store these results as the new baseline')
+    args = parser.parse_args()
+
+    if not args.save_baseline and not os.path.exists(args.baseline):
+        # Baselines are machine-specific, so none is shipped: record one here first
+        print(f"✗ No baseline at {args.baseline} (run with --save-baseline on this machine to create one)")
+        return 1
+
+    results = run_benchmarks(args.scales, args.repeat)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Results written to {args.output}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.output, args.baseline)
+        print(f"✓ Baseline saved to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n✗ {len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}")
+        return 1
+    print("\n✓ No regressions against the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
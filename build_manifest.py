@@ -0,0 +1,114 @@
+"""
+Build Manifest
+Fingerprints of chart inputs, parameters and code for incremental exports
+
+A chart's fingerprint combines a content hash of the data slice it is
+drawn from, its export parameters and the source of its builder's
+module together with every top-level repository module that module
+imports (directly or not), so edits to helpers, the job table's slice
+functions or module-level constants invalidate the chart too. Whole
+files are hashed, which trades precision for safety: any edit to a
+generator module or a helper it imports, even to a comment, re-renders
+every chart that module builds. The manifest (a JSON file next to the
+outputs) records the fingerprint of every chart that was exported
+successfully; a chart is only re-rendered when its fingerprint changes
+or an output is missing.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+import pandas as pd
+import plotly
+
+MANIFEST_NAME = '.build_manifest.json'
+
+
+def data_fingerprint(data):
+    """Content hash of a DataFrame or Series (values and index)"""
+    hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+    digest = hashlib.sha256(hashes.tobytes())
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+    return digest.hexdigest()
+
+
+def local_modules(module):
+    """module and every module it imports, directly or not, that lives in the same directory
+
+    Only files directly in that directory count, so packages installed under
+    it (an in-repo .venv or site-packages) never enter a fingerprint.
+    """
+    root = os.path.dirname(os.path.abspath(module.__file__))
+    found, stack = {}, [module]
+    while stack:
+        current = stack.pop()
+        if current.__name__ in found:
+            continue
+        found[current.__name__] = current
+        for value in list(vars(current).values()):
+            dependency = value if inspect.ismodule(value) else sys.modules.get(getattr(value, '__module__', None) or '')
+            path = getattr(dependency, '__file__', None)
+            if path and os.path.dirname(os.path.abspath(path)) == root and dependency.__name__ not in found:
+                stack.append(dependency)
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _module_fingerprint(name):
+    digest = hashlib.sha256()
+    # Keyed by file name, so a module hashes the same whether it runs as a script or is imported
+    for path in sorted(os.path.abspath(module.__file__) for module in local_modules(sys.modules[name]).values()):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def code_fingerprint(func):
+    """Hash of the source of func's module and of the repository modules it imports"""
+    return _module_fingerprint(func.__module__)
+
+
+def chart_fingerprint(data, params, builder):
+    """Combined fingerprint of a chart's data slice, parameters and builder code"""
+    parts = {
+        'data': data_fingerprint(data),
+        'params': params,
+        'code': code_fingerprint(builder),
+        'plotly': plotly.__version__,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class BuildManifest:
+    """Chart name -> fingerprint of its last successful export"""
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                self.entries = json.load(f)
+
+    def is_fresh(self, name, fingerprint, outputs):
+        """True when the recorded fingerprint matches and every output file exists"""
+        return (
+            self.entries.get(name) == fingerprint
+            and all(os.path.exists(os.path.join(self.output_dir, output)) for output in outputs)
+        )
+
+    def record(self, name, fingerprint):
+        self.entries[name] = fingerprint
+
+    def save(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,153 @@
+"""
+Columnar Data Cache
+Converts the raw CSV datasets into typed Parquet files and reads them back
+
+Each CSV is parsed once with an explicit Arrow schema and written to
+.data_cache/. Reads are column-projected, so callers only pay for the
+columns they ask for. The source file's size and modification time are
+stored in the Parquet metadata and the cache is rebuilt when they change.
+"""
+
+import os
+import pyarrow as pa
+# pyarrow.csv and pyarrow.parquet are imported where files are read or written, so
+# importing the schemas (as the dashboard does at startup) stays cheap (see import_profile.py)
+
+CACHE_DIR = '.data_cache'
+CSV_BLOCK_SIZE = 16 << 20
+FINGERPRINT_KEY = b'source_fingerprint'
+
+# Declared schemas for both datasets (column order matches the CSV headers)
+ADDICTION_SCHEMA = pa.schema([
+    ('Student_ID', pa.int64()),
+    ('Age', pa.int64()),
+    ('Gender', pa.string()),
+    ('Academic_Level', pa.string()),
+    ('Country', pa.string()),
+    ('Avg_Daily_Usage_Hours', pa.float64()),
+    ('Most_Used_Platform', pa.string()),
+    ('Affects_Academic_Performance', pa.string()),
+    ('Sleep_Hours_Per_Night', pa.float64()),
+    ('Mental_Health_Score', pa.int64()),
+    ('Relationship_Status', pa.string()),
+    ('Conflicts_Over_Social_Media', pa.int64()),
+    ('Addicted_Score', pa.int64()),
+])
+
+SCREENTIME_SCHEMA = pa.schema(
+    [
+        ('user_id', pa.int64()),
+        ('date', pa.timestamp('ns')),
+        ('app_name', pa.string()),
+        ('category', pa.string()),
+        ('screen_time_min', pa.float64()),
+        ('launches', pa.int64()),
+        ('interactions', pa.int64()),
+        ('is_productive', pa.bool_()),
+        ('youtube_views', pa.float64()),
+        ('youtube_likes', pa.float64()),
+        ('youtube_comments', pa.float64()),
+    ]
+    + [(f'extra_col_{i}', pa.float64()) for i in range(11, 24)]
+)
+
+# Event columns of the screen-time log (excludes the youtube_* and extra_col_* tail)
+SCREENTIME_EVENT_COLUMNS = SCREENTIME_SCHEMA.names[:8]
+EVENT_SCHEMA = pa.schema([SCREENTIME_SCHEMA.field(col) for col in SCREENTIME_EVENT_COLUMNS])
+
+DATASETS = {
+    'addiction': {
+        'source': 'Students_Social_Media_Addiction.csv',
+        'schema': ADDICTION_SCHEMA,
+    },
+    'screentime': {
+        'source': 'screen_time_app_usage_dataset.csv',
+        'schema': SCREENTIME_SCHEMA,
+    },
+}
+
+
+def source_fingerprint(path):
+    """Return a cheap fingerprint (size and mtime) of a source file"""
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def dataset_version(name):
+    """Return the fingerprint of a dataset's source file"""
+    return source_fingerprint(DATASETS[name]['source'])
+
+
+def cache_path(name):
+    """Return the Parquet cache path for a dataset"""
+    return os.path.join(CACHE_DIR, f'{name}.parquet')
+
+
+def _cached_fingerprint(path):
+    """Read the source fingerprint stored in a Parquet file, if any"""
+    if not os.path.exists(path):
+        return None
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(path).metadata or {}
+    value = metadata.get(FINGERPRINT_KEY)
+    return value.decode() if value is not None else None
+
+
+def open_csv(path, schema, block_size=CSV_BLOCK_SIZE):
+    """Open a streaming reader over a CSV file with a declared schema"""
+    import pyarrow.csv as pa_csv
+
+    return pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=schema,
+            include_columns=schema.names
+        )
+    )
+
+
+def build_cache(name):
+    """Parse a dataset's CSV with its declared schema and write it to Parquet
+
+    The CSV is streamed block by block, so memory use does not depend on
+    the size of the source file.
+    """
+    import pyarrow.parquet as pq
+
+    spec = DATASETS[name]
+    schema = spec['schema'].with_metadata({
+        FINGERPRINT_KEY: source_fingerprint(spec['source']).encode()
+    })
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = cache_path(name)
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for batch in open_csv(spec['source'], spec['schema']):
+            writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+    os.replace(tmp_path, path)
+    return path
+
+
+def ensure_cache(name):
+    """Return the Parquet path for a dataset, rebuilding it if the source changed"""
+    path = cache_path(name)
+    fingerprint = dataset_version(name)
+    if _cached_fingerprint(path) != fingerprint:
+        build_cache(name)
+    return path
+
+
+def read_table(name, columns=None):
+    """Read a dataset from the cache as an Arrow table, projecting columns"""
+    import pyarrow.parquet as pq
+
+    return pq.read_table(ensure_cache(name), columns=columns)
+
+
+def read_dataset(name, columns=None):
+    """Read a dataset from the cache as a pandas DataFrame, projecting columns"""
+    return read_table(name, columns).to_pandas()
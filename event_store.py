@@ -0,0 +1,190 @@
+"""
+Screen-Time Event Store
+Append-only on-disk store for new screen-time rows with live aggregates
+
+The bundled CSV (read through data_cache) is the base snapshot. New
+events are appended as Parquet segments and only the appended rows are
+aggregated, so ingest cost is proportional to the batch size: each
+segment's partial ScreenTimeAggregates is pickled next to it and merged
+into the live aggregates by key. The large aggregates file (base plus
+the segments compacted into it) is only rewritten once COMPACT_SEGMENTS
+partials have accumulated; readers combine it with the newer partials.
+The small state file (segment list) is replaced atomically after each
+append; a single writer process is assumed.
+
+Usage:
+    python event_store.py new_events.csv    # append a batch of events
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+
+import chunked_aggregation
+import data_cache
+import frame_layout
+from data_cache import EVENT_SCHEMA
+from screentime_aggregates import ScreenTimeAggregates
+from time_index import TimeIndex
+
+STORE_DIR = '.event_store'
+# Bumped whenever the pickled aggregates change shape; older states are rebuilt
+STATE_FORMAT = 6
+# Partial aggregates folded into the aggregates file at a time
+COMPACT_SEGMENTS = 64
+
+
+def _write_pickle(obj, path):
+    """Pickle obj to path atomically"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    pd.to_pickle(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+class ScreenTimeStore:
+    """Base snapshot + appended Parquet segments + incrementally merged aggregates"""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self.state_path = os.path.join(root, 'state.pkl')
+        self.aggregates_path = os.path.join(root, 'aggregates.pkl')
+        self.segments = []
+        self.base_version = None
+        self.aggregates = None
+        # Segments folded into the aggregates file
+        self.compacted = 0
+        self._state_mtime = None
+        self._time_index = None
+
+    def version(self):
+        """Identifier that changes whenever the base or the segment list changes"""
+        return f"{self.base_version}+{len(self.segments)}"
+
+    def stale(self):
+        """Whether refresh() would load new state or rebuild (two file stats, no reads)"""
+        if self.aggregates is None or self.base_version != data_cache.dataset_version('screentime'):
+            return True
+        mtime = os.stat(self.state_path).st_mtime_ns if os.path.exists(self.state_path) else None
+        return mtime is not None and mtime != self._state_mtime
+
+    def refresh(self):
+        """Load the persisted state, rebuilding it if the base snapshot or state format changed"""
+        base_version = data_cache.dataset_version('screentime')
+        mtime = os.stat(self.state_path).st_mtime_ns if os.path.exists(self.state_path) else None
+
+        if mtime is not None and mtime != self._state_mtime:
+            state = pd.read_pickle(self.state_path)
+            self._state_mtime = mtime
+            if state.get('format') == STATE_FORMAT:
+                self._load(state)
+            else:
+                # Aggregates stored in an older format are recomputed from the segments
+                self.base_version, self.segments, self.aggregates = state['base_version'], state['segments'], None
+
+        if self.aggregates is None or self.base_version != base_version:
+            self._rebuild(base_version)
+        return self.aggregates
+
+    def _load(self, state):
+        """Bring the live aggregates up to a newer state, reading only what changed"""
+        if (self.aggregates is None or state['compacted'] != self.compacted
+                or state['base_version'] != self.base_version
+                or state['segments'][:len(self.segments)] != self.segments):
+            # The file records how many segments it covers, in case it is newer than the state
+            compacted = pd.read_pickle(self.aggregates_path)
+            self.aggregates, merged = compacted['aggregates'], compacted['segments']
+        else:
+            merged = len(self.segments)
+        for segment in state['segments'][merged:]:
+            self.aggregates = self.aggregates.merge(pd.read_pickle(self._partial_path(segment)))
+        self.base_version, self.segments, self.compacted = (
+            state['base_version'], state['segments'], state['compacted'])
+
+    def _rebuild(self, base_version):
+        """Recompute the aggregates from the base snapshot and every segment (chunked)"""
+        paths = [data_cache.ensure_cache('screentime')]
+        paths += [os.path.join(self.root, segment) for segment in self.segments]
+        self.base_version = base_version
+        self.aggregates = chunked_aggregation.aggregate_files(paths)
+        self._compact()
+        self._save()
+
+    def _compact(self):
+        """Write the live aggregates as the aggregates file, covering every segment"""
+        os.makedirs(self.root, exist_ok=True)
+        _write_pickle({'segments': len(self.segments), 'aggregates': self.aggregates}, self.aggregates_path)
+        self.compacted = len(self.segments)
+
+    def _save(self):
+        os.makedirs(self.root, exist_ok=True)
+        _write_pickle({
+            'format': STATE_FORMAT,
+            'base_version': self.base_version,
+            'segments': self.segments,
+            'compacted': self.compacted,
+        }, self.state_path)
+        self._state_mtime = os.stat(self.state_path).st_mtime_ns
+
+    def _partial_path(self, segment):
+        return os.path.join(self.root, segment.replace('.parquet', '.aggregates.pkl'))
+
+    def _read_segment(self, segment, columns=None):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(os.path.join(self.root, segment), columns=columns).to_pandas()
+
+    def append(self, df):
+        """Append a batch of events and merge its aggregates into the store"""
+        import pyarrow.parquet as pq
+
+        missing = [col for col in EVENT_SCHEMA.names if col not in df.columns]
+        if missing:
+            raise ValueError(f"Missing screen-time columns: {', '.join(missing)}")
+
+        self.refresh()
+        batch = df[EVENT_SCHEMA.names].copy()
+        batch['date'] = pd.to_datetime(batch['date'])
+        if batch['is_productive'].dtype != bool:
+            batch['is_productive'] = frame_layout.parse_booleans(batch['is_productive'])
+        # Segments are stored in time order so the time index rarely needs a full sort
+        batch = batch.sort_values('date', kind='stable')
+        table = pa.Table.from_pandas(batch, schema=EVENT_SCHEMA, preserve_index=False)
+
+        # The segment and its partial aggregates are written before the state that
+        # lists them, so a crash in between leaves unreferenced files, not a corrupt store
+        os.makedirs(self.root, exist_ok=True)
+        segment = f'segment-{len(self.segments) + 1:06d}.parquet'
+        pq.write_table(table, os.path.join(self.root, segment))
+        partial = ScreenTimeAggregates.from_frame(table.to_pandas())
+        _write_pickle(partial, self._partial_path(segment))
+
+        self.aggregates = self.aggregates.merge(partial)
+        self.segments = self.segments + [segment]
+        if len(self.segments) - self.compacted >= COMPACT_SEGMENTS:
+            self._compact()
+        self._save()
+        return len(batch)
+
+    def read_events(self, columns=None):
+        """Return the base snapshot plus every appended segment as one frame"""
+        self.refresh()
+        frames = [data_cache.read_dataset('screentime', columns or data_cache.SCREENTIME_EVENT_COLUMNS)]
+        frames += [self._read_segment(segment, columns) for segment in self.segments]
+        return pd.concat(frames, ignore_index=True)
+
+    def time_index(self):
+        """Return the events sorted by timestamp for time slicing (rebuilt when the version changes)"""
+        self.refresh()
+        if self._time_index is None or self._time_index[0] != self.version():
+            events = frame_layout.compact_screentime_frame(self.read_events())
+            self._time_index = (self.version(), TimeIndex(events))
+        return self._time_index[1]
+
+
+if __name__ == '__main__':
+    store = ScreenTimeStore()
+    for path in sys.argv[1:]:
+        rows = store.append(pd.read_csv(path))
+        print(f"✓ Appended {rows:,} events from {path} (store version {store.version()})")
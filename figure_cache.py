@@ -0,0 +1,106 @@
+"""
+Figure Cache
+Process-wide LRU cache of built Plotly figures
+
+Figures are keyed by chart identity, a canonical form of the filter
+state the chart depends on and the dataset version, so every session
+asking for the same view shares one build. Memory is bounded by the
+serialized size of the cached figures. Cached figures are shared and
+must be treated as read-only.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import plotly.io as pio
+
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def _canonical(value):
+    """Normalize a filter value so equal states produce equal keys"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def canonical_key(filter_state):
+    """Return a hashable, order-independent key for a dict of filters"""
+    return tuple(sorted((name, _canonical(value)) for name, value in filter_state.items()))
+
+
+def figure_size(fig):
+    """Approximate memory footprint of a figure (its JSON size in bytes)"""
+    return len(pio.to_json(fig, validate=False))
+
+
+class FigureCache:
+    """Thread-safe LRU figure cache bounded by total figure size"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return a cached figure (marking it recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, fig):
+        """Insert a figure, evicting least recently used entries over budget; returns its size"""
+        size = figure_size(fig)
+        if size > self.max_bytes:
+            return size
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (fig, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return size
+
+    def get_or_build(self, key, build):
+        """Return the cached figure for key, building and caching it on a miss"""
+        fig = self.get(key)
+        if fig is None:
+            fig = build()
+            self.put(key, fig)
+        return fig
+
+    def size(self, key):
+        """Serialized size of a cached figure in bytes, or None when not cached"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[1]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
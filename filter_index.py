@@ -0,0 +1,90 @@
+"""
+Bitmap Filter Index
+Precomputed row selections for the dashboard's sidebar filters
+
+Categorical filters are answered from one packed bitset per distinct
+value, range filters from a sorted copy of the column and its argsort.
+Any combination of filters resolves to an array of row positions, so
+applying a filter never copies the full frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class FilterIndex:
+    """Per-value bitsets for equality filters and sorted indexes for range filters"""
+
+    def __init__(self, df, equality_columns=(), range_columns=()):
+        self.n_rows = len(df)
+        self.bitsets = {}
+        self.sorted_values = {}
+        self.sorted_positions = {}
+
+        for col in equality_columns:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            self.bitsets[col] = {
+                value: np.packbits(codes == code)
+                for code, value in enumerate(uniques)
+            }
+
+        for col in range_columns:
+            values = df[col].to_numpy()
+            order = np.argsort(values, kind='stable')
+            self.sorted_positions[col] = order
+            self.sorted_values[col] = values[order]
+
+    def values(self, col):
+        """Return the sorted distinct values of an equality column"""
+        return list(self.bitsets[col])
+
+    def value_range(self, col):
+        """Return the (min, max) of a range column"""
+        values = self.sorted_values[col]
+        return values[0], values[-1]
+
+    def _range_bitset(self, col, low, high):
+        """Return a packed bitset for rows with low <= col <= high, or None for all rows"""
+        values = self.sorted_values[col]
+        start = np.searchsorted(values, low, side='left')
+        stop = np.searchsorted(values, high, side='right')
+        if start == 0 and stop == self.n_rows:
+            return None
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.sorted_positions[col][start:stop]] = True
+        return np.packbits(mask)
+
+    def select(self, equals=None, ranges=None):
+        """Resolve a filter combination to row positions
+
+        equals maps column -> value and ranges maps column -> (low, high);
+        entries whose value is None are ignored. Returns None when every
+        row matches, otherwise a sorted int array of matching positions.
+        """
+        selection = None
+        for col, value in (equals or {}).items():
+            if value is None:
+                continue
+            bits = self.bitsets[col].get(value)
+            if bits is None:
+                return np.empty(0, dtype=np.intp)
+            selection = bits if selection is None else selection & bits
+
+        for col, bounds in (ranges or {}).items():
+            if bounds is None:
+                continue
+            bits = self._range_bitset(col, *bounds)
+            if bits is None:
+                continue
+            selection = bits if selection is None else selection & bits
+
+        if selection is None:
+            return None
+        return np.flatnonzero(np.unpackbits(selection, count=self.n_rows))
+
+    def apply(self, df, equals=None, ranges=None):
+        """Return the rows of df matching the filters (df itself if all match)"""
+        rows = self.select(equals, ranges)
+        if rows is None:
+            return df
+        return df.iloc[rows]
@@ -0,0 +1,109 @@
+"""
+Compact Frame Layout
+Dictionary-encoded categoricals and downcast numerics for both datasets
+
+Usage:
+    python frame_layout.py    # print the per-column memory report
+"""
+
+import pandas as pd
+
+# Low-cardinality string columns stored as pandas categoricals
+ADDICTION_CATEGORICALS = [
+    'Gender', 'Academic_Level', 'Country', 'Most_Used_Platform',
+    'Affects_Academic_Performance', 'Relationship_Status'
+]
+SCREENTIME_CATEGORICALS = ['app_name', 'category']
+
+# Columns stored as a real bool dtype
+SCREENTIME_BOOLEANS = ['is_productive']
+
+
+def parse_booleans(series):
+    """A bool series from True/False values or their 'True'/'False' spellings
+
+    Textual flags are mapped explicitly ('False' would be truthy otherwise).
+    """
+    return series.map({True: True, False: False, 'True': True, 'False': False}).astype(bool)
+
+
+def compact_frame(df, categorical_columns=(), boolean_columns=()):
+    """Convert a frame to the compact layout in place and return it
+
+    Strings become categoricals, integers are downcast to the smallest
+    type their value range allows (int8/int16/...) and floats to float32.
+    Columns that are missing from the frame are skipped.
+    """
+    for col in categorical_columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
+    for col in boolean_columns:
+        if col in df.columns and df[col].dtype != bool:
+            df[col] = parse_booleans(df[col])
+
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+
+    for col in df.select_dtypes(include='floating').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+
+    return df
+
+
+def observed_categories(df):
+    """A frame whose categorical columns keep only the levels present in its rows
+
+    Filtered frames keep every level of the full dataset; plotly express
+    builds one group per level and fails on levels without rows.
+    """
+    unused = [col for col in df.columns
+              if isinstance(df[col].dtype, pd.CategoricalDtype)
+              and len(df[col].cat.categories) > df[col].nunique(dropna=True)]
+    if not unused:
+        return df
+    return df.assign(**{col: df[col].cat.remove_unused_categories() for col in unused})
+
+
+def compact_addiction_frame(df):
+    """Apply the compact layout to the addiction dataset"""
+    return compact_frame(df, ADDICTION_CATEGORICALS)
+
+
+def compact_screentime_frame(df):
+    """Apply the compact layout to the screen-time dataset"""
+    return compact_frame(df, SCREENTIME_CATEGORICALS, SCREENTIME_BOOLEANS)
+
+
+def memory_report(df):
+    """Return per-column dtype and deep memory usage (bytes) of a frame"""
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes': usage
+    })
+    report.loc['TOTAL'] = ['', usage.sum()]
+    return report
+
+
+def compare_layouts(df, compact):
+    """Return a side-by-side memory report of the original and compact layouts"""
+    before = memory_report(df)
+    after = memory_report(compact)
+    report = before.join(after, lsuffix='_before', rsuffix='_after')
+    report['saved_pct'] = (1 - report['bytes_after'] / report['bytes_before']) * 100
+    return report.round({'saved_pct': 1})
+
+
+if __name__ == '__main__':
+    import data_cache
+
+    datasets = [
+        ('addiction', None, compact_addiction_frame),
+        ('screentime', data_cache.SCREENTIME_EVENT_COLUMNS, compact_screentime_frame),
+    ]
+    for name, columns, compact in datasets:
+        df = data_cache.read_dataset(name, columns)
+        print(f"\n{name}")
+        print("=" * 60)
+        print(compare_layouts(df, compact(df.copy())).to_string())
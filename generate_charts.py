@@ -3,387 +3,586 @@ Standalone Chart Generation Script
 Creates individual visualizations that can be used in presentations or reports
 
 This script generates all charts as separate image files that can be
-inserted into PowerPoint presentations or other documents.
+inserted into PowerPoint presentations or other documents. Charts are
+exported concurrently by a pool of worker processes; a chart that fails
+is reported without aborting the rest of the batch.
+
+Only charts whose input data slice, export parameters or builder code
+changed since the last export are re-rendered (see build_manifest.py).
+
+Usage:
+    python generate_charts.py [--workers N] [--force]
 """
 
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import os
 
-# Create output directory for charts
-os.makedirs('charts_output', exist_ok=True)
+import chunked_aggregation
+import data_cache
+from build_manifest import BuildManifest, chart_fingerprint
+from moments import Moments
+
+OUTPUT_DIR = 'charts_output'
+EXPORT_PARAMS = {'scale': 2, 'formats': ['png', 'html']}
 
-# Load datasets
-print("Loading datasets...")
-df_addiction = pd.read_csv('Students_Social_Media_Addiction.csv')
-df_screentime = pd.read_csv('screen_time_app_usage_dataset.csv')
 
-# Preprocess
-df_addiction['Addiction_Category'] = pd.cut(
-    df_addiction['Addicted_Score'], 
-    bins=[0, 3, 6, 9], 
-    labels=['Low', 'Moderate', 'High']
-)
+def load_inputs():
+    """Load and preprocess the datasets the charts are built from"""
+    df_addiction = data_cache.read_dataset('addiction')
+    df_addiction['Addiction_Category'] = pd.cut(
+        df_addiction['Addicted_Score'], 
+        bins=[0, 3, 6, 9], 
+        labels=['Low', 'Moderate', 'High']
+    )
+    
+    # Screen-time data is aggregated chunk by chunk, so it never has to fit in memory
+    screentime = chunked_aggregation.aggregate_dataset()
+    
+    return {'addiction': df_addiction, 'screentime': screentime}
 
-print("Generating charts...")
 
 # Chart 1: Platform Distribution
-print("1. Creating platform distribution chart...")
-platform_counts = df_addiction['Most_Used_Platform'].value_counts().head(10)
-fig = go.Figure(data=[
-    go.Bar(
-        y=platform_counts.index,
-        x=platform_counts.values,
-        orientation='h',
-        marker=dict(color=platform_counts.values, colorscale='Viridis'),
-        text=platform_counts.values,
-        textposition='outside'
+def build_platform_distribution(df_addiction):
+    """Create platform usage distribution chart"""
+    platform_counts = df_addiction['Most_Used_Platform'].value_counts().head(10)
+    fig = go.Figure(data=[
+        go.Bar(
+            y=platform_counts.index,
+            x=platform_counts.values,
+            orientation='h',
+            marker=dict(color=platform_counts.values, colorscale='Viridis'),
+            text=platform_counts.values,
+            textposition='outside'
+        )
+    ])
+    fig.update_layout(
+        title='Top 10 Most Used Social Media Platforms',
+        xaxis_title='Number of Users',
+        yaxis_title='Platform',
+        height=600,
+        width=1200,
+        template='plotly_white',
+        font=dict(size=14)
     )
-])
-fig.update_layout(
-    title='Top 10 Most Used Social Media Platforms',
-    xaxis_title='Number of Users',
-    yaxis_title='Platform',
-    height=600,
-    width=1200,
-    template='plotly_white',
-    font=dict(size=14)
-)
-fig.write_image('charts_output/1_platform_distribution.png', scale=2)
-fig.write_html('charts_output/1_platform_distribution.html')
-print("   ✓ Saved: 1_platform_distribution.png/html")
+    return fig
+
 
 # Chart 2: Usage vs Addiction Scatter Plot
-print("2. Creating usage vs addiction correlation chart...")
-# Add jitter to reduce overlap
-df_plot = df_addiction.copy()
-np.random.seed(42)
-df_plot['Addicted_Score_Jitter'] = df_plot['Addicted_Score'] + np.random.normal(0, 0.15, len(df_plot))
-df_plot['Usage_Jitter'] = df_plot['Avg_Daily_Usage_Hours'] + np.random.normal(0, 0.1, len(df_plot))
-
-fig = px.scatter(
-    df_plot,
-    x='Usage_Jitter',
-    y='Addicted_Score_Jitter',
-    color='Most_Used_Platform',
-    hover_data=['Age', 'Gender', 'Sleep_Hours_Per_Night', 'Avg_Daily_Usage_Hours', 'Addicted_Score'],
-    title='Daily Usage Hours vs. Addiction Score by Platform (r = 0.87)',
-    labels={
-        'Usage_Jitter': 'Average Daily Usage (Hours)',
-        'Addicted_Score_Jitter': 'Addiction Score (0-9)'
-    },
-    height=600,
-    width=1200,
-    opacity=0.6
-)
-
-# Add trendline
-from scipy import stats as sp_stats
-slope, intercept, r_value, p_value, std_err = sp_stats.linregress(
-    df_addiction['Avg_Daily_Usage_Hours'], 
-    df_addiction['Addicted_Score']
-)
-x_trend = np.linspace(df_addiction['Avg_Daily_Usage_Hours'].min(), 
-                      df_addiction['Avg_Daily_Usage_Hours'].max(), 100)
-y_trend = slope * x_trend + intercept
-
-fig.add_trace(
-    go.Scatter(
-        x=x_trend,
-        y=y_trend,
-        mode='lines',
-        name=f'Trendline (r={r_value:.2f})',
-        line=dict(color='red', width=3, dash='dash')
+def build_usage_addiction_correlation(df_addiction):
+    """Create usage vs addiction scatter plot with trendline"""
+    # Add jitter to reduce overlap
+    df_plot = df_addiction.copy()
+    np.random.seed(42)
+    df_plot['Addicted_Score_Jitter'] = df_plot['Addicted_Score'] + np.random.normal(0, 0.15, len(df_plot))
+    df_plot['Usage_Jitter'] = df_plot['Avg_Daily_Usage_Hours'] + np.random.normal(0, 0.1, len(df_plot))
+
+    fig = px.scatter(
+        df_plot,
+        x='Usage_Jitter',
+        y='Addicted_Score_Jitter',
+        color='Most_Used_Platform',
+        hover_data=['Age', 'Gender', 'Sleep_Hours_Per_Night', 'Avg_Daily_Usage_Hours', 'Addicted_Score'],
+        title='Daily Usage Hours vs. Addiction Score by Platform (r = 0.87)',
+        labels={
+            'Usage_Jitter': 'Average Daily Usage (Hours)',
+            'Addicted_Score_Jitter': 'Addiction Score (0-9)'
+        },
+        height=600,
+        width=1200,
+        opacity=0.6
+    )
+
+    # Add trendline
+    slope, intercept, r_value = Moments.from_frame(
+        df_addiction, ['Avg_Daily_Usage_Hours', 'Addicted_Score']
+    ).linregress('Avg_Daily_Usage_Hours', 'Addicted_Score')
+    x_trend = np.linspace(df_addiction['Avg_Daily_Usage_Hours'].min(), 
+                          df_addiction['Avg_Daily_Usage_Hours'].max(), 100)
+    y_trend = slope * x_trend + intercept
+
+    fig.add_trace(
+        go.Scatter(
+            x=x_trend,
+            y=y_trend,
+            mode='lines',
+            name=f'Trendline (r={r_value:.2f})',
+            line=dict(color='red', width=3, dash='dash')
+        )
     )
-)
 
-fig.update_traces(marker=dict(size=8, line=dict(width=0.5, color='white')), selector=dict(mode='markers'))
-fig.update_layout(template='plotly_white', font=dict(size=14))
-fig.write_image('charts_output/2_usage_addiction_correlation.png', scale=2)
-fig.write_html('charts_output/2_usage_addiction_correlation.html')
-print("   ✓ Saved: 2_usage_addiction_correlation.png/html")
+    fig.update_traces(marker=dict(size=8, line=dict(width=0.5, color='white')), selector=dict(mode='markers'))
+    fig.update_layout(template='plotly_white', font=dict(size=14))
+    return fig
+
 
 # Chart 3: Mental Health Impact
-print("3. Creating mental health impact chart...")
-health_impact = df_addiction.groupby('Addiction_Category').agg({
-    'Mental_Health_Score': 'mean',
-    'Sleep_Hours_Per_Night': 'mean'
-}).round(2).reset_index()
-
-fig = make_subplots(
-    rows=1, cols=2,
-    subplot_titles=('Mental Health Score (0-10)', 'Sleep Hours Per Night'),
-    specs=[[{"type": "bar"}, {"type": "bar"}]]
-)
-
-# Mental Health Score
-fig.add_trace(
-    go.Bar(
-        x=health_impact['Addiction_Category'],
-        y=health_impact['Mental_Health_Score'],
-        name='Mental Health',
-        marker_color=['#00CC96', '#FFA15A', '#EF553B'],
-        text=health_impact['Mental_Health_Score'],
-        textposition='outside',
-        texttemplate='%{text:.2f}',
-        showlegend=False
-    ),
-    row=1, col=1
-)
-
-# Sleep Hours
-fig.add_trace(
-    go.Bar(
-        x=health_impact['Addiction_Category'],
-        y=health_impact['Sleep_Hours_Per_Night'],
-        name='Sleep Hours',
-        marker_color=['#00CC96', '#FFA15A', '#EF553B'],
-        text=health_impact['Sleep_Hours_Per_Night'],
-        textposition='outside',
-        texttemplate='%{text:.2f}',
-        showlegend=False
-    ),
-    row=1, col=2
-)
-
-# Add reference lines
-fig.add_hline(y=7, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=1)
-fig.add_hline(y=7, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=2)
-
-fig.update_layout(
-    title='Mental Health & Sleep Impact by Addiction Level',
-    template='plotly_white',
-    height=600,
-    width=1200,
-    showlegend=False,
-    font=dict(size=14)
-)
-fig.update_xaxes(title_text='Addiction Category', row=1, col=1)
-fig.update_xaxes(title_text='Addiction Category', row=1, col=2)
-fig.update_yaxes(title_text='Score', range=[0, 10], row=1, col=1)
-fig.update_yaxes(title_text='Hours', range=[0, 9], row=1, col=2)
-
-fig.write_image('charts_output/3_mental_health_impact.png', scale=2)
-fig.write_html('charts_output/3_mental_health_impact.html')
-print("   ✓ Saved: 3_mental_health_impact.png/html")
+def build_mental_health_impact(df_addiction):
+    """Create mental health and sleep impact chart"""
+    health_impact = df_addiction.groupby('Addiction_Category').agg({
+        'Mental_Health_Score': 'mean',
+        'Sleep_Hours_Per_Night': 'mean'
+    }).round(2).reset_index()
+
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Mental Health Score (0-10)', 'Sleep Hours Per Night'),
+        specs=[[{"type": "bar"}, {"type": "bar"}]]
+    )
 
-# Chart 4: App Category Distribution
-print("4. Creating category distribution chart...")
-df_screentime['date'] = pd.to_datetime(df_screentime['date'])
-category_data = df_screentime.groupby('category')['screen_time_min'].sum().reset_index()
-
-fig = go.Figure(data=[
-    go.Pie(
-        labels=category_data['category'],
-        values=category_data['screen_time_min'],
-        hole=0.4,
-        marker=dict(colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']),
-        textinfo='label+percent',
-        textposition='outside'
+    # Mental Health Score
+    fig.add_trace(
+        go.Bar(
+            x=health_impact['Addiction_Category'],
+            y=health_impact['Mental_Health_Score'],
+            name='Mental Health',
+            marker_color=['#00CC96', '#FFA15A', '#EF553B'],
+            text=health_impact['Mental_Health_Score'],
+            textposition='outside',
+            texttemplate='%{text:.2f}',
+            showlegend=False
+        ),
+        row=1, col=1
+    )
+
+    # Sleep Hours
+    fig.add_trace(
+        go.Bar(
+            x=health_impact['Addiction_Category'],
+            y=health_impact['Sleep_Hours_Per_Night'],
+            name='Sleep Hours',
+            marker_color=['#00CC96', '#FFA15A', '#EF553B'],
+            text=health_impact['Sleep_Hours_Per_Night'],
+            textposition='outside',
+            texttemplate='%{text:.2f}',
+            showlegend=False
+        ),
+        row=1, col=2
     )
-])
 
-fig.update_layout(
-    title='Screen Time Distribution by App Category',
-    height=600,
-    width=1200,
-    template='plotly_white',
-    font=dict(size=14)
-)
+    # Add reference lines
+    fig.add_hline(y=7, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=1)
+    fig.add_hline(y=7, line_dash="dash", line_color="gray", opacity=0.5, row=1, col=2)
+
+    fig.update_layout(
+        title='Mental Health & Sleep Impact by Addiction Level',
+        template='plotly_white',
+        height=600,
+        width=1200,
+        showlegend=False,
+        font=dict(size=14)
+    )
+    fig.update_xaxes(title_text='Addiction Category', row=1, col=1)
+    fig.update_xaxes(title_text='Addiction Category', row=1, col=2)
+    fig.update_yaxes(title_text='Score', range=[0, 10], row=1, col=1)
+    fig.update_yaxes(title_text='Hours', range=[0, 9], row=1, col=2)
+    return fig
+
+
+# Chart 4: App Category Distribution
+def build_category_distribution(screentime):
+    """Create app category time distribution"""
+    category_data = screentime.category_totals()
+
+    fig = go.Figure(data=[
+        go.Pie(
+            labels=category_data['category'],
+            values=category_data['screen_time_min'],
+            hole=0.4,
+            marker=dict(colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']),
+            textinfo='label+percent',
+            textposition='outside'
+        )
+    ])
+
+    fig.update_layout(
+        title='Screen Time Distribution by App Category',
+        height=600,
+        width=1200,
+        template='plotly_white',
+        font=dict(size=14)
+    )
+    return fig
 
-fig.write_image('charts_output/4_category_distribution.png', scale=2)
-fig.write_html('charts_output/4_category_distribution.html')
-print("   ✓ Saved: 4_category_distribution.png/html")
 
 # Chart 5: Academic Performance Impact
-print("5. Creating academic performance chart...")
-academic_impact = df_addiction.groupby('Affects_Academic_Performance').size().reset_index(name='Count')
-colors = ['#00CC96' if x == 'No' else '#EF553B' for x in academic_impact['Affects_Academic_Performance']]
-
-fig = go.Figure(data=[
-    go.Bar(
-        x=academic_impact['Affects_Academic_Performance'],
-        y=academic_impact['Count'],
-        marker_color=colors,
-        text=academic_impact['Count'],
-        textposition='outside'
+def build_academic_impact(df_addiction):
+    """Create academic performance impact chart"""
+    academic_impact = df_addiction.groupby('Affects_Academic_Performance').size().reset_index(name='Count')
+    colors = ['#00CC96' if x == 'No' else '#EF553B' for x in academic_impact['Affects_Academic_Performance']]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=academic_impact['Affects_Academic_Performance'],
+            y=academic_impact['Count'],
+            marker_color=colors,
+            text=academic_impact['Count'],
+            textposition='outside'
+        )
+    ])
+
+    fig.update_layout(
+        title='Academic Performance Impact',
+        xaxis_title='Affects Academic Performance',
+        yaxis_title='Number of Students',
+        height=500,
+        width=1000,
+        template='plotly_white',
+        font=dict(size=14)
     )
-])
-
-fig.update_layout(
-    title='Academic Performance Impact',
-    xaxis_title='Affects Academic Performance',
-    yaxis_title='Number of Students',
-    height=500,
-    width=1000,
-    template='plotly_white',
-    font=dict(size=14)
-)
-
-fig.write_image('charts_output/5_academic_impact.png', scale=2)
-fig.write_html('charts_output/5_academic_impact.html')
-print("   ✓ Saved: 5_academic_impact.png/html")
+    return fig
+
 
 # Chart 6: Gender Comparison
-print("6. Creating gender comparison chart...")
-gender_stats = df_addiction.groupby(['Gender', 'Addiction_Category']).size().reset_index(name='Count')
-
-fig = px.bar(
-    gender_stats,
-    x='Gender',
-    y='Count',
-    color='Addiction_Category',
-    barmode='group',
-    title='Addiction Levels by Gender',
-    color_discrete_map={
-        'Low': '#00CC96',
-        'Moderate': '#FFA15A',
-        'High': '#EF553B'
-    },
-    height=600,
-    width=1200
-)
-
-fig.update_layout(template='plotly_white', font=dict(size=14))
-fig.write_image('charts_output/6_gender_comparison.png', scale=2)
-fig.write_html('charts_output/6_gender_comparison.html')
-print("   ✓ Saved: 6_gender_comparison.png/html")
+def build_gender_comparison(df_addiction):
+    """Create addiction levels by gender chart"""
+    gender_stats = df_addiction.groupby(['Gender', 'Addiction_Category']).size().reset_index(name='Count')
+
+    fig = px.bar(
+        gender_stats,
+        x='Gender',
+        y='Count',
+        color='Addiction_Category',
+        barmode='group',
+        title='Addiction Levels by Gender',
+        color_discrete_map={
+            'Low': '#00CC96',
+            'Moderate': '#FFA15A',
+            'High': '#EF553B'
+        },
+        height=600,
+        width=1200
+    )
+
+    fig.update_layout(template='plotly_white', font=dict(size=14))
+    return fig
+
 
 # Chart 7: Top Apps by Screen Time
-print("7. Creating top apps chart...")
-top_apps = df_screentime.groupby('app_name')['screen_time_min'].sum().sort_values(ascending=False).head(15)
-
-fig = go.Figure(data=[
-    go.Bar(
-        x=top_apps.values,
-        y=top_apps.index,
-        orientation='h',
-        marker=dict(color=top_apps.values, colorscale='Blues'),
-        text=top_apps.values.round(0),
-        textposition='outside'
+def build_top_apps(screentime):
+    """Create top apps by screen time chart"""
+    top_apps = screentime.top_apps(15)
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=top_apps.values,
+            y=top_apps.index,
+            orientation='h',
+            marker=dict(color=top_apps.values, colorscale='Blues'),
+            text=top_apps.values.round(0),
+            textposition='outside'
+        )
+    ])
+
+    fig.update_layout(
+        title='Top 15 Apps by Total Screen Time',
+        xaxis_title='Total Screen Time (Minutes)',
+        yaxis_title='App Name',
+        height=700,
+        width=1200,
+        template='plotly_white',
+        font=dict(size=14)
     )
-])
-
-fig.update_layout(
-    title='Top 15 Apps by Total Screen Time',
-    xaxis_title='Total Screen Time (Minutes)',
-    yaxis_title='App Name',
-    height=700,
-    width=1200,
-    template='plotly_white',
-    font=dict(size=14)
-)
-
-fig.write_image('charts_output/7_top_apps.png', scale=2)
-fig.write_html('charts_output/7_top_apps.html')
-print("   ✓ Saved: 7_top_apps.png/html")
+    return fig
+
 
 # Chart 8: Correlation Matrix
-print("8. Creating correlation matrix...")
-numeric_cols = ['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 
-                'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score']
-correlation = df_addiction[numeric_cols].corr()
-
-fig = go.Figure(data=go.Heatmap(
-    z=correlation.values,
-    x=correlation.columns,
-    y=correlation.columns,
-    colorscale='RdBu',
-    zmid=0,
-    text=correlation.values.round(2),
-    texttemplate='%{text}',
-    textfont={"size": 12},
-    colorbar=dict(title="Correlation")
-))
-
-fig.update_layout(
-    title='Correlation Matrix of Key Metrics',
-    height=700,
-    width=1200,
-    template='plotly_white',
-    font=dict(size=14)
-)
-
-fig.write_image('charts_output/8_correlation_matrix.png', scale=2)
-fig.write_html('charts_output/8_correlation_matrix.html')
-print("   ✓ Saved: 8_correlation_matrix.png/html")
+def build_correlation_matrix(df_addiction):
+    """Create correlation heatmap for key metrics"""
+    numeric_cols = ['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 
+                    'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score']
+    correlation = Moments.from_frame(df_addiction, numeric_cols).correlation()
+
+    fig = go.Figure(data=go.Heatmap(
+        z=correlation.values,
+        x=correlation.columns,
+        y=correlation.columns,
+        colorscale='RdBu',
+        zmid=0,
+        text=correlation.values.round(2),
+        texttemplate='%{text}',
+        textfont={"size": 12},
+        colorbar=dict(title="Correlation")
+    ))
+
+    fig.update_layout(
+        title='Correlation Matrix of Key Metrics',
+        height=700,
+        width=1200,
+        template='plotly_white',
+        font=dict(size=14)
+    )
+    return fig
+
 
 # Chart 9: Hourly Usage Pattern
-print("9. Creating hourly usage pattern heatmap...")
-df_screentime['hour'] = df_screentime['date'].dt.hour
-hourly_usage = df_screentime.groupby(['hour', 'category'])['screen_time_min'].sum().reset_index()
-hourly_pivot = hourly_usage.pivot(index='hour', columns='category', values='screen_time_min').fillna(0)
-
-fig = go.Figure(data=go.Heatmap(
-    z=hourly_pivot.values,
-    x=hourly_pivot.columns,
-    y=hourly_pivot.index,
-    colorscale='YlOrRd',
-    text=hourly_pivot.values.round(0),
-    texttemplate='%{text}',
-    textfont={"size": 10},
-    colorbar=dict(title="Minutes")
-))
-
-fig.update_layout(
-    title='Hourly Usage Patterns by App Category',
-    xaxis_title='App Category',
-    yaxis_title='Hour of Day',
-    height=700,
-    width=1200,
-    template='plotly_white',
-    font=dict(size=14)
-)
-
-fig.write_image('charts_output/9_hourly_pattern.png', scale=2)
-fig.write_html('charts_output/9_hourly_pattern.html')
-print("   ✓ Saved: 9_hourly_pattern.png/html")
+def build_hourly_pattern(screentime):
+    """Create hourly usage pattern heatmap"""
+    hourly_pivot = screentime.hourly_pivot()
+
+    fig = go.Figure(data=go.Heatmap(
+        z=hourly_pivot.values,
+        x=hourly_pivot.columns,
+        y=hourly_pivot.index,
+        colorscale='YlOrRd',
+        text=hourly_pivot.values.round(0),
+        texttemplate='%{text}',
+        textfont={"size": 10},
+        colorbar=dict(title="Minutes")
+    ))
+
+    fig.update_layout(
+        title='Hourly Usage Patterns by App Category',
+        xaxis_title='App Category',
+        yaxis_title='Hour of Day',
+        height=700,
+        width=1200,
+        template='plotly_white',
+        font=dict(size=14)
+    )
+    return fig
+
 
 # Chart 10: Platform-Specific Stats Table
-print("10. Creating platform statistics table...")
-platform_stats = df_addiction.groupby('Most_Used_Platform').agg({
-    'Student_ID': 'count',
-    'Addicted_Score': 'mean',
-    'Avg_Daily_Usage_Hours': 'mean',
-    'Mental_Health_Score': 'mean',
-    'Sleep_Hours_Per_Night': 'mean'
-}).round(2).sort_values('Addicted_Score', ascending=False)
-
-platform_stats.columns = ['Users', 'Avg Addiction', 'Avg Hours/Day', 'Mental Health', 'Sleep Hours']
-
-fig = go.Figure(data=[go.Table(
-    header=dict(
-        values=['<b>Platform</b>'] + [f'<b>{col}</b>' for col in platform_stats.columns],
-        fill_color='paleturquoise',
-        align='left',
-        font=dict(size=14)
-    ),
-    cells=dict(
-        values=[platform_stats.index] + [platform_stats[col] for col in platform_stats.columns],
-        fill_color='lavender',
-        align='left',
-        font=dict(size=12)
+def build_platform_stats_table(df_addiction):
+    """Create platform-specific statistics table"""
+    platform_stats = df_addiction.groupby('Most_Used_Platform').agg({
+        'Student_ID': 'count',
+        'Addicted_Score': 'mean',
+        'Avg_Daily_Usage_Hours': 'mean',
+        'Mental_Health_Score': 'mean',
+        'Sleep_Hours_Per_Night': 'mean'
+    }).round(2).sort_values('Addicted_Score', ascending=False)
+
+    platform_stats.columns = ['Users', 'Avg Addiction', 'Avg Hours/Day', 'Mental Health', 'Sleep Hours']
+
+    fig = go.Figure(data=[go.Table(
+        header=dict(
+            values=['<b>Platform</b>'] + [f'<b>{col}</b>' for col in platform_stats.columns],
+            fill_color='paleturquoise',
+            align='left',
+            font=dict(size=14)
+        ),
+        cells=dict(
+            values=[platform_stats.index] + [platform_stats[col] for col in platform_stats.columns],
+            fill_color='lavender',
+            align='left',
+            font=dict(size=12)
+        )
+    )])
+
+    fig.update_layout(
+        title='Platform-Specific Addiction Metrics',
+        height=600,
+        width=1200,
+        template='plotly_white'
     )
-)])
-
-fig.update_layout(
-    title='Platform-Specific Addiction Metrics',
-    height=600,
-    width=1200,
-    template='plotly_white'
-)
-
-fig.write_image('charts_output/10_platform_stats_table.png', scale=2)
-fig.write_html('charts_output/10_platform_stats_table.html')
-print("   ✓ Saved: 10_platform_stats_table.png/html")
-
-print("\n" + "="*60)
-print("✓ All charts generated successfully!")
-print("="*60)
-print(f"\nCharts saved in 'charts_output' directory:")
-print("  - PNG files for PowerPoint (high resolution)")
-print("  - HTML files for interactive viewing")
-print("\nYou can now insert these images into your presentation!")
-print("\nTip: The HTML files can be opened in a browser for interactive exploration.")
+    return fig
+
+
+# Export jobs: output name -> (builder, input dataset, slice of the input the chart reads)
+CHART_JOBS = {
+    '1_platform_distribution': (
+        build_platform_distribution, 'addiction',
+        lambda df: df[['Most_Used_Platform']]
+    ),
+    '2_usage_addiction_correlation': (
+        build_usage_addiction_correlation, 'addiction',
+        lambda df: df[['Avg_Daily_Usage_Hours', 'Addicted_Score', 'Most_Used_Platform',
+                       'Age', 'Gender', 'Sleep_Hours_Per_Night']]
+    ),
+    '3_mental_health_impact': (
+        build_mental_health_impact, 'addiction',
+        lambda df: df[['Addiction_Category', 'Mental_Health_Score', 'Sleep_Hours_Per_Night']]
+    ),
+    '4_category_distribution': (
+        build_category_distribution, 'screentime',
+        lambda screentime: screentime.category_totals()
+    ),
+    '5_academic_impact': (
+        build_academic_impact, 'addiction',
+        lambda df: df[['Affects_Academic_Performance']]
+    ),
+    '6_gender_comparison': (
+        build_gender_comparison, 'addiction',
+        lambda df: df[['Gender', 'Addiction_Category']]
+    ),
+    '7_top_apps': (
+        build_top_apps, 'screentime',
+        lambda screentime: screentime.top_apps(15)
+    ),
+    '8_correlation_matrix': (
+        build_correlation_matrix, 'addiction',
+        lambda df: df[['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night',
+                       'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score']]
+    ),
+    '9_hourly_pattern': (
+        build_hourly_pattern, 'screentime',
+        lambda screentime: screentime.hourly_pivot()
+    ),
+    '10_platform_stats_table': (
+        build_platform_stats_table, 'addiction',
+        lambda df: df[['Most_Used_Platform', 'Student_ID', 'Addicted_Score', 'Avg_Daily_Usage_Hours',
+                       'Mental_Health_Score', 'Sleep_Hours_Per_Night']]
+    ),
+}
+
+# Inputs loaded once per worker process
+_inputs = {}
+
+
+def _init_worker():
+    """Load the chart inputs in a worker process (inherited when forked)"""
+    if not _inputs:
+        _inputs.update(load_inputs())
+
+
+def chart_outputs(name):
+    return [f'{name}.{fmt}' for fmt in EXPORT_PARAMS['formats']]
+
+
+def fingerprint_charts(inputs):
+    """Fingerprint every chart's input slice, export parameters and builder code"""
+    return {
+        name: chart_fingerprint(select(inputs[input_name]), EXPORT_PARAMS, builder)
+        for name, (builder, input_name, select) in CHART_JOBS.items()
+    }
+
+
+def _describe(exc):
+    """One-line description of an export error"""
+    lines = [line for line in str(exc).splitlines() if line.strip()]
+    return f"{type(exc).__name__}: {lines[0] if lines else ''}"
+
+
+def export_chart(name):
+    """Build one chart and write its PNG and HTML files
+
+    Never raises: failures are returned in the result so the batch continues.
+    """
+    builder, input_name, _ = CHART_JOBS[name]
+    timings = {}
+    step_start = time.perf_counter()
+    try:
+        fig = builder(_inputs[input_name])
+        timings['build'] = time.perf_counter() - step_start
+        
+        step_start = time.perf_counter()
+        fig.write_image(os.path.join(OUTPUT_DIR, f'{name}.png'), scale=EXPORT_PARAMS['scale'])
+        timings['png'] = time.perf_counter() - step_start
+        
+        step_start = time.perf_counter()
+        fig.write_html(os.path.join(OUTPUT_DIR, f'{name}.html'))
+        timings['html'] = time.perf_counter() - step_start
+        return {'name': name, 'ok': True, 'timings': timings}
+    except Exception as exc:
+        return {'name': name, 'ok': False, 'timings': timings, 'error': _describe(exc)}
+
+
+def run_exports(names, workers):
+    """Export charts across a process pool, printing progress as each finishes"""
+    results = []
+    
+    def report(result):
+        results.append(result)
+        elapsed = sum(result['timings'].values())
+        status = "✓" if result['ok'] else "✗"
+        print(f"   [{len(results)}/{len(names)}] {status} {result['name']} ({elapsed:.2f}s)")
+        if not result['ok']:
+            print(f"         {result['error']}")
+    
+    if workers <= 1:
+        _init_worker()
+        for name in names:
+            report(export_chart(name))
+        return results
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(export_chart, name): name for name in names}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as exc:
+                # A crashed worker only fails the chart it was rendering
+                result = {'name': futures[future], 'ok': False, 'timings': {}, 'error': _describe(exc)}
+            report(result)
+    return results
+
+
+def print_timings(results, wall_time):
+    """Print per-chart step timings and the speedup over a serial run"""
+    print("\nPer-chart timings (seconds)")
+    print(f"   {'chart':<32}{'build':>8}{'png':>8}{'html':>8}")
+    for result in sorted(results, key=lambda r: list(CHART_JOBS).index(r['name'])):
+        t = result['timings']
+        cells = ''.join(f"{t[step]:>8.2f}" if step in t else f"{'-':>8}" for step in ['build', 'png', 'html'])
+        print(f"   {result['name']:<32}{cells}")
+    
+    serial_time = sum(sum(r['timings'].values()) for r in results)
+    print(f"\nWall time: {wall_time:.2f}s (sum of chart times {serial_time:.2f}s, "
+          f"speedup {serial_time / wall_time if wall_time else 0:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export all presentation charts')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (1 renders in-process)')
+    parser.add_argument('--force', action='store_true',
+                        help='re-render every chart even if its inputs are unchanged')
+    args = parser.parse_args()
+    
+    # Create output directory for charts
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    # Load inputs once here; forked workers inherit them
+    print("Loading datasets...")
+    _inputs.update(load_inputs())
+    
+    manifest = BuildManifest(OUTPUT_DIR)
+    fingerprints = fingerprint_charts(_inputs)
+    names = [
+        name for name in CHART_JOBS
+        if args.force or not manifest.is_fresh(name, fingerprints[name], chart_outputs(name))
+    ]
+    skipped = len(CHART_JOBS) - len(names)
+    if skipped:
+        print(f"Skipping {skipped} up-to-date chart(s) (use --force to re-render)")
+    if not names:
+        print("\n✓ All charts are up to date.")
+        return 0
+    
+    print(f"Generating {len(names)} charts with {args.workers} worker(s)...")
+    start = time.perf_counter()
+    results = run_exports(names, min(args.workers, len(names)))
+    print_timings(results, time.perf_counter() - start)
+    
+    for result in results:
+        if result['ok']:
+            manifest.record(result['name'], fingerprints[result['name']])
+    manifest.save()
+    
+    failed = [r['name'] for r in results if not r['ok']]
+    if failed:
+        print(f"\n✗ {len(failed)} chart(s) failed: {', '.join(failed)}")
+        return 1
+    
+    print("\n" + "="*60)
+    print("✓ All charts generated successfully!")
+    print("="*60)
+    print(f"\nCharts saved in '{OUTPUT_DIR}' directory:")
+    print("  - PNG files for PowerPoint (high resolution)")
+    print("  - HTML files for interactive viewing")
+    print("\nYou can now insert these images into your presentation!")
+    print("\nTip: The HTML files can be opened in a browser for interactive exploration.")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+"""
+Heavy Hitters
+Bounded-memory weighted Space-Saving summaries for top-K app queries
+
+A SpaceSaving summary keeps at most `capacity` items with an upper bound
+on each item's total weight and the maximum overestimate of that bound,
+plus a floor: the largest weight any unlisted item can have. Batches are
+pre-aggregated and merged like any other summary (mergeable summaries,
+Agarwal et al.), so memory depends on the capacity, not on the length of
+the app catalogue. Every item heavier than total / capacity is listed,
+and entries are kept sorted, so top-K is a slice.
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CAPACITY = 256
+
+
+class SpaceSaving:
+    """Top items by total weight with per-item error bounds"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, counts=None, errors=None, floor=0.0, total=0.0):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='float64') if counts is None else counts
+        self.errors = pd.Series(dtype='float64') if errors is None else errors
+        self.floor = floor
+        self.total = total
+
+    @classmethod
+    def from_weights(cls, items, weights, capacity=DEFAULT_CAPACITY):
+        """Summarize a batch of (item, weight) pairs"""
+        sums = pd.Series(np.asarray(weights, dtype=np.float64)).groupby(np.asarray(items)).sum()
+        return cls._truncated(capacity, sums, pd.Series(0.0, index=sums.index), 0.0, float(sums.sum()))
+
+    @classmethod
+    def _truncated(cls, capacity, counts, errors, floor, total):
+        """Keep the capacity largest upper bounds; dropped items raise the floor"""
+        order = np.argsort(-counts.to_numpy(), kind='stable')
+        counts, errors = counts.iloc[order], errors.iloc[order]
+        if len(counts) > capacity:
+            floor = max(floor, float(counts.iloc[capacity]))
+            counts, errors = counts.iloc[:capacity], errors.iloc[:capacity]
+        return cls(capacity, counts, errors, floor, total)
+
+    def merge(self, other):
+        """Return the summary of the union of both streams"""
+        items = self.counts.index.union(other.counts.index)
+        counts = (self.counts.reindex(items, fill_value=self.floor)
+                  + other.counts.reindex(items, fill_value=other.floor))
+        errors = (self.errors.reindex(items, fill_value=self.floor)
+                  + other.errors.reindex(items, fill_value=other.floor))
+        return SpaceSaving._truncated(
+            max(self.capacity, other.capacity), counts, errors,
+            self.floor + other.floor, self.total + other.total
+        )
+
+    def update(self, items, weights):
+        """Fold a batch of (item, weight) pairs into the summary"""
+        merged = self.merge(SpaceSaving.from_weights(items, weights, self.capacity))
+        self.counts, self.errors, self.floor, self.total = merged.counts, merged.errors, merged.floor, merged.total
+        return self
+
+    def top(self, n):
+        """Upper bounds of the n heaviest items, largest first"""
+        return self.counts.iloc[:n]
+
+    def top_bounds(self, n):
+        """The n heaviest items with their upper and lower weight bounds"""
+        counts = self.top(n)
+        return pd.DataFrame({
+            'upper': counts,
+            'lower': counts - self.errors.iloc[:n],
+        })
+
+    def max_error(self):
+        """Largest possible overestimate of any reported weight"""
+        return float(self.errors.max()) if len(self.errors) else 0.0
@@ -0,0 +1,137 @@
+"""
+HyperLogLog
+Mergeable distinct-user counts per group without per-user sets
+
+Each group keeps 2^precision one-byte registers holding the largest
+leading-zero rank seen among the hashed user ids routed to it. Groups
+built from separate batches merge with an element-wise maximum, so reach
+per app, category or day can be combined across chunks and collapsed
+across categories. The standard error is about 1.04 / sqrt(2^precision)
+(1.6% at precision 12, 3.3% at precision 10).
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PRECISION = 12
+
+
+def _hash64(values):
+    """splitmix64 finalizer over integer ids"""
+    x = np.asarray(values).astype(np.uint64)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _bit_length(x):
+    """Number of significant bits of each uint64"""
+    length = np.zeros(len(x), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        shifted = x >> np.uint64(shift)
+        high = shifted > 0
+        length[high] += shift
+        x = np.where(high, shifted, x)
+    return length + (x > 0)
+
+
+def register_updates(user_ids, precision):
+    """Return the (register index, rank) pair each user id contributes"""
+    hashes = _hash64(user_ids)
+    width = 64 - precision
+    index = (hashes >> np.uint64(width)).astype(np.int64)
+    rest = hashes & np.uint64((1 << width) - 1)
+    rank = (width + 1 - _bit_length(rest)).astype(np.uint8)
+    return index, rank
+
+
+def estimate(registers):
+    """Cardinality estimate per row of a (groups x 2^precision) register array"""
+    registers = np.atleast_2d(registers)
+    m = registers.shape[1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum(axis=1)
+    zeros = (registers == 0).sum(axis=1)
+    # Linear counting for small cardinalities
+    with np.errstate(divide='ignore'):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+
+class DistinctCounter:
+    """One HyperLogLog register set per group key"""
+
+    def __init__(self, keys, registers, precision=DEFAULT_PRECISION):
+        self.keys = keys
+        self.registers = registers
+        self.precision = precision
+
+    @classmethod
+    def empty(cls, names, precision=DEFAULT_PRECISION):
+        keys = pd.MultiIndex.from_arrays([[] for _ in names], names=names)
+        return cls(keys, np.zeros((0, 1 << precision), dtype=np.uint8), precision)
+
+    @classmethod
+    def from_frame(cls, df, keys, user_column='user_id', precision=DEFAULT_PRECISION):
+        """Build the registers of every group of keys from a frame of events"""
+        groups = df.groupby(keys, sort=True, observed=True)
+        codes = groups.ngroup().to_numpy()
+        group_keys = groups.size().index
+        if not isinstance(group_keys, pd.MultiIndex):
+            group_keys = pd.MultiIndex.from_arrays([group_keys], names=keys)
+        registers = np.zeros((len(group_keys), 1 << precision), dtype=np.uint8)
+        index, rank = register_updates(df[user_column].to_numpy(), precision)
+        np.maximum.at(registers, (codes, index), rank)
+        return cls(group_keys, registers, precision)
+
+    def merge(self, other):
+        """Return the counter of the union of both inputs (element-wise register maximum)
+
+        Only the groups of other are touched: shared groups take the
+        maximum in place of a copy of self, and new groups are appended
+        (unsorted) after the existing ones.
+        """
+        if len(other.keys) == 0:
+            return self
+        if len(self.keys) == 0:
+            return other
+        positions = self.keys.get_indexer(other.keys)
+        found = positions >= 0
+        registers = self.registers.copy()
+        registers[positions[found]] = np.maximum(registers[positions[found]], other.registers[found])
+        if found.all():
+            return DistinctCounter(self.keys, registers, self.precision)
+        return DistinctCounter(self.keys.append(other.keys[~found]),
+                               np.concatenate([registers, other.registers[~found]]), self.precision)
+
+    def where(self, level, value):
+        """Restrict to the groups whose key at level equals value"""
+        mask = (self.keys.get_level_values(level) == value)
+        return DistinctCounter(self.keys[mask], self.registers[mask], self.precision)
+
+    def keep(self, keys):
+        """Restrict to the groups whose full key is in keys"""
+        mask = self.keys.isin(keys)
+        return DistinctCounter(self.keys[mask], self.registers[mask], self.precision)
+
+    def nbytes(self):
+        return self.registers.nbytes
+
+    def collapse(self, level):
+        """Union the groups onto one key level"""
+        codes, values = pd.factorize(self.keys.get_level_values(level), sort=True)
+        registers = np.zeros((len(values), self.registers.shape[1]), dtype=np.uint8)
+        np.maximum.at(registers, codes, self.registers)
+        keys = pd.MultiIndex.from_arrays([values], names=[level])
+        return DistinctCounter(keys, registers, self.precision)
+
+    def total(self):
+        """Estimated distinct users over every group"""
+        if len(self.keys) == 0:
+            return 0.0
+        return float(estimate(self.registers.max(axis=0))[0])
+
+    def counts(self, level):
+        """Estimated distinct users per key of level"""
+        collapsed = self.collapse(level)
+        return pd.Series(estimate(collapsed.registers), index=collapsed.keys.get_level_values(0))
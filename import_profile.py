@@ -0,0 +1,89 @@
+"""
+Import Profile
+Cold-start import time of the dashboard and an import budget check
+
+Imports the dashboard module in fresh interpreters under
+`python -X importtime`, reports the slowest imports by cumulative time
+and fails (exit status 1) when the median cold import exceeds the
+budget or when a module that only some charts need (or none do) is
+imported at startup.
+
+Usage:
+    python import_profile.py [--module NAME] [--repeat 5] [--top 20] [--budget 2.0]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODULE = 'phone_addiction_dashboard'
+# Cold-import medians measured 1.27-1.61 s on the reference machine (run-to-run noise
+# of ~0.3 s); the budget keeps ~25% headroom over the slowest, so only real regressions fail
+DEFAULT_BUDGET_S = 2.0
+
+# Must not be imported when the dashboard module loads (unused, or deferred to the charts that need them)
+DEFERRED_MODULES = ('seaborn', 'matplotlib', 'scipy', 'plotly.express', 'plotly.subplots')
+
+
+def profile_imports(module=DEFAULT_MODULE):
+    """Import module in a fresh interpreter and return {name: (self_s, cumulative_s)}"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+    return timings
+
+
+def deferred_imports(timings):
+    """The DEFERRED_MODULES (or their submodules) that were imported"""
+    return sorted({prefix for prefix in DEFERRED_MODULES
+                   for name in timings if name == prefix or name.startswith(prefix + '.')})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile and budget the cold-start imports')
+    parser.add_argument('--module', default=DEFAULT_MODULE)
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters to time')
+    parser.add_argument('--top', type=int, default=20, help='slowest imports to list')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_S,
+                        help='maximum median import time in seconds')
+    args = parser.parse_args()
+
+    # The first run also compiles any stale bytecode, so it is not timed
+    profile_imports(args.module)
+    runs = [profile_imports(args.module) for _ in range(args.repeat)]
+    totals = [timings[args.module][1] for timings in runs]
+    median = statistics.median(totals)
+
+    timings = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    print(f"{'module':<56}{'self':>10}{'cumulative':>12}")
+    for name, (self_s, cumulative_s) in sorted(timings.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{name:<56}{self_s * 1000:>8.1f}ms{cumulative_s * 1000:>10.1f}ms")
+
+    print(f"\nimport {args.module}: median {median:.3f} s over {args.repeat} runs (budget {args.budget:.3f} s)")
+    failed = False
+    if median > args.budget:
+        print(f"✗ Over the import budget by {median - args.budget:.3f} s")
+        failed = True
+    deferred = deferred_imports(timings)
+    if deferred:
+        print(f"✗ Imported at startup: {', '.join(deferred)}")
+        failed = True
+    if not failed:
+        print("✓ Within the import budget")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
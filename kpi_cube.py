@@ -0,0 +1,120 @@
+"""
+KPI Cube
+Pre-aggregated sufficient statistics for the Social Media Addiction KPIs
+
+The addiction dataset is materialized once into cells keyed by
+platform x gender x age x addiction category. Each cell holds additive
+statistics (count, sums, Addicted_Score histogram buckets and the
+academic-impact count) plus mergeable means and co-moments, so every KPI
+card, the platform table and the correlation views can be answered by
+combining cells instead of rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+from moments import Moments, grouped
+
+DIMENSIONS = ['Most_Used_Platform', 'Gender', 'Age', 'Addiction_Category']
+MEASURES = ['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night',
+            'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score']
+SCORE_BUCKETS = range(0, 10)
+
+
+class KPICube:
+    """Additive statistics per (platform, gender, age, addiction category) cell"""
+
+    def __init__(self, df):
+        parts = {col: df[col].to_numpy() for col in DIMENSIONS}
+        parts['count'] = np.ones(len(df), dtype=np.int64)
+        for m in MEASURES:
+            parts[f'{m}_sum'] = df[m].to_numpy(dtype=np.float64)
+        parts['academic_yes'] = (df['Affects_Academic_Performance'] == 'Yes').to_numpy(dtype=np.int64)
+        scores = df['Addicted_Score'].to_numpy()
+        for score in SCORE_BUCKETS:
+            parts[f'score_{score}'] = (scores == score).astype(np.int64)
+
+        rows = pd.DataFrame(parts)
+        for col in DIMENSIONS:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                rows[col] = pd.Categorical(rows[col], categories=df[col].cat.categories)
+        sums = rows.groupby(DIMENSIONS, observed=True, dropna=False).sum()
+        cell_moments = grouped(df, DIMENSIONS, MEASURES).drop(columns='count')
+        self.cells = sums.join(cell_moments).reset_index()
+
+    def slice(self, platform=None, gender=None, age_range=None):
+        """Return the cells matching the sidebar filters (None means All)"""
+        cells = self.cells
+        mask = np.ones(len(cells), dtype=bool)
+        if platform is not None:
+            mask &= (cells['Most_Used_Platform'] == platform).to_numpy()
+        if gender is not None:
+            mask &= (cells['Gender'] == gender).to_numpy()
+        if age_range is not None:
+            mask &= cells['Age'].between(*age_range).to_numpy()
+        return CubeSlice(cells[mask])
+
+
+class CubeSlice:
+    """A subset of cube cells with KPI accessors"""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    def where(self, **dims):
+        """Restrict the slice to cells whose dimensions equal the given values"""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for col, value in dims.items():
+            mask &= (self.cells[col] == value).to_numpy()
+        return CubeSlice(self.cells[mask])
+
+    @property
+    def count(self):
+        return int(self.cells['count'].sum())
+
+    def _ratio(self, numerator):
+        count = self.count
+        return numerator / count if count else np.nan
+
+    def mean(self, measure):
+        return self._ratio(self.cells[f'{measure}_sum'].sum())
+
+    def moments(self, measures=MEASURES):
+        """Merged means and co-moments of the given measures over the slice"""
+        return Moments.from_table(self.cells, list(measures))
+
+    def std(self, measure):
+        """Sample standard deviation (ddof=1)"""
+        return float(np.sqrt(self.moments([measure]).covariance().iloc[0, 0]))
+
+    def correlation(self, x, y):
+        """Pearson correlation between two measures"""
+        return self.moments([x, y]).correlation().loc[x, y]
+
+    def score_at_least(self, threshold):
+        """Number of students with Addicted_Score >= threshold"""
+        cols = [f'score_{s}' for s in SCORE_BUCKETS if s >= threshold]
+        return int(self.cells[cols].to_numpy().sum())
+
+    def pct(self, count):
+        """count as a percentage of the slice's students (nan for an empty slice)"""
+        return self._ratio(count) * 100
+
+    def academic_impact_pct(self):
+        """Percentage of students whose academic performance is affected"""
+        return self._ratio(self.cells['academic_yes'].sum()) * 100
+
+    def mode(self, dim):
+        """Most frequent value of a dimension (ties resolve to the first sorted value)"""
+        counts = self.cells.groupby(dim, observed=True)['count'].sum()
+        counts = counts[counts > 0]
+        return counts.idxmax() if len(counts) else None
+
+    def group_means(self, dim, measures):
+        """Per-value means of the given measures, like groupby(dim).agg('mean')"""
+        sums = self.cells.groupby(dim, observed=True)[['count'] + [f'{m}_sum' for m in measures]].sum()
+        sums = sums[sums['count'] > 0]
+        return pd.DataFrame(
+            {m: sums[f'{m}_sum'] / sums['count'] for m in measures},
+            index=sums.index
+        )
@@ -0,0 +1,130 @@
+"""
+Moments
+Mergeable count / mean / co-moment accumulator for correlations and trendlines
+
+A Moments object holds, for k numeric columns, the row count, the mean
+vector and the k x k matrix of centered co-moments (sums of products of
+deviations from the mean). Partitions (chunks, filter cells, workers) are
+merged with the pairwise update of Chan et al., so covariances,
+correlations and least-squares lines come out in O(k^2) without
+revisiting rows and without the cancellation of raw sums of squares.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def comoment_column(a, b):
+    """Name of the co-moment column for a pair of columns in a grouped table"""
+    return f'{a}*{b}'
+
+
+class Moments:
+    """Count, means and centered co-moments of a set of numeric columns"""
+
+    def __init__(self, columns, count=0, mean=None, comoment=None):
+        k = len(columns)
+        self.columns = list(columns)
+        self.count = count
+        self.mean = np.zeros(k) if mean is None else mean
+        self.comoment = np.zeros((k, k)) if comoment is None else comoment
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        """Moments of the given columns of a frame or chunk"""
+        values = df[columns].to_numpy(dtype=np.float64)
+        if len(values) == 0:
+            return cls(columns)
+        mean = values.mean(axis=0)
+        centered = values - mean
+        return cls(columns, len(values), mean, centered.T @ centered)
+
+    @classmethod
+    def combine(cls, columns, counts, means, comoments):
+        """Merge many partitions at once from their counts, means and co-moment matrices"""
+        counts = np.asarray(counts, dtype=np.float64)
+        n = counts.sum()
+        if n == 0:
+            return cls(columns)
+        mean = counts @ means / n
+        delta = means - mean
+        comoment = comoments.sum(axis=0) + np.einsum('g,gi,gj->ij', counts, delta, delta)
+        return cls(columns, int(n), mean, comoment)
+
+    @classmethod
+    def from_table(cls, table, columns):
+        """Merge the rows of a grouped table produced by grouped()"""
+        k = len(columns)
+        means = table[[f'{c}_mean' for c in columns]].to_numpy(dtype=np.float64)
+        comoments = np.empty((len(table), k, k))
+        for i, a in enumerate(columns):
+            for j in range(i, k):
+                name = comoment_column(a, columns[j])
+                if name not in table:
+                    name = comoment_column(columns[j], a)
+                values = table[name].to_numpy(dtype=np.float64)
+                comoments[:, i, j] = comoments[:, j, i] = values
+        return cls.combine(columns, table['count'].to_numpy(), means, comoments)
+
+    def merge(self, other):
+        """Return the moments of the union of both partitions"""
+        return Moments.combine(
+            self.columns,
+            [self.count, other.count],
+            np.vstack([self.mean, other.mean]),
+            np.stack([self.comoment, other.comoment])
+        )
+
+    def update(self, df):
+        """Fold a new chunk of rows into the accumulator"""
+        merged = self.merge(Moments.from_frame(df, self.columns))
+        self.count, self.mean, self.comoment = merged.count, merged.mean, merged.comoment
+        return self
+
+    def covariance(self, ddof=1):
+        """Covariance matrix as a DataFrame"""
+        if self.count <= ddof:
+            values = np.full_like(self.comoment, np.nan)
+        else:
+            values = self.comoment / (self.count - ddof)
+        return pd.DataFrame(values, index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        """Pearson correlation matrix as a DataFrame, like DataFrame.corr()"""
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = self.comoment / np.outer(scale, scale)
+        values[~np.isfinite(values)] = np.nan
+        return pd.DataFrame(np.clip(values, -1, 1), index=self.columns, columns=self.columns)
+
+    def linregress(self, x, y):
+        """Least-squares line of y on x: (slope, intercept, r)"""
+        i, j = self.columns.index(x), self.columns.index(y)
+        sxx, syy, sxy = self.comoment[i, i], self.comoment[j, j], self.comoment[i, j]
+        if self.count < 2 or sxx <= 0:
+            return np.nan, np.nan, np.nan
+        slope = sxy / sxx
+        intercept = self.mean[j] - slope * self.mean[i]
+        r = sxy / np.sqrt(sxx * syy) if syy > 0 else np.nan
+        return slope, intercept, r
+
+
+def grouped(df, keys, columns):
+    """Per-group count, means and co-moments as a table (one row per group)
+
+    The table has a 'count' column, a '<col>_mean' column per column and a
+    co-moment column per pair (see comoment_column); Moments.from_table
+    merges any subset of its rows.
+    """
+    values = df[columns].astype(np.float64)
+    by = [df[key] for key in keys]
+    groups = values.groupby(by, observed=True, dropna=False)
+    centered = (values - groups.transform('mean')).to_numpy()
+
+    parts = {'count': np.ones(len(df), dtype=np.int64)}
+    for i, a in enumerate(columns):
+        for j in range(i, len(columns)):
+            parts[comoment_column(a, columns[j])] = centered[:, i] * centered[:, j]
+    table = pd.DataFrame(parts, index=df.index).groupby(by, observed=True, dropna=False).sum()
+    means = groups.mean().add_suffix('_mean')
+    return table[['count']].join(means).join(table.drop(columns='count'))
@@ -0,0 +1,156 @@
+"""
+Page Check
+Renders the addiction pages under every filter combination on each query backend
+
+Every page reading the addiction dataset is rerun for each platform x
+gender selection (including combinations that match no students) plus a
+narrowed age range, once per query backend, and every rerun must finish
+without an exception. The chart queries must also return the same
+groups and dtypes on every backend (means within MEAN_TOLERANCE). Each
+backend renders in its own interpreter, since the backend is chosen
+when the dashboard loads.
+Exits with status 1 on any failure.
+
+Usage:
+    python page_check.py [--backends pandas duckdb] [--pages NAME ...]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DASHBOARD_PATH = os.path.join(REPO_DIR, 'phone_addiction_dashboard.py')
+PAGE_TIMEOUT_S = 600
+
+PAGES = ["Overview", "Social Media Addiction", "Comparative Analysis"]
+QUERIES = ['platform_counts', 'academic_impact_counts', 'health_by_addiction', 'gender_addiction_counts']
+# The in-memory frame holds float32 measures, the Parquet cache float64, so a mean
+# rounded to 2 decimals may land one unit apart (dtypes and groups must match exactly)
+MEAN_TOLERANCE = 0.01 + 1e-9
+
+
+def available_backends():
+    """Query backends that can run here (DuckDB is optional)"""
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return ['pandas']
+    return ['pandas', 'duckdb']
+
+
+def filter_selections(platforms, genders, age_bounds):
+    """(platform, gender, age range) selections: every platform x gender, then a narrowed age range"""
+    low, high = age_bounds
+    selections = [(platform, gender, (low, high)) for platform, gender in itertools.product(platforms, genders)]
+    selections.append(('All', 'All', (low + 1, max(low + 1, high - 1))))
+    return selections
+
+
+def render_pages(pages):
+    """Rerun each page under every selection with the configured backend; returns the failures"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(DASHBOARD_PATH, default_timeout=PAGE_TIMEOUT_S)
+    app.run()
+    failures = []
+    for page in pages:
+        app.sidebar.radio[0].set_value(page).run()
+        platform, gender = app.sidebar.selectbox[0], app.sidebar.selectbox[1]
+        age = app.sidebar.slider[0]
+        selections = filter_selections(platform.options, gender.options, (age.min, age.max))
+        # The last selection resets the filters before the next page
+        for selection in selections + [('All', 'All', (age.min, age.max))]:
+            app.sidebar.selectbox[0].set_value(selection[0])
+            app.sidebar.selectbox[1].set_value(selection[1])
+            app.sidebar.slider[0].set_value(selection[2]).run()
+            if app.exception:
+                failures.append({'page': page, 'selection': list(selection),
+                                 'error': app.exception[0].message.splitlines()[0]})
+    return failures
+
+
+def compare_queries(backends):
+    """Run the chart queries under every platform x gender filter on each backend; returns the mismatches"""
+    import pandas as pd
+
+    import data_cache
+    import phone_addiction_dashboard as dashboard
+    from query_backend import DuckDBBackend, PandasBackend
+
+    df = dashboard.preprocess_addiction_data(data_cache.read_dataset('addiction', dashboard.ADDICTION_COLUMNS))
+    index = dashboard.FilterIndex(df, ('Most_Used_Platform', 'Gender'), ('Age',))
+    engines = {'pandas': PandasBackend({'addiction': df}, indexes={'addiction': index})}
+    if 'duckdb' in backends:
+        engines['duckdb'] = DuckDBBackend({'addiction': data_cache.ensure_cache('addiction')},
+                                          buckets={'addiction': dashboard.ADDICTION_BUCKETS})
+
+    platforms = ['All'] + index.values('Most_Used_Platform')
+    genders = ['All'] + index.values('Gender')
+    ages = tuple(int(age) for age in index.value_range('Age'))
+    mismatches = []
+    for platform, gender, age in filter_selections(platforms, genders, ages):
+        where = dashboard.addiction_where({
+            'platform': None if platform == 'All' else platform,
+            'gender': None if gender == 'All' else gender,
+            'age': None if age == ages else age,
+        })
+        for name in QUERIES:
+            results = {backend: getattr(dashboard, name)(engine, where) for backend, engine in engines.items()}
+            reference = results.pop('pandas')
+            for backend, result in results.items():
+                try:
+                    pd.testing.assert_frame_equal(reference, result, check_exact=False, atol=MEAN_TOLERANCE)
+                except AssertionError as exc:
+                    mismatches.append(f"{name} {platform}/{gender}/{age} pandas vs {backend}: "
+                                      f"{str(exc).strip().splitlines()[0]}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render the addiction pages under every filter combination')
+    parser.add_argument('--backends', nargs='+', choices=['pandas', 'duckdb'], default=available_backends())
+    parser.add_argument('--pages', nargs='+', default=PAGES)
+    parser.add_argument('--render', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.render:
+        # Child process: one backend, failures as JSON on the last line
+        print(json.dumps(render_pages(args.pages)))
+        return
+
+    failed = False
+    mismatches = compare_queries(args.backends)
+    for mismatch in mismatches:
+        print(f"✗ {mismatch}")
+    print(f"{'✗' if mismatches else '✓'} Chart queries on {', '.join(args.backends)}: "
+          f"{len(mismatches)} mismatches")
+    failed |= bool(mismatches)
+
+    for backend in args.backends:
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--render', '--pages', *args.pages],
+            cwd=REPO_DIR, capture_output=True, text=True,
+            env={**os.environ, 'DASHBOARD_QUERY_BACKEND': backend}
+        )
+        if result.returncode != 0:
+            print(f"✗ {backend}: page check crashed\n{result.stderr[-2000:]}")
+            failed = True
+            continue
+        failures = json.loads(result.stdout.strip().splitlines()[-1])
+        for failure in failures:
+            platform, gender, age = failure['selection']
+            print(f"✗ {backend}: {failure['page']} with {platform}/{gender}/ages {age[0]}-{age[1]}: "
+                  f"{failure['error']}")
+        print(f"{'✗' if failures else '✓'} {backend}: {len(args.pages)} pages rendered under every filter, "
+              f"{len(failures)} failures")
+        failed |= bool(failures)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""
+Payload Optimizer
+Shrinks figure JSON before it is cached and sent to the browser
+
+Applied to every freshly built figure:
+- the template keeps trace defaults only for the trace types the figure
+  uses (plotly_white carries defaults for 25 types, ~5 KB per figure);
+- text arrays that repeat a data array (bar labels, heatmap cell values)
+  are dropped in favour of a texttemplate over that array;
+- customdata columns no template references are removed;
+- float arrays are rounded to the precision their templates display them
+  with, or to DEFAULT_SIGNIFICANT_DIGITS when unformatted, and float32
+  data is widened so it serializes as 5.2 rather than 5.199999809;
+- timestamps that all fall on midnight are sent as dates.
+The figure is modified in place, so only optimize figures nobody else
+holds yet.
+
+Usage:
+    python payload_optimizer.py    # bytes before/after for every dashboard chart
+"""
+
+import math
+import re
+
+import numpy as np
+import plotly.graph_objects as go
+
+DEFAULT_SIGNIFICANT_DIGITS = 6
+
+# Data arrays a texttemplate can show in place of a duplicated text array
+VALUE_FIELDS = ('x', 'y', 'z', 'values')
+FLOAT_FIELDS = ('x', 'y', 'z', 'values', 'lat', 'lon')
+_FORMAT = re.compile(r'%\{(\w+)(?:\[(\d+)\])?(?::([^}]*))?\}')
+
+
+def _templates(trace):
+    return ' '.join(
+        value for value in (trace['hovertemplate'] if 'hovertemplate' in trace else None,
+                            trace['texttemplate'] if 'texttemplate' in trace else None)
+        if isinstance(value, str)
+    )
+
+
+def _decimals(spec):
+    """Decimals shown by a d3 format spec like '.2f' or ',.1f', or None"""
+    match = re.search(r'\.(\d+)~?f', spec or '')
+    return int(match.group(1)) if match else None
+
+
+def _significant_decimals(values, digits=DEFAULT_SIGNIFICANT_DIGITS):
+    finite = np.abs(values[np.isfinite(values)])
+    if finite.size == 0 or finite.max() == 0:
+        return 0
+    return max(0, digits - 1 - int(math.floor(math.log10(finite.max()))))
+
+
+def quantize(values, decimals=None):
+    """Round a float array (widened to float64) to decimals, or to the default significant digits"""
+    values = np.asarray(values, dtype=np.float64)
+    if decimals is None:
+        decimals = _significant_decimals(values)
+    rounded = np.round(values, decimals)
+    if decimals == 0 and np.isfinite(rounded).all():
+        return rounded.astype(np.int64)
+    return rounded
+
+
+def _float_array(value):
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'f':
+        return value
+    return None
+
+
+def _numeric(value):
+    """value as a float array when every element is a number, else None"""
+    if value is None or isinstance(value, str):
+        return None
+    try:
+        array = np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    return array if array.size else None
+
+
+def _dates(value):
+    """Midnight-only datetime64 arrays as 'YYYY-MM-DD' strings, else None"""
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'M' and value.size:
+        days = value.astype('datetime64[D]')
+        if (days == value).all():
+            return days.astype(str)
+    return None
+
+
+def replace_duplicated_text(trace):
+    """Swap a text array equal to (a rounding of) a data array for a texttemplate"""
+    if 'text' not in trace or trace.text is None or isinstance(trace.text, str):
+        return
+    text = _numeric(trace.text)
+    if text is None:
+        return
+    existing = trace.texttemplate if isinstance(trace.texttemplate, str) else None
+    if existing and '%{text' not in existing:
+        return
+    for field in VALUE_FIELDS:
+        if field not in trace:
+            continue
+        values = _numeric(trace[field])
+        if values is None or values.shape != text.shape:
+            continue
+        # Text shown as is must be a rounding of the field; formatted text may also be an exact copy
+        decimals = next((d for d in range(7)
+                         if np.allclose(np.round(values, d), text, equal_nan=True, rtol=0, atol=1e-9)), None)
+        exact = np.array_equal(values, text, equal_nan=True)
+        unformatted = existing is None or '%{text}' in existing
+        if decimals is None and (unformatted or not exact):
+            continue
+        shown = f'%{{{field}:.{decimals}~f}}' if decimals is not None else None
+        template = (existing or '%{text}').replace('%{text}', shown or '').replace('%{text:', '%{' + field + ':')
+        trace.text = None
+        trace.texttemplate = template
+        return
+
+
+def strip_unused_customdata(trace):
+    """Drop customdata columns no hover/text template refers to (references are renumbered)"""
+    if 'customdata' not in trace or trace.customdata is None or not isinstance(trace.hovertemplate, str):
+        return
+    customdata = np.asarray(trace.customdata, dtype=object)
+    if customdata.ndim != 2:
+        return
+    templates = _templates(trace)
+    used = sorted({int(index) for name, index, _ in _FORMAT.findall(templates) if name == 'customdata' and index})
+    if '%{customdata}' in templates or len(used) == customdata.shape[1]:
+        return
+    if not used:
+        trace.customdata = None
+        return
+    renumber = {old: new for new, old in enumerate(used)}
+
+    def substitute(match):
+        name, index, spec = match.groups()
+        if name != 'customdata' or not index:
+            return match.group(0)
+        return '%{customdata[' + str(renumber[int(index)]) + ']' + (':' + spec if spec else '') + '}'
+
+    trace.customdata = customdata[:, used]
+    trace.hovertemplate = _FORMAT.sub(substitute, trace.hovertemplate)
+    if isinstance(trace.texttemplate, str):
+        trace.texttemplate = _FORMAT.sub(substitute, trace.texttemplate)
+
+
+def quantize_trace(trace):
+    """Round the float data arrays (and numeric customdata columns) of a trace"""
+    # A field keeps full (default) precision if any template shows it unformatted;
+    # without a hovertemplate the default hover label shows x, y and z as they are
+    formats = {}
+    for name, index, spec in _FORMAT.findall(_templates(trace)):
+        key = (name, int(index)) if index else name
+        decimals = _decimals(spec)
+        formats[key] = None if decimals is None or formats.get(key, 0) is None else max(decimals, formats.get(key, 0))
+    if not isinstance(trace['hovertemplate'] if 'hovertemplate' in trace else None, str):
+        for field in FLOAT_FIELDS:
+            formats.pop(field, None)
+
+    for field in FLOAT_FIELDS:
+        if field not in trace:
+            continue
+        dates = _dates(trace[field])
+        if dates is not None:
+            trace[field] = dates
+            continue
+        values = _float_array(trace[field])
+        if values is not None:
+            trace[field] = quantize(values, formats.get(field))
+
+    if 'customdata' in trace and isinstance(trace.customdata, np.ndarray) and trace.customdata.ndim == 2:
+        customdata = trace.customdata
+        columns = []
+        for i in range(customdata.shape[1]):
+            column = customdata[:, i]
+            numbers = _numeric(column) if column.dtype.kind in 'fiuO' else None
+            if numbers is not None and (column.dtype.kind == 'f' or not np.equal(numbers, np.round(numbers)).all()):
+                column = quantize(numbers, formats.get(('customdata', i)))
+            columns.append(np.asarray(column, dtype=object))
+        trace.customdata = np.column_stack(columns)
+
+
+def prune_template(fig):
+    """Keep the template's trace defaults only for the trace types in the figure"""
+    template = fig.layout.template
+    if template is None or template.data is None:
+        return
+    used = {trace.type for trace in fig.data}
+    data = {name: getattr(template.data, name) for name in used if getattr(template.data, name, None)}
+    fig.layout.template = go.layout.Template(layout=template.layout, data=data)
+
+
+def optimize_figure(fig):
+    """Apply every payload reduction to fig (in place) and return it"""
+    prune_template(fig)
+    for trace in fig.data:
+        replace_duplicated_text(trace)
+        strip_unused_customdata(trace)
+        quantize_trace(trace)
+    return fig
+
+
+if __name__ == '__main__':
+    import copy
+
+    import data_cache
+    import phone_addiction_dashboard as dashboard
+    from chunked_aggregation import aggregate_dataset
+    from figure_cache import figure_size
+
+    df = dashboard.preprocess_addiction_data(data_cache.read_dataset('addiction', dashboard.ADDICTION_COLUMNS))
+    index = dashboard.FilterIndex(df, ('Most_Used_Platform', 'Gender'), ('Age',))
+    data = dashboard.DashboardData(
+        addiction=dashboard.SharedFrame(df), addiction_version=None, addiction_index=index,
+        addiction_cube=dashboard.KPICube(df),
+        query=dashboard.PandasBackend({'addiction': df}, indexes={'addiction': index}),
+        screentime=aggregate_dataset(), screentime_version=None
+    )
+
+    charts = {}
+    for page_charts in dashboard.default_charts(data).values():
+        for create_chart, _, _, args in page_charts:
+            charts[create_chart.__name__] = (create_chart, args)
+
+    total_before = total_after = 0
+    print(f"{'chart':<36}{'before':>12}{'after':>12}{'saved':>8}")
+    for name, (create_chart, (chart_data, *extra)) in sorted(charts.items()):
+        fig = create_chart(chart_data() if callable(chart_data) else chart_data, *extra)
+        before = figure_size(fig)
+        after = figure_size(optimize_figure(copy.deepcopy(fig)))
+        total_before += before
+        total_after += after
+        print(f"{name:<36}{before:>10,} B{after:>10,} B{1 - after / before:>8.0%}")
+    print(f"{'TOTAL':<36}{total_before:>10,} B{total_after:>10,} B{1 - total_after / total_before:>8.0%}")
@@ -9,15 +9,35 @@ Date: December 2025
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import seaborn as sns
-import matplotlib.pyplot as plt
-from scipy import stats
+# plotly.express and plotly.subplots are imported by the charts that use them
+# (they add ~0.2 s to every cold start; see import_profile.py)
+import os
+import time
 import warnings
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 warnings.filterwarnings('ignore')
 
+import data_cache
+import frame_layout
+from filter_index import FilterIndex
+from kpi_cube import KPICube
+from event_store import ScreenTimeStore
+from figure_cache import FigureCache, canonical_key, figure_size
+import scatter_sampling
+import rerun_spans
+from warmup import Warmup
+from render_scheduler import RenderScheduler
+import render_scheduler
+from shared_data import SharedFrame, enable_copy_on_write
+from query_backend import PandasBackend, DuckDBBackend, bucketize
+from payload_optimizer import optimize_figure
+
+# Shared frames are handed to sessions as copy-on-write views
+enable_copy_on_write()
+
 # Page configuration
 st.set_page_config(
     page_title="Phone Addiction Analytics",
@@ -87,50 +107,250 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Columns read by the dashboard pages (the rest stay on disk)
+ADDICTION_COLUMNS = [
+    'Student_ID', 'Age', 'Gender', 'Country', 'Avg_Daily_Usage_Hours',
+    'Most_Used_Platform', 'Affects_Academic_Performance', 'Sleep_Hours_Per_Night',
+    'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score'
+]
+
+# Usage-vs-addiction scatter: WebGL above this many students, density-preserving
+# downsampling above the point budget (the trendline always uses every student)
+SCATTER_WEBGL_THRESHOLD = 5_000
+SCATTER_POINT_BUDGET = 20_000
+
+# Trend granularities offered next to the date range ('Auto' keeps the chart
+# at a few hundred points; choices too fine for the selected range are hidden).
+# Minutes are not offered: the range is picked in whole days and one day already
+# has more minutes than the trend draws points
+TREND_GRANULARITIES = ['Auto', 'Hour', 'Day', 'Week']
+
+# Derived bucket columns: name -> (source column, right-closed bins, labels)
+ADDICTION_BUCKETS = {
+    'Addiction_Category': ('Addicted_Score', [0, 3, 6, 9], ['Low', 'Moderate', 'High']),
+    'Usage_Category': ('Avg_Daily_Usage_Hours', [0, 3, 5, 10], ['Light', 'Moderate', 'Heavy']),
+}
+
+# Bar colour per addiction category
+ADDICTION_COLORS = {'Low': '#00CC96', 'Moderate': '#FFA15A', 'High': '#EF553B'}
+
+# Backend answering the chart queries: 'pandas' (in memory) or 'duckdb' (over the Parquet cache).
+# Only the grouped chart queries move to DuckDB: the filter index, KPI cube, scatter
+# and sample tables are still built from the full frame loaded into pandas, so the
+# switch does not lower the dashboard's memory use or load time.
+QUERY_BACKEND = os.environ.get('DASHBOARD_QUERY_BACKEND', 'pandas')
+
+# Log every built figure's payload size before optimization to the span log (the
+# debug panel measures it only while shown); costs one more serialization per build
+PAYLOAD_SPANS = os.environ.get('DASHBOARD_PAYLOAD_SPANS') == '1'
+
+# Worker threads building a page's figures concurrently (process-wide pool). Serial by
+# default: figure construction is GIL-bound plotly code, and benchmarks.py measured the
+# concurrent page build at 0.8-1.0x of serial. Raise it when large data makes the
+# queries underneath (which release the GIL) dominate.
+CHART_WORKERS = int(os.environ.get('DASHBOARD_CHART_WORKERS', 1))
+
+# Warm-up progress is polled this often while the first build runs
+WARMUP_POLL_S = 0.5
+
+# Everything the pages read, built by the background warm-up and replaced as a whole
+# (addiction is a SharedFrame; pages work on copy-on-write views of it)
+DashboardData = namedtuple('DashboardData', [
+    'addiction', 'addiction_version', 'addiction_index', 'addiction_cube', 'query',
+    'screentime', 'screentime_version'
+])
+
 # Load datasets
-@st.cache_data
-def load_data():
-    """Load and preprocess both datasets"""
+@st.cache_resource
+def open_screentime_store():
+    """Open the process-wide screen-time event store"""
+    return ScreenTimeStore()
+
+def load_data(store):
+    """Load the addiction dataset and the live screen-time aggregates"""
     # Load Dataset 1: Social Media Addiction
-    df_addiction = pd.read_csv('Students_Social_Media_Addiction.csv')
+    df_addiction = data_cache.read_dataset('addiction', ADDICTION_COLUMNS)
     
-    # Load Dataset 2: Screen Time App Usage
-    df_screentime = pd.read_csv('screen_time_app_usage_dataset.csv')
-    df_screentime['date'] = pd.to_datetime(df_screentime['date'])
+    # Load Dataset 2: Screen Time App Usage (aggregates picked up from the event store)
+    screentime = store.refresh()
     
-    return df_addiction, df_screentime
+    return df_addiction, screentime
 
 # Data preprocessing functions
-@st.cache_data
 def preprocess_addiction_data(df):
-    """Preprocess addiction dataset"""
-    # Create addiction categories
-    df['Addiction_Category'] = pd.cut(df['Addicted_Score'], 
-                                       bins=[0, 3, 6, 9], 
-                                       labels=['Low', 'Moderate', 'High'])
-    
-    # Create usage categories
-    df['Usage_Category'] = pd.cut(df['Avg_Daily_Usage_Hours'], 
-                                   bins=[0, 3, 5, 10], 
-                                   labels=['Light', 'Moderate', 'Heavy'])
+    """Preprocess addiction dataset (returns a new frame, df is not modified)"""
+    # Deterministic scatter jitter and sampling rank (stable across filter changes)
+    rng = np.random.default_rng(42)
+    addicted_jitter = df['Addicted_Score'] + rng.normal(0, 0.15, len(df))
+    usage_jitter = df['Avg_Daily_Usage_Hours'] + rng.normal(0, 0.1, len(df))
+    sample_rank = rng.random(len(df))
+    
+    df = df.assign(
+        # Addiction and usage categories
+        **{name: bucketize(df[column], bins, labels) for name, (column, bins, labels) in ADDICTION_BUCKETS.items()},
+        Addicted_Score_Jitter=addicted_jitter,
+        Usage_Jitter=usage_jitter,
+        Sample_Rank=sample_rank
+    )
     
-    return df
+    # Categoricals and downcast numerics
+    return frame_layout.compact_addiction_frame(df)
 
-@st.cache_data
-def preprocess_screentime_data(df):
-    """Preprocess screen time dataset"""
-    # Convert screen time to hours
-    df['screen_time_hours'] = df['screen_time_min'] / 60
-    
-    # Extract hour from datetime
-    df['hour'] = df['date'].dt.hour
-    
-    return df
+# Figure cache (process-wide, shared across sessions)
+@st.cache_resource
+def get_figure_cache():
+    """Create the process-wide LRU figure cache"""
+    return FigureCache()
+
+def chart_key(create_chart, filter_state, version):
+    return (create_chart.__name__, canonical_key(filter_state), version)
+
+def build_chart(create_chart, data, *extra, report=None):
+    """Return create_chart(data, *extra) with its payload minimized; data may be a zero-argument callable (a backend query)
+
+    Pass a dict as report to receive the serialized size before optimization as 'bytes_raw'.
+    """
+    fig = create_chart(data() if callable(data) else data, *extra)
+    if report is not None:
+        report['bytes_raw'] = figure_size(fig)
+    return optimize_figure(fig)
+
+def cached_chart(create_chart, data, filter_state, version, *extra, cache=None):
+    """Return create_chart(data, *extra), reusing a figure built for the same filters and data version
+
+    A deferred query passed as data only runs when the figure is not cached.
+    Pass cache when calling from a worker thread.
+    """
+    key = chart_key(create_chart, filter_state, version)
+    cache = cache or get_figure_cache()
+    fig = cache.get(key)
+    with rerun_spans.span(f'create/{create_chart.__name__}', chart=create_chart.__name__,
+                          cache='miss' if fig is None else 'hit') as record:
+        if fig is None:
+            trace = rerun_spans.current()
+            measure = trace is not None and trace.payload_sizes
+            fig = build_chart(create_chart, data, *extra, report=record if measure else None)
+            record['bytes'] = cache.put(key, fig)
+        else:
+            record['bytes'] = cache.size(key)
+    return fig
+
+def show_chart(placeholder, name, fig):
+    with rerun_spans.span(f'plotly_chart/{name}', chart=name):
+        placeholder.plotly_chart(fig, use_container_width=True)
+
+def render_chart(create_chart, data, filter_state, version, *extra):
+    """Reserve the chart's place in the layout and build (or reuse) it, concurrently when a page scheduler is active"""
+    placeholder = st.empty()
+    build = partial(cached_chart, create_chart, data, filter_state, version, *extra, cache=get_figure_cache())
+    emit = partial(show_chart, placeholder, create_chart.__name__)
+    scheduler = render_scheduler.active()
+    if scheduler is None:
+        emit(build())
+    else:
+        scheduler.submit(build, emit)
+
+# Chart worker pool (process-wide, bounded)
+@st.cache_resource
+def get_chart_pool():
+    """Create the thread pool that builds figures"""
+    # plotly imports some modules lazily (plotly.express, the orjson engine) and concurrent
+    # first imports from the workers can see them half-initialized, so load them here first
+    import plotly.express
+    import plotly.subplots
+    figure_size(go.Figure())
+    return ThreadPoolExecutor(max_workers=CHART_WORKERS, thread_name_prefix='chart')
+
+# Rerun timing log (process-wide, exported to .telemetry/); clearing the
+# resource cache stops the old log's writer thread
+@st.cache_resource(on_release=lambda span_log: span_log.close())
+def get_span_log():
+    """Create the process-wide span log"""
+    return rerun_spans.SpanLog()
+
+def render_debug_panel(trace):
+    """Sidebar table of this rerun's spans (opt-in)"""
+    st.sidebar.markdown("---")
+    if not st.sidebar.checkbox("🐞 Show timing debug", key='timing_debug'):
+        return
+    spans = pd.DataFrame([{
+        'span': record['name'],
+        'ms': round(record['duration_s'] * 1000, 1),
+        'cache': record.get('cache', ''),
+        'KB': round(record['bytes'] / 1024, 1) if record.get('bytes') else None,
+        'raw KB': round(record['bytes_raw'] / 1024, 1) if record.get('bytes_raw') else None,
+    } for record in trace.spans])
+    st.sidebar.caption(f"Rerun: {trace.duration_s * 1000:.0f} ms · {len(trace.spans)} spans")
+    charts = next((record for record in trace.spans if record['name'] == 'charts'), None)
+    if charts is not None and charts['charts']:
+        # Only cache misses are built; hits would count as ~0 ms builds and hide the speedup
+        misses = [record for record in trace.spans if record.get('cache') == 'miss']
+        build_s = sum(record['duration_s'] for record in misses)
+        speedup = f"{build_s / charts['wall_s']:.1f}x" if misses and charts['wall_s'] > 0 else "n/a"
+        st.sidebar.caption(
+            f"Charts: {charts['charts']} in {charts['wall_s'] * 1000:.0f} ms "
+            f"({len(misses)} built, summing to {build_s * 1000:.0f} ms, {speedup} on {CHART_WORKERS} workers)"
+        )
+    built = [record for record in trace.spans if record.get('bytes_raw')]
+    if built:
+        raw, sent = sum(r['bytes_raw'] for r in built), sum(r['bytes'] for r in built)
+        st.sidebar.caption(
+            f"Payload of {len(built)} built figures: {raw / 1024:.0f} KB → {sent / 1024:.0f} KB "
+            f"({1 - sent / raw:.0%} smaller)"
+        )
+    st.sidebar.dataframe(spans, use_container_width=True, hide_index=True)
+    stats = get_figure_cache().stats()
+    st.sidebar.caption(
+        f"Figure cache: {stats['entries']} figures, {stats['bytes'] / 1024:.0f} KB, "
+        f"{stats['hits']} hits / {stats['misses']} misses"
+    )
+
+# Chart queries (small result frames from the query backend)
+def make_query_backend(df, index):
+    """Create the configured query backend for the preprocessed addiction data"""
+    if QUERY_BACKEND == 'duckdb':
+        return DuckDBBackend(
+            {'addiction': data_cache.ensure_cache('addiction')},
+            buckets={'addiction': ADDICTION_BUCKETS}
+        )
+    return PandasBackend({'addiction': df}, indexes={'addiction': index})
+
+def addiction_where(addiction_state):
+    """Backend filter arguments for the addiction sidebar state"""
+    return {
+        'equals': {'Most_Used_Platform': addiction_state['platform'], 'Gender': addiction_state['gender']},
+        'ranges': {'Age': addiction_state['age']}
+    }
+
+def platform_counts(query, where):
+    """Students per platform"""
+    return query.count_by('addiction', ['Most_Used_Platform'], **where)
+
+def academic_impact_counts(query, where):
+    """Students per academic-impact answer"""
+    return query.count_by('addiction', ['Affects_Academic_Performance'], **where)
+
+def health_by_addiction(query, where):
+    """Mean mental health, sleep and conflicts per addiction category"""
+    return query.aggregate('addiction', ['Addiction_Category'], {
+        'Mental_Health_Score': ('Mental_Health_Score', 'mean'),
+        'Sleep_Hours_Per_Night': ('Sleep_Hours_Per_Night', 'mean'),
+        'Conflicts_Over_Social_Media': ('Conflicts_Over_Social_Media', 'mean')
+    }, **where).round(2)
+
+def gender_addiction_counts(query, where):
+    """Students per gender and addiction category"""
+    return query.count_by('addiction', ['Gender', 'Addiction_Category'], **where)
+
+def format_pct(value, decimals=0):
+    """A KPI percentage, or N/A when the filters leave no students"""
+    return 'N/A' if np.isnan(value) else f"{value:.{decimals}f}%"
 
 # Visualization functions
-def create_platform_distribution(df):
+def create_platform_distribution(platform_counts):
     """Create platform usage distribution chart"""
-    platform_counts = df['Most_Used_Platform'].value_counts().head(10)
+    platform_counts = platform_counts.set_index('Most_Used_Platform')['Count'].sort_values(ascending=False)
+    platform_counts = platform_counts[platform_counts > 0].head(10)
     
     fig = go.Figure(data=[
         go.Bar(
@@ -159,33 +379,45 @@ def create_platform_distribution(df):
     
     return fig
 
-def create_addiction_correlation(df):
+def create_addiction_correlation(df, kpis, point_budget=SCATTER_POINT_BUDGET):
     """Create scatter plot showing usage vs addiction correlation"""
-    # Add jitter to reduce overlap
-    df_plot = df.copy()
-    np.random.seed(42)
-    df_plot['Addicted_Score_Jitter'] = df_plot['Addicted_Score'] + np.random.normal(0, 0.15, len(df_plot))
-    df_plot['Usage_Jitter'] = df_plot['Avg_Daily_Usage_Hours'] + np.random.normal(0, 0.1, len(df_plot))
+    import plotly.express as px
+    # Jitter is precomputed; large selections are downsampled preserving density
+    hover_columns = ['Age', 'Gender', 'Sleep_Hours_Per_Night', 'Avg_Daily_Usage_Hours', 'Addicted_Score']
+    plot_columns = ['Usage_Jitter', 'Addicted_Score_Jitter', 'Most_Used_Platform'] + hover_columns
+    rows = scatter_sampling.density_sample(
+        df['Usage_Jitter'].to_numpy(),
+        df['Addicted_Score_Jitter'].to_numpy(),
+        df['Sample_Rank'].to_numpy(),
+        point_budget
+    )
+    df_plot = frame_layout.observed_categories(
+        df[plot_columns] if len(rows) == len(df) else df.iloc[rows][plot_columns]
+    )
+    
+    subtitle = 'Strong Positive Correlation (r = 0.87)'
+    if len(df_plot) < len(df):
+        subtitle += f' · showing {len(df_plot):,} of {len(df):,} students'
     
-    # Create scatter plot with reduced size and transparency
+    # Create scatter plot with reduced size and transparency (WebGL for large selections)
     fig = px.scatter(
         df_plot,
         x='Usage_Jitter',
         y='Addicted_Score_Jitter',
         color='Most_Used_Platform',
-        hover_data=['Age', 'Gender', 'Sleep_Hours_Per_Night', 'Avg_Daily_Usage_Hours', 'Addicted_Score'],
-        title='Daily Usage Hours vs. Addiction Score by Platform<br><sub>Strong Positive Correlation (r = 0.87)</sub>',
+        hover_data=hover_columns,
+        title=f'Daily Usage Hours vs. Addiction Score by Platform<br><sub>{subtitle}</sub>',
         labels={
             'Usage_Jitter': 'Average Daily Usage (Hours)',
             'Addicted_Score_Jitter': 'Addiction Score (0-9)'
         },
         height=600,
-        opacity=0.6
+        opacity=0.6,
+        render_mode='webgl' if len(df) > SCATTER_WEBGL_THRESHOLD else 'svg'
     )
     
-    # Add trendline manually for better control
-    from scipy import stats
-    slope, intercept, r_value, p_value, std_err = stats.linregress(df['Avg_Daily_Usage_Hours'], df['Addicted_Score'])
+    # Add trendline manually for better control (fit on every student via the cube moments)
+    slope, intercept, r_value = kpis.moments().linregress('Avg_Daily_Usage_Hours', 'Addicted_Score')
     x_trend = np.linspace(df['Avg_Daily_Usage_Hours'].min(), df['Avg_Daily_Usage_Hours'].max(), 100)
     y_trend = slope * x_trend + intercept
     
@@ -218,14 +450,11 @@ def create_addiction_correlation(df):
     
     return fig
 
-def create_mental_health_impact(df):
-    """Create visualization showing mental health impact"""
-    # Group by addiction category
-    health_impact = df.groupby('Addiction_Category').agg({
-        'Mental_Health_Score': 'mean',
-        'Sleep_Hours_Per_Night': 'mean',
-        'Conflicts_Over_Social_Media': 'mean'
-    }).round(2).reset_index()
+def create_mental_health_impact(health_impact):
+    """Create visualization showing mental health impact (means per addiction category)"""
+    from plotly.subplots import make_subplots
+    # Only the categories present under the filters are returned
+    colors = health_impact['Addiction_Category'].map(ADDICTION_COLORS).tolist()
     
     # Create figure with subplots - side by side instead of overlapping
     fig = make_subplots(
@@ -240,7 +469,7 @@ def create_mental_health_impact(df):
             x=health_impact['Addiction_Category'],
             y=health_impact['Mental_Health_Score'],
             name='Mental Health',
-            marker_color=['#00CC96', '#FFA15A', '#EF553B'],
+            marker_color=colors,
             text=health_impact['Mental_Health_Score'],
             textposition='outside',
             texttemplate='%{text:.2f}',
@@ -255,7 +484,7 @@ def create_mental_health_impact(df):
             x=health_impact['Addiction_Category'],
             y=health_impact['Sleep_Hours_Per_Night'],
             name='Sleep Hours',
-            marker_color=['#00CC96', '#FFA15A', '#EF553B'],
+            marker_color=colors,
             text=health_impact['Sleep_Hours_Per_Night'],
             textposition='outside',
             texttemplate='%{text:.2f}',
@@ -284,13 +513,10 @@ def create_mental_health_impact(df):
     
     return fig
 
-def create_category_distribution(df):
+def create_category_distribution(aggregates):
     """Create app category time distribution"""
-    category_data = df.groupby('category').agg({
-        'screen_time_min': 'sum',
-        'launches': 'sum',
-        'interactions': 'sum'
-    }).reset_index()
+    category_data = aggregates.category_totals()
+    reach = aggregates.reach_by('category').reindex(category_data['category']).to_numpy()
     
     fig = go.Figure(data=[
         go.Pie(
@@ -301,7 +527,9 @@ def create_category_distribution(df):
                 colors=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
             ),
             textinfo='label+percent',
-            textposition='outside'
+            textposition='outside',
+            customdata=reach,
+            hovertemplate='%{label}<br>%{value:,.0f} min<br>~%{customdata:,.0f} unique users<extra></extra>'
         )
     ])
     
@@ -313,10 +541,9 @@ def create_category_distribution(df):
     
     return fig
 
-def create_hourly_usage_pattern(df):
+def create_hourly_usage_pattern(aggregates):
     """Create hourly usage pattern heatmap"""
-    hourly_usage = df.groupby(['hour', 'category'])['screen_time_min'].sum().reset_index()
-    hourly_pivot = hourly_usage.pivot(index='hour', columns='category', values='screen_time_min').fillna(0)
+    hourly_pivot = aggregates.hourly_pivot()
     
     fig = go.Figure(data=go.Heatmap(
         z=hourly_pivot.values,
@@ -339,13 +566,9 @@ def create_hourly_usage_pattern(df):
     
     return fig
 
-def create_productivity_comparison(df):
+def create_productivity_comparison(aggregates):
     """Compare productive vs non-productive app usage"""
-    productive_stats = df.groupby('is_productive').agg({
-        'screen_time_min': 'sum',
-        'launches': 'mean',
-        'interactions': 'mean'
-    }).reset_index()
+    productive_stats = aggregates.productivity_stats()
     
     productive_stats['is_productive'] = productive_stats['is_productive'].map({
         True: 'Productive Apps',
@@ -373,9 +596,8 @@ def create_productivity_comparison(df):
     
     return fig
 
-def create_academic_impact(df):
+def create_academic_impact(academic_impact):
     """Analyze academic performance impact"""
-    academic_impact = df.groupby('Affects_Academic_Performance').size().reset_index(name='Count')
     
     colors = ['#00CC96' if x == 'No' else '#EF553B' for x in academic_impact['Affects_Academic_Performance']]
     
@@ -400,9 +622,13 @@ def create_academic_impact(df):
     
     return fig
 
-def create_top_apps_usage(df):
+def create_top_apps_usage(aggregates):
     """Create top apps by screen time"""
-    top_apps = df.groupby('app_name')['screen_time_min'].sum().sort_values(ascending=False).head(15)
+    # Answered from the heavy-hitter sketch; bars are upper bounds, whiskers reach the lower bounds
+    bounds = aggregates.app_sketch('screen_time_min').top_bounds(15)
+    top_apps = bounds['upper']
+    overestimate = (bounds['upper'] - bounds['lower']).to_numpy()
+    reach = aggregates.reach_by('app_name').reindex(top_apps.index).to_numpy()
     
     fig = go.Figure(data=[
         go.Bar(
@@ -414,8 +640,17 @@ def create_top_apps_usage(df):
                 colorscale='Blues',
                 showscale=False
             ),
+            error_x=dict(
+                type='data',
+                symmetric=False,
+                array=np.zeros(len(overestimate)),
+                arrayminus=overestimate,
+                visible=bool(overestimate.any())
+            ),
             text=top_apps.values.round(0),
-            textposition='outside'
+            textposition='outside',
+            customdata=reach,
+            hovertemplate='%{y}<br>%{x:,.0f} min<br>~%{customdata:,.0f} unique users<extra></extra>'
         )
     ])
     
@@ -429,9 +664,27 @@ def create_top_apps_usage(df):
     
     return fig
 
-def create_gender_comparison(df):
+def create_daily_usage_trend(aggregates, start=None, end=None, granularity=None):
+    """Create screen time trend line over [start, end) from the coarsest matching rollup"""
+    import plotly.express as px
+    trend, granularity = aggregates.trend(start, end, granularity)
+    daily_usage = trend['screen_time_min'].reset_index()
+    daily_usage.columns = ['Date', 'Total Screen Time (min)']
+    
+    fig = px.line(
+        daily_usage,
+        x='Date',
+        y='Total Screen Time (min)',
+        title=f'Screen Time Trend (per {granularity})',
+        markers=len(daily_usage) <= 200
+    )
+    fig.update_layout(template='plotly_white', height=400)
+    
+    return fig
+
+def create_gender_comparison(gender_stats):
     """Compare addiction patterns by gender"""
-    gender_stats = df.groupby(['Gender', 'Addiction_Category']).size().reset_index(name='Count')
+    import plotly.express as px
     
     fig = px.bar(
         gender_stats,
@@ -440,6 +693,7 @@ def create_gender_comparison(df):
         color='Addiction_Category',
         barmode='group',
         title='Addiction Levels by Gender',
+        category_orders={'Addiction_Category': ADDICTION_BUCKETS['Addiction_Category'][2]},
         color_discrete_map={
             'Low': '#00CC96',
             'Moderate': '#FFA15A',
@@ -452,13 +706,13 @@ def create_gender_comparison(df):
     
     return fig
 
-def create_correlation_matrix(df):
+def create_correlation_matrix(kpis):
     """Create correlation heatmap for key metrics"""
-    # Select numeric columns
+    # Merged from the cube's per-cell moments of the key numeric columns
     numeric_cols = ['Age', 'Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 
                     'Mental_Health_Score', 'Conflicts_Over_Social_Media', 'Addicted_Score']
     
-    correlation = df[numeric_cols].corr()
+    correlation = kpis.moments(numeric_cols).correlation()
     
     fig = go.Figure(data=go.Heatmap(
         z=correlation.values,
@@ -480,18 +734,127 @@ def create_correlation_matrix(df):
     
     return fig
 
+# Background warm-up (datasets, indexes and the default view of every page)
+def default_charts(data):
+    """Each page's unfiltered charts as (create_chart, filter_state, version, args)"""
+    addiction_state = {'platform': None, 'gender': None, 'age': None}
+    screentime_state = {'category': None}
+    df, screentime, kpis = data.addiction.view(), data.screentime, data.addiction_cube.slice()
+    
+    def addiction_chart(create_chart, *args):
+        return (create_chart, addiction_state, data.addiction_version, args)
+    
+    def screentime_chart(create_chart, *args, filter_state=screentime_state):
+        return (create_chart, filter_state, data.screentime_version, args)
+    
+    pages = {
+        "Overview": [
+            addiction_chart(create_platform_distribution, partial(platform_counts, data.query, {})),
+            addiction_chart(create_academic_impact, partial(academic_impact_counts, data.query, {})),
+            screentime_chart(create_category_distribution, screentime),
+            addiction_chart(create_gender_comparison, partial(gender_addiction_counts, data.query, {})),
+        ],
+        "Social Media Addiction": [
+            addiction_chart(create_addiction_correlation, df, kpis),
+            addiction_chart(create_mental_health_impact, partial(health_by_addiction, data.query, {})),
+            addiction_chart(create_correlation_matrix, kpis),
+        ],
+        "Screen Time Patterns": [
+            screentime_chart(create_hourly_usage_pattern, screentime),
+            screentime_chart(create_top_apps_usage, screentime),
+            screentime_chart(create_productivity_comparison, screentime),
+        ],
+        "Comparative Analysis": [
+            addiction_chart(create_platform_distribution, partial(platform_counts, data.query, {})),
+            screentime_chart(create_category_distribution, screentime),
+        ],
+    }
+    first_day, last_day = screentime.time_range()
+    if first_day is not None:
+        trend_state = dict(
+            screentime_state,
+            dates=(first_day.date().isoformat(), last_day.date().isoformat()),
+            granularity='Auto'
+        )
+        pages["Screen Time Patterns"].append(screentime_chart(
+            create_daily_usage_trend, screentime,
+            pd.Timestamp(first_day.date()), pd.Timestamp(last_day.date()) + pd.Timedelta(days=1), None,
+            filter_state=trend_state
+        ))
+    return pages
+
+def prefill_charts(data, figures, pool):
+    """Build every page's unfiltered charts into the figure cache (concurrently)"""
+    charts = {}
+    for page_charts in default_charts(data).values():
+        for create_chart, filter_state, version, args in page_charts:
+            charts[chart_key(create_chart, filter_state, version)] = partial(build_chart, create_chart, *args)
+    futures = [pool.submit(figures.get_or_build, key, build) for key, build in charts.items()]
+    for future in futures:
+        future.result()
+
+def build_dashboard_data(store, figures, pool, report):
+    """Load, preprocess and index both datasets, then prefill the default charts"""
+    report("Loading datasets")
+    df_addiction, screentime = load_data(store)
+    
+    report("Preprocessing")
+    df_addiction = preprocess_addiction_data(df_addiction)
+    
+    report("Building filter index, KPI cube and query backend")
+    addiction = SharedFrame(df_addiction)
+    addiction_index = FilterIndex(df_addiction, ('Most_Used_Platform', 'Gender'), ('Age',))
+    data = DashboardData(
+        addiction=addiction,
+        addiction_version=data_cache.dataset_version('addiction'),
+        addiction_index=addiction_index,
+        addiction_cube=KPICube(df_addiction),
+        query=make_query_backend(addiction.view(), addiction_index),
+        screentime=screentime,
+        screentime_version=store.version()
+    )
+    
+    report("Rendering default charts")
+    prefill_charts(data, figures, pool)
+    return data
+
+@st.cache_resource
+def get_warmup():
+    """Start the process-wide warm-up (on the first script run after server start)"""
+    store, figures, pool = open_screentime_store(), get_figure_cache(), get_chart_pool()
+    return Warmup(
+        lambda report: build_dashboard_data(store, figures, pool, report),
+        is_stale=lambda data: data.addiction_version != data_cache.dataset_version('addiction') or store.stale(),
+        steps=4,
+        name='dashboard-warmup'
+    ).start()
+
+def render_warming(status):
+    """Placeholder shown until the first warm-up publishes its data (polls, then reruns)"""
+    if status['state'] == 'failed':
+        st.error(f"Loading the datasets failed: {status['error']}")
+        return
+    st.info(f"⏳ Warming up the dashboard: {status['step'] or 'starting'}...")
+    st.progress(status['progress'] or 0.0)
+    time.sleep(WARMUP_POLL_S)
+    st.rerun()
+
 # Main application
-def main():
+def render_dashboard(trace):
     # Header
     st.title("📱 Phone App Addiction & Screen Time Analysis Dashboard")
     st.markdown("### Interactive Data Visualization for Digital Wellness Research")
     st.markdown("---")
     
-    # Load data
-    with st.spinner("Loading datasets..."):
-        df_addiction, df_screentime = load_data()
-        df_addiction = preprocess_addiction_data(df_addiction)
-        df_screentime = preprocess_screentime_data(df_screentime)
+    # Data (published by the background warm-up; a stale copy is served while it rebuilds)
+    with rerun_spans.span('load_data'):
+        warmup = get_warmup()
+        data = warmup.current()
+    if data is None:
+        render_warming(warmup.status())
+        return
+    df_addiction, screentime = data.addiction.view(), data.screentime
+    addiction_version, screentime_version = data.addiction_version, data.screentime_version
     
     # Sidebar
     st.sidebar.title("🎛️ Dashboard Controls")
@@ -502,51 +865,62 @@ def main():
         "Select Analysis Type:",
         ["Overview", "Social Media Addiction", "Screen Time Patterns", "Comparative Analysis"]
     )
+    trace.page = analysis_type
     
     # Filters
     st.sidebar.markdown("### Filters")
+    with rerun_spans.span('filters'):
     
-    if analysis_type in ["Overview", "Social Media Addiction", "Comparative Analysis"]:
-        # Platform filter
-        platforms = ['All'] + sorted(df_addiction['Most_Used_Platform'].unique().tolist())
-        selected_platform = st.sidebar.selectbox("Select Platform:", platforms)
-        
-        # Gender filter
-        genders = ['All'] + sorted(df_addiction['Gender'].unique().tolist())
-        selected_gender = st.sidebar.selectbox("Select Gender:", genders)
-        
-        # Age range
-        age_range = st.sidebar.slider(
-            "Age Range:",
-            int(df_addiction['Age'].min()),
-            int(df_addiction['Age'].max()),
-            (int(df_addiction['Age'].min()), int(df_addiction['Age'].max()))
-        )
-        
-        # Apply filters
-        df_filtered = df_addiction.copy()
-        if selected_platform != 'All':
-            df_filtered = df_filtered[df_filtered['Most_Used_Platform'] == selected_platform]
-        if selected_gender != 'All':
-            df_filtered = df_filtered[df_filtered['Gender'] == selected_gender]
-        df_filtered = df_filtered[(df_filtered['Age'] >= age_range[0]) & (df_filtered['Age'] <= age_range[1])]
-    else:
-        df_filtered = df_addiction.copy()
+        addiction_index, addiction_cube = data.addiction_index, data.addiction_cube
     
-    if analysis_type in ["Overview", "Screen Time Patterns", "Comparative Analysis"]:
-        # App category filter for screentime data
-        categories = ['All'] + sorted(df_screentime['category'].unique().tolist())
-        selected_category = st.sidebar.selectbox("Select App Category:", categories)
+        if analysis_type in ["Overview", "Social Media Addiction", "Comparative Analysis"]:
+            # Platform filter
+            platforms = ['All'] + addiction_index.values('Most_Used_Platform')
+            selected_platform = st.sidebar.selectbox("Select Platform:", platforms)
         
-        # Apply filter
-        df_screentime_filtered = df_screentime.copy()
-        if selected_category != 'All':
-            df_screentime_filtered = df_screentime_filtered[df_screentime_filtered['category'] == selected_category]
-    else:
-        df_screentime_filtered = df_screentime.copy()
+            # Gender filter
+            genders = ['All'] + addiction_index.values('Gender')
+            selected_gender = st.sidebar.selectbox("Select Gender:", genders)
+        
+            # Age range
+            min_age, max_age = addiction_index.value_range('Age')
+            age_range = st.sidebar.slider(
+                "Age Range:",
+                int(min_age),
+                int(max_age),
+                (int(min_age), int(max_age))
+            )
+        
+            addiction_state = {
+                'platform': None if selected_platform == 'All' else selected_platform,
+                'gender': None if selected_gender == 'All' else selected_gender,
+                'age': None if age_range == (int(min_age), int(max_age)) else age_range
+            }
+        else:
+            addiction_state = {'platform': None, 'gender': None, 'age': None}
+    
+        # Apply filters (row selection from the index, no frame copy; aggregate charts query the backend)
+        where = addiction_where(addiction_state)
+        df_filtered = addiction_index.apply(df_addiction, **where)
+        kpis = addiction_cube.slice(addiction_state['platform'], addiction_state['gender'], addiction_state['age'])
+    
+        if analysis_type in ["Overview", "Screen Time Patterns", "Comparative Analysis"]:
+            # App category filter for screentime data
+            categories = ['All'] + screentime.categories()
+            selected_category = st.sidebar.selectbox("Select App Category:", categories)
+        
+            screentime_state = {'category': None if selected_category == 'All' else selected_category}
+        else:
+            screentime_state = {'category': None}
+    
+        # Apply filter (restricts the pre-aggregated tables, not the events)
+        screentime_filtered = screentime.for_category(screentime_state['category'])
+    trace.filters = dict(addiction_state, **screentime_state)
     
     st.sidebar.markdown("---")
     st.sidebar.info("📊 Filters applied to all visualizations")
+    if warmup.status()['state'] == 'warming':
+        st.sidebar.caption("🔄 Refreshing data in the background")
     
     # Main content based on selection
     if analysis_type == "Overview":
@@ -558,12 +932,12 @@ def main():
         with col1:
             st.metric(
                 "Total Students",
-                f"{len(df_filtered):,}",
+                f"{kpis.count:,}",
                 delta=None
             )
         
         with col2:
-            avg_usage = df_filtered['Avg_Daily_Usage_Hours'].mean()
+            avg_usage = kpis.mean('Avg_Daily_Usage_Hours')
             st.metric(
                 "Avg Daily Usage",
                 f"{avg_usage:.1f} hrs",
@@ -571,7 +945,7 @@ def main():
             )
         
         with col3:
-            avg_addiction = df_filtered['Addicted_Score'].mean()
+            avg_addiction = kpis.mean('Addicted_Score')
             st.metric(
                 "Avg Addiction Score",
                 f"{avg_addiction:.1f}/9",
@@ -579,10 +953,10 @@ def main():
             )
         
         with col4:
-            affected = (df_filtered['Affects_Academic_Performance'] == 'Yes').sum() / len(df_filtered) * 100
+            affected = kpis.academic_impact_pct()
             st.metric(
                 "Academic Impact",
-                f"{affected:.0f}%",
+                format_pct(affected),
                 delta=None
             )
         
@@ -594,19 +968,21 @@ def main():
         with col1:
             st.subheader("📈 Key Findings")
             st.markdown(f"""
-            - **Most Popular Platform:** {df_filtered['Most_Used_Platform'].mode()[0]}
-            - **Average Sleep:** {df_filtered['Sleep_Hours_Per_Night'].mean():.1f} hours/night
-            - **Mental Health Score:** {df_filtered['Mental_Health_Score'].mean():.1f}/10
-            - **High Addiction (Score 7-9):** {(df_filtered['Addicted_Score'] >= 7).sum()} students ({(df_filtered['Addicted_Score'] >= 7).sum() / len(df_filtered) * 100:.1f}%)
+            - **Most Popular Platform:** {kpis.mode('Most_Used_Platform')}
+            - **Average Sleep:** {kpis.mean('Sleep_Hours_Per_Night'):.1f} hours/night
+            - **Mental Health Score:** {kpis.mean('Mental_Health_Score'):.1f}/10
+            - **High Addiction (Score 7-9):** {kpis.score_at_least(7)} students ({format_pct(kpis.pct(kpis.score_at_least(7)), 1)})
             """)
         
         with col2:
+            screentime_totals = screentime_filtered.totals()
             st.subheader("📱 Screen Time Stats")
             st.markdown(f"""
-            - **Total App Records:** {len(df_screentime_filtered):,}
-            - **Total Screen Time:** {df_screentime_filtered['screen_time_min'].sum() / 60:.0f} hours
-            - **Avg Session Time:** {df_screentime_filtered['screen_time_min'].mean():.1f} minutes
-            - **Most Launched App:** {df_screentime_filtered.groupby('app_name')['launches'].sum().idxmax()}
+            - **Total App Records:** {int(screentime_totals['events']):,}
+            - **Total Screen Time:** {screentime_totals['screen_time_min'] / 60:.0f} hours
+            - **Avg Session Time:** {screentime_totals['screen_time_min'] / screentime_totals['events']:.1f} minutes
+            - **Most Launched App:** {screentime_filtered.most_launched_app()}
+            - **Unique Users (est.):** {screentime_filtered.unique_users():,.0f}
             """)
         
         st.markdown("---")
@@ -615,34 +991,36 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(create_platform_distribution(df_filtered), use_container_width=True)
+            render_chart(create_platform_distribution, partial(platform_counts, data.query, where), addiction_state, addiction_version)
         
         with col2:
-            st.plotly_chart(create_academic_impact(df_filtered), use_container_width=True)
+            render_chart(create_academic_impact, partial(academic_impact_counts, data.query, where), addiction_state, addiction_version)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(create_category_distribution(df_screentime_filtered), use_container_width=True)
+            render_chart(create_category_distribution, screentime_filtered, screentime_state, screentime_version)
         
         with col2:
-            st.plotly_chart(create_gender_comparison(df_filtered), use_container_width=True)
+            render_chart(create_gender_comparison, partial(gender_addiction_counts, data.query, where), addiction_state, addiction_version)
     
     elif analysis_type == "Social Media Addiction":
         st.header("🔴 Social Media Addiction Analysis")
         
         # Key metrics
+        high_kpis = kpis.where(Addiction_Category='High')
+        low_kpis = kpis.where(Addiction_Category='Low')
         col1, col2, col3 = st.columns(3)
         
         with col1:
             st.metric(
                 "High Addiction Students",
-                f"{(df_filtered['Addiction_Category'] == 'High').sum()}",
-                delta=f"{(df_filtered['Addiction_Category'] == 'High').sum() / len(df_filtered) * 100:.1f}%"
+                f"{high_kpis.count}",
+                delta=format_pct(kpis.pct(high_kpis.count), 1)
             )
         
         with col2:
-            correlation = df_filtered[['Avg_Daily_Usage_Hours', 'Addicted_Score']].corr().iloc[0, 1]
+            correlation = kpis.correlation('Avg_Daily_Usage_Hours', 'Addicted_Score')
             st.metric(
                 "Usage-Addiction Correlation",
                 f"{correlation:.2f}",
@@ -650,8 +1028,8 @@ def main():
             )
         
         with col3:
-            high_addiction = df_filtered[df_filtered['Addiction_Category'] == 'High']['Sleep_Hours_Per_Night'].mean()
-            low_addiction = df_filtered[df_filtered['Addiction_Category'] == 'Low']['Sleep_Hours_Per_Night'].mean()
+            high_addiction = high_kpis.mean('Sleep_Hours_Per_Night')
+            low_addiction = low_kpis.mean('Sleep_Hours_Per_Night')
             st.metric(
                 "Sleep Loss (High vs Low)",
                 f"{high_addiction:.1f} hrs",
@@ -661,24 +1039,24 @@ def main():
         st.markdown("---")
         
         # Main addiction visualizations
-        st.plotly_chart(create_addiction_correlation(df_filtered), use_container_width=True)
+        render_chart(create_addiction_correlation, df_filtered, addiction_state, addiction_version, kpis)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(create_mental_health_impact(df_filtered), use_container_width=True)
+            render_chart(create_mental_health_impact, partial(health_by_addiction, data.query, where), addiction_state, addiction_version)
         
         with col2:
-            st.plotly_chart(create_correlation_matrix(df_filtered), use_container_width=True)
+            render_chart(create_correlation_matrix, kpis, addiction_state, addiction_version)
         
         # Detailed breakdown by platform
         st.subheader("📱 Platform-Specific Addiction Metrics")
-        platform_stats = df_filtered.groupby('Most_Used_Platform').agg({
-            'Addicted_Score': 'mean',
-            'Avg_Daily_Usage_Hours': 'mean',
-            'Mental_Health_Score': 'mean',
-            'Sleep_Hours_Per_Night': 'mean'
-        }).round(2).sort_values('Addicted_Score', ascending=False)
+        platform_stats = kpis.group_means('Most_Used_Platform', [
+            'Addicted_Score',
+            'Avg_Daily_Usage_Hours',
+            'Mental_Health_Score',
+            'Sleep_Hours_Per_Night'
+        ]).round(2).sort_values('Addicted_Score', ascending=False)
         
         st.dataframe(platform_stats, use_container_width=True)
     
@@ -686,60 +1064,115 @@ def main():
         st.header("⏰ Screen Time Usage Patterns")
         
         # Key metrics
+        screentime_totals = screentime_filtered.totals()
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.metric(
                 "Total Screen Time",
-                f"{df_screentime_filtered['screen_time_min'].sum() / 60:.0f} hrs"
+                f"{screentime_totals['screen_time_min'] / 60:.0f} hrs"
             )
         
         with col2:
             st.metric(
                 "Avg Session",
-                f"{df_screentime_filtered['screen_time_min'].mean():.1f} min"
+                f"{screentime_totals['screen_time_min'] / screentime_totals['events']:.1f} min"
             )
         
         with col3:
             st.metric(
                 "Total Launches",
-                f"{df_screentime_filtered['launches'].sum():,}"
+                f"{int(screentime_totals['launches']):,}"
             )
         
         with col4:
-            productive_pct = (df_screentime_filtered['is_productive'].sum() / len(df_screentime_filtered)) * 100
+            productive_pct = (screentime_totals['productive_events'] / screentime_totals['events']) * 100
             st.metric(
                 "Productive Apps",
                 f"{productive_pct:.1f}%"
             )
         
+        # Reach (HyperLogLog estimates, ~2% error)
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric(
+                "Unique Users",
+                f"{screentime_filtered.unique_users():,.0f}"
+            )
+        
+        with col2:
+            st.metric(
+                "Avg Daily Active Users",
+                f"{screentime_filtered.daily_active_users():,.1f}"
+            )
+        
+        with col3:
+            daily_reach = screentime_filtered.reach_by('day')
+            st.metric(
+                "Peak Daily Users",
+                f"{daily_reach.max() if len(daily_reach) else 0:,.0f}"
+            )
+        
+        with col4:
+            app_reach = screentime_filtered.reach_by('app_name')
+            st.metric(
+                "Widest-Reach App",
+                app_reach.idxmax() if len(app_reach) else "–"
+            )
+        
         st.markdown("---")
         
         # Usage pattern visualizations
-        st.plotly_chart(create_hourly_usage_pattern(df_screentime_filtered), use_container_width=True)
+        render_chart(create_hourly_usage_pattern, screentime_filtered, screentime_state, screentime_version)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.plotly_chart(create_top_apps_usage(df_screentime_filtered), use_container_width=True)
+            render_chart(create_top_apps_usage, screentime_filtered, screentime_state, screentime_version)
         
         with col2:
-            st.plotly_chart(create_productivity_comparison(df_screentime_filtered), use_container_width=True)
+            render_chart(create_productivity_comparison, screentime_filtered, screentime_state, screentime_version)
         
-        # Daily patterns
+        # Daily patterns (date range and granularity resolve to a pre-aggregated rollup)
         st.subheader("📅 Daily Usage Patterns")
-        daily_usage = df_screentime_filtered.groupby(df_screentime_filtered['date'].dt.date)['screen_time_min'].sum().reset_index()
-        daily_usage.columns = ['Date', 'Total Screen Time (min)']
-        
-        fig = px.line(
-            daily_usage,
-            x='Date',
-            y='Total Screen Time (min)',
-            title='Daily Screen Time Trend',
-            markers=True
-        )
-        fig.update_layout(template='plotly_white', height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        first_day, last_day = screentime_filtered.time_range()
+        if first_day is None:
+            st.info("No screen-time events for this selection")
+        else:
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                date_range = st.date_input(
+                    "Date Range:",
+                    (first_day.date(), last_day.date()),
+                    min_value=first_day.date(),
+                    max_value=last_day.date()
+                )
+            
+            # A half-picked range (start only) covers a single day, a cleared one every day
+            date_range = tuple(date_range) or (first_day.date(), last_day.date())
+            start_day, end_day = (date_range * 2)[:2]
+            
+            with col2:
+                # Only granularities the trend can draw over this range without coarsening them
+                honoured = screentime_filtered.granularities(
+                    pd.Timestamp(start_day), pd.Timestamp(end_day) + pd.Timedelta(days=1)
+                )
+                granularity = st.selectbox(
+                    "Granularity:",
+                    [label for label in TREND_GRANULARITIES if label == 'Auto' or label.lower() in honoured]
+                )
+            trend_state = dict(
+                screentime_state,
+                dates=(start_day.isoformat(), end_day.isoformat()),
+                granularity=granularity
+            )
+            render_chart(
+                create_daily_usage_trend, screentime_filtered, trend_state, screentime_version,
+                pd.Timestamp(start_day), pd.Timestamp(end_day) + pd.Timedelta(days=1),
+                None if granularity == 'Auto' else granularity.lower()
+            )
     
     else:  # Comparative Analysis
         st.header("⚖️ Comparative Analysis")
@@ -754,16 +1187,18 @@ def main():
         
         with col1:
             st.subheader("Social Media Addiction Dataset")
-            st.metric("Students Analyzed", len(df_filtered))
-            st.metric("Avg Social Media Usage", f"{df_filtered['Avg_Daily_Usage_Hours'].mean():.1f} hrs/day")
-            st.metric("High Addiction Rate", f"{(df_filtered['Addiction_Category'] == 'High').sum() / len(df_filtered) * 100:.0f}%")
+            st.metric("Students Analyzed", kpis.count)
+            st.metric("Avg Social Media Usage", f"{kpis.mean('Avg_Daily_Usage_Hours'):.1f} hrs/day")
+            st.metric("High Addiction Rate", format_pct(kpis.pct(kpis.where(Addiction_Category='High').count)))
         
         with col2:
             st.subheader("Screen Time Dataset")
-            st.metric("App Usage Records", len(df_screentime_filtered))
-            social_time = df_screentime_filtered[df_screentime_filtered['category'] == 'Social']['screen_time_min'].sum() / 60
+            screentime_totals = screentime_filtered.totals()
+            category_minutes = screentime_filtered.category_totals().set_index('category')['screen_time_min']
+            st.metric("App Usage Records", int(screentime_totals['events']))
+            social_time = category_minutes.get('Social', 0) / 60
             st.metric("Total Social App Time", f"{social_time:.0f} hours")
-            st.metric("Avg Interactions/Session", f"{df_screentime_filtered['interactions'].mean():.1f}")
+            st.metric("Avg Interactions/Session", f"{screentime_totals['interactions'] / screentime_totals['events']:.1f}")
         
         st.markdown("---")
         
@@ -772,11 +1207,11 @@ def main():
         
         with col1:
             st.subheader("Platform Popularity")
-            st.plotly_chart(create_platform_distribution(df_filtered), use_container_width=True)
+            render_chart(create_platform_distribution, partial(platform_counts, data.query, where), addiction_state, addiction_version)
         
         with col2:
             st.subheader("Category Distribution")
-            st.plotly_chart(create_category_distribution(df_screentime_filtered), use_container_width=True)
+            render_chart(create_category_distribution, screentime_filtered, screentime_state, screentime_version)
         
         # Key insights
         st.subheader("🔍 Key Comparative Insights")
@@ -822,11 +1257,11 @@ def main():
                 'Academic Impact (%)'
             ],
             'Social Media Users': [
-                df_filtered['Avg_Daily_Usage_Hours'].mean(),
-                df_filtered['Addicted_Score'].mean(),
-                df_filtered['Sleep_Hours_Per_Night'].mean(),
-                df_filtered['Mental_Health_Score'].mean(),
-                (df_filtered['Affects_Academic_Performance'] == 'Yes').sum() / len(df_filtered) * 100
+                kpis.mean('Avg_Daily_Usage_Hours'),
+                kpis.mean('Addicted_Score'),
+                kpis.mean('Sleep_Hours_Per_Night'),
+                kpis.mean('Mental_Health_Score'),
+                kpis.academic_impact_pct()
             ]
         }
         
@@ -843,5 +1278,20 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+def main():
+    # Pre-optimization payload sizes cost a serialization per built figure; only measured when shown or logged
+    payload_sizes = PAYLOAD_SPANS or st.session_state.get('timing_debug', False)
+    with rerun_spans.trace_rerun(payload_sizes=payload_sizes) as trace:
+        if CHART_WORKERS > 1:
+            # Charts reserve their place while the page lays out and are filled in order at the end
+            with RenderScheduler(get_chart_pool()) as scheduler:
+                render_dashboard(trace)
+                with rerun_spans.span('charts') as record:
+                    record.update(scheduler.flush())
+        else:
+            render_dashboard(trace)
+    get_span_log().record(trace)
+    render_debug_panel(trace)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,201 @@
+"""
+Quantile Sketch
+Mergeable per-group distribution summaries for box and violin plots
+
+Each DistributionSketch holds a t-digest (weighted centroids that are
+small in the tails and large in the middle), exact count/mean/variance
+through Moments, the exact min/max and a histogram on a fixed grid.
+Sketches are updated chunk by chunk and merged across partitions, and
+their size does not depend on the number of rows, so box statistics and
+a binned KDE are computed on the server and only a few hundred numbers
+per group are sent to the browser.
+"""
+
+import numpy as np
+
+from moments import Moments
+
+DEFAULT_COMPRESSION = 200
+
+
+def _k_scale(q, compression):
+    """t-digest k1 scale function (maps quantiles to centroid indices)"""
+    return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+
+class TDigest:
+    """Merging t-digest over weighted centroids
+
+    While the input has at most `compression` distinct values (few rows,
+    or discrete data such as integer scores) every centroid holds a single
+    value and quantiles are exact; beyond that, centroids are merged
+    along the k1 scale.
+    """
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.exact = True
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def _compress(self, means, weights, exact):
+        """Collapse sorted points into centroids spanning at most one unit of k
+
+        Equal values are always folded together first; when the inputs are
+        exact and few enough distinct values remain, they are kept as is.
+        """
+        means, inverse = np.unique(means, return_inverse=True)
+        weights = np.bincount(inverse.ravel(), weights=weights, minlength=len(means))
+        self.exact = exact and len(means) <= self.compression
+        if self.exact:
+            self.means, self.weights = means, weights
+            return
+        total = weights.sum()
+        upper = np.cumsum(weights)
+        midpoint = (upper - weights / 2) / total
+        groups = np.floor(_k_scale(midpoint, self.compression)).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / merged_weights
+        self.weights = merged_weights
+
+    def update(self, values, weights=None):
+        """Fold a batch of values (and optional weights) into the digest"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=np.float64)
+        self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, weights]), self.exact)
+        return self
+
+    def merge(self, other):
+        """Return a digest of the union of both inputs"""
+        merged = TDigest(self.compression)
+        if len(self.means) or len(other.means):
+            merged._compress(
+                np.concatenate([self.means, other.means]),
+                np.concatenate([self.weights, other.weights]),
+                self.exact and other.exact
+            )
+        return merged
+
+    def quantile(self, q, low, high):
+        """Quantile(s) like numpy's linear method: exact while every centroid holds one value,
+        else interpolated between centroid midpoints within [low, high]"""
+        if len(self.means) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        total = self.weights.sum()
+        if self.exact:
+            # A value of weight w occupies sorted ranks [first, first + w - 1]
+            first = np.cumsum(self.weights) - self.weights
+            xp = np.column_stack([first, first + self.weights - 1]).ravel()
+            fp = np.repeat(self.means, 2)
+            return np.interp(np.asarray(q) * (total - 1), xp, fp)
+        positions = np.cumsum(self.weights) - self.weights / 2
+        xp = np.concatenate([[0], positions, [total]])
+        fp = np.concatenate([[low], self.means, [high]])
+        return np.interp(np.asarray(q) * total, xp, fp)
+
+
+class DistributionSketch:
+    """t-digest, exact moments and extremes, and a fixed-grid histogram of one value column"""
+
+    def __init__(self, grid, compression=DEFAULT_COMPRESSION):
+        self.grid = np.asarray(grid, dtype=np.float64)
+        self.digest = TDigest(compression)
+        self.moments = Moments(['value'])
+        self.histogram = np.zeros(len(self.grid) - 1, dtype=np.int64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @classmethod
+    def from_values(cls, values, grid, compression=DEFAULT_COMPRESSION):
+        return cls(grid, compression).update(values)
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    def update(self, values):
+        """Fold a batch of values into the sketch"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.digest.update(values)
+        mean = values.mean()
+        centered = values - mean
+        self.moments = self.moments.merge(
+            Moments(['value'], len(values), np.array([mean]), np.array([[centered @ centered]]))
+        )
+        # Values outside the grid are clipped into the first or last bin
+        bins = np.clip(np.searchsorted(self.grid, values, side='right') - 1, 0, len(self.histogram) - 1)
+        self.histogram += np.bincount(bins, minlength=len(self.histogram))
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        return self
+
+    def merge(self, other):
+        """Return the sketch of the union of both partitions (grids must match)"""
+        if not np.array_equal(self.grid, other.grid):
+            raise ValueError("Cannot merge sketches built on different grids")
+        merged = DistributionSketch(self.grid, self.digest.compression)
+        merged.digest = self.digest.merge(other.digest)
+        merged.moments = self.moments.merge(other.moments)
+        merged.histogram = self.histogram + other.histogram
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        return merged
+
+    def quantile(self, q):
+        return self.digest.quantile(q, self.min, self.max)
+
+    def box_stats(self):
+        """Quartiles, 1.5 IQR fences clipped to the data range, mean and sample std"""
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'lowerfence': max(self.min, q1 - 1.5 * iqr),
+            'upperfence': min(self.max, q3 + 1.5 * iqr),
+            'mean': self.moments.mean[0],
+            'sd': float(np.sqrt(self.moments.covariance().iloc[0, 0])),
+        }
+
+    def bandwidth(self):
+        """Silverman's rule of thumb (the default plotly uses for violins)"""
+        q1, q3 = self.quantile([0.25, 0.75])
+        spread = np.sqrt(self.moments.covariance().iloc[0, 0])
+        if q3 > q1:
+            spread = min(spread, (q3 - q1) / 1.349)
+        return 1.059 * spread * self.count ** -0.2
+
+    def kde(self, points, bandwidth=None):
+        """Gaussian KDE evaluated at points from the binned values"""
+        points = np.asarray(points, dtype=np.float64)
+        if self.count < 2:
+            return np.zeros(len(points))
+        bandwidth = bandwidth or self.bandwidth()
+        if not bandwidth > 0:
+            bandwidth = self.grid[1] - self.grid[0]
+        centers = (self.grid[:-1] + self.grid[1:]) / 2
+        z = (points[:, None] - centers[None, :]) / bandwidth
+        density = np.exp(-0.5 * z ** 2) @ self.histogram
+        return density / (self.count * bandwidth * np.sqrt(2 * np.pi))
+
+
+def grouped_sketches(df, by, column, grid, compression=DEFAULT_COMPRESSION):
+    """Build one DistributionSketch of column per value of by"""
+    values = df[column].to_numpy(dtype=np.float64)
+    codes = df[by].to_numpy()
+    sketches = {}
+    for group in df[by].dropna().unique():
+        sketches[group] = DistributionSketch.from_values(values[codes == group], grid, compression)
+    return sketches
@@ -0,0 +1,197 @@
+"""
+Query Backend
+Filtered group-by aggregations behind one interface, in pandas or DuckDB
+
+Charts ask a backend for small result frames (counts or aggregates per
+group under the sidebar filters) instead of grouping full frames
+themselves. PandasBackend answers from in-memory frames, selecting rows
+with the dashboard's FilterIndex when one is given. DuckDBBackend
+answers from the Parquet cache: filters and aggregations are pushed into
+SQL over read_parquet(), run on DuckDB's thread pool, and only the
+grouped rows come back, so the data never has to fit in memory.
+Derived bucket columns (e.g. Addiction_Category) are declared once as
+(source column, bins, labels) and computed by pd.cut or a SQL CASE.
+
+In the dashboard only the grouped chart queries go through the backend;
+the filter index, KPI cube and row-level views (scatter, samples) are
+built from the in-memory frame whichever backend is selected, so the
+full dataset is still loaded.
+
+DuckDB is optional; DuckDBBackend raises ImportError without it.
+
+Usage:
+    python query_backend.py [--backend pandas|duckdb] [--by Gender Addiction_Category]
+"""
+
+import argparse
+import threading
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+AGGREGATES = {'mean': 'avg', 'sum': 'sum', 'min': 'min', 'max': 'max', 'count': 'count'}
+
+
+def bucketize(values, bins, labels):
+    """Right-closed buckets (bins[i], bins[i + 1]] as an ordered categorical (pd.cut)"""
+    return pd.cut(values, bins=bins, labels=labels)
+
+
+def _bucket_sql(column, bins, labels):
+    cases = ' '.join(
+        f'WHEN "{column}" > {low} AND "{column}" <= {high} THEN \'{label}\''
+        for low, high, label in zip(bins[:-1], bins[1:], labels)
+    )
+    return f'CASE {cases} END'
+
+
+def _normalized(result, by):
+    """Backend-independent result dtypes: group columns as categoricals of their observed
+    values (bucket order kept), numbers as int64/float64"""
+    for col in result.columns:
+        values = result[col]
+        if col in by and (isinstance(values.dtype, pd.CategoricalDtype) or values.dtype == object):
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype('category')
+            result[col] = values.cat.remove_unused_categories()
+        elif pd.api.types.is_bool_dtype(values.dtype):
+            continue
+        elif pd.api.types.is_integer_dtype(values.dtype):
+            result[col] = values.astype(np.int64)
+        elif pd.api.types.is_float_dtype(values.dtype):
+            result[col] = values.astype(np.float64)
+    return result
+
+
+class QueryBackend(ABC):
+    """Filtered group-by queries; results are sorted by the group columns
+
+    Every backend returns the same dtypes: group columns are categoricals
+    holding only the groups present (plotly express fails on empty
+    levels), counts are int64 and aggregates float64.
+    """
+
+    name = None
+
+    @abstractmethod
+    def aggregate(self, table, by, measures, equals=None, ranges=None):
+        """Aggregate measures {output: (column, 'mean'|'sum'|'min'|'max'|'count')} per group of by"""
+
+    @abstractmethod
+    def count_by(self, table, by, equals=None, ranges=None, name='Count'):
+        """Number of rows per group of by"""
+
+
+class PandasBackend(QueryBackend):
+    """Queries over in-memory frames"""
+
+    name = 'pandas'
+
+    def __init__(self, frames, indexes=None):
+        self.frames = frames
+        self.indexes = indexes or {}
+
+    def _select(self, table, equals, ranges):
+        df = self.frames[table]
+        index = self.indexes.get(table)
+        if index is not None:
+            return index.apply(df, equals, ranges)
+        mask = np.ones(len(df), dtype=bool)
+        for col, value in (equals or {}).items():
+            if value is not None:
+                mask &= (df[col] == value).to_numpy()
+        for col, bounds in (ranges or {}).items():
+            if bounds is not None:
+                mask &= df[col].between(*bounds).to_numpy()
+        return df if mask.all() else df[mask]
+
+    def aggregate(self, table, by, measures, equals=None, ranges=None):
+        df = self._select(table, equals, ranges)
+        return _normalized(df.groupby(list(by), observed=True, sort=True).agg(**measures).reset_index(), by)
+
+    def count_by(self, table, by, equals=None, ranges=None, name='Count'):
+        df = self._select(table, equals, ranges)
+        return _normalized(df.groupby(list(by), observed=True, sort=True).size().reset_index(name=name), by)
+
+
+class DuckDBBackend(QueryBackend):
+    """Queries pushed down to DuckDB over Parquet files"""
+
+    name = 'duckdb'
+
+    def __init__(self, paths, buckets=None, threads=None):
+        import duckdb
+
+        self.paths = paths
+        self.buckets = buckets or {}
+        self._connection = duckdb.connect()
+        if threads:
+            self._connection.execute(f'SET threads = {int(threads)}')
+        self._local = threading.local()
+
+    def _cursor(self):
+        """One cursor per thread (a DuckDB connection must not be shared between threads)"""
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self._local.cursor = self._connection.cursor()
+        return cursor
+
+    def _column(self, table, col):
+        bucket = self.buckets.get(table, {}).get(col)
+        return f'"{col}"' if bucket is None else _bucket_sql(bucket[0], bucket[1], bucket[2])
+
+    def _where(self, table, equals, ranges):
+        clauses, params = [], []
+        for col, value in (equals or {}).items():
+            if value is not None:
+                clauses.append(f'{self._column(table, col)} = ?')
+                params.append(value)
+        for col, bounds in (ranges or {}).items():
+            if bounds is not None:
+                clauses.append(f'{self._column(table, col)} BETWEEN ? AND ?')
+                params.extend(bounds)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def _query(self, table, by, select, equals, ranges):
+        groups = [f'{self._column(table, col)} AS "{col}"' for col in by]
+        where, params = self._where(table, equals, ranges)
+        # Rows outside every bucket are NULL in SQL and dropped by pd.cut + observed groupby
+        having = ' AND '.join(f'"{col}" IS NOT NULL' for col in by if col in self.buckets.get(table, {}))
+        positions = ', '.join(str(i + 1) for i in range(len(by)))
+        sql = (f"SELECT {', '.join(groups + select)} FROM read_parquet(?){where} "
+               f"GROUP BY {positions}{' HAVING ' + having if having else ''}")
+        result = self._cursor().execute(sql, [self.paths[table]] + params).df()
+        for col in by:
+            bucket = self.buckets.get(table, {}).get(col)
+            if bucket is not None:
+                result[col] = pd.Categorical(result[col], categories=bucket[2], ordered=True)
+        return _normalized(result.sort_values(list(by), ignore_index=True), by)
+
+    def aggregate(self, table, by, measures, equals=None, ranges=None):
+        select = [f'{AGGREGATES[func]}({self._column(table, col)}) AS "{name}"'
+                  for name, (col, func) in measures.items()]
+        return self._query(table, by, select, equals, ranges)
+
+    def count_by(self, table, by, equals=None, ranges=None, name='Count'):
+        return self._query(table, by, [f'count(*) AS "{name}"'], equals, ranges)
+
+
+if __name__ == '__main__':
+    import time
+
+    import data_cache
+
+    parser = argparse.ArgumentParser(description='Run a filtered count query on the addiction dataset')
+    parser.add_argument('--backend', choices=['pandas', 'duckdb'], default='pandas')
+    parser.add_argument('--by', nargs='+', default=['Most_Used_Platform'])
+    args = parser.parse_args()
+
+    if args.backend == 'duckdb':
+        backend = DuckDBBackend({'addiction': data_cache.ensure_cache('addiction')})
+    else:
+        backend = PandasBackend({'addiction': data_cache.read_dataset('addiction')})
+    start = time.perf_counter()
+    result = backend.count_by('addiction', args.by)
+    print(result.to_string(index=False))
+    print(f"\n{backend.name}: {len(result)} groups in {(time.perf_counter() - start) * 1000:.1f} ms")
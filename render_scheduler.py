@@ -0,0 +1,75 @@
+"""
+Render Scheduler
+Concurrent figure construction within one page render, emitted in layout order
+
+While a page lays itself out, each chart reserves its slot (an st.empty
+placeholder created in layout order) and submits its build to a bounded,
+process-wide thread pool instead of building inline. flush() then waits
+for the builds in submission order and fills each slot from the script
+thread, the only thread allowed to call Streamlit. Builds run in a copy
+of the submitting context, so their timing spans land on the rerun's
+trace. The page's chart time becomes roughly that of its slowest chart
+plus whatever the GIL serializes, and flush() reports both the wall time
+and the summed build time. The dashboard only schedules charts when
+DASHBOARD_CHART_WORKERS > 1: plotly figure construction holds the GIL,
+so on the bundled data the concurrent build is no faster than serial.
+"""
+
+import contextvars
+import time
+
+_active = contextvars.ContextVar('render_scheduler', default=None)
+
+
+def _timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+class RenderScheduler:
+    """Builds submitted charts concurrently and emits them in submission order"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._pending = []
+        self._started = None
+        self._token = None
+
+    def __enter__(self):
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.reset(self._token)
+        # On errors the remaining builds still finish in the pool; their results are dropped
+        self._pending = []
+
+    def submit(self, build, emit):
+        """Run build() in the pool; emit(result) is called by flush() in submission order"""
+        if self._started is None:
+            self._started = time.perf_counter()
+        context = contextvars.copy_context()
+        self._pending.append((self.pool.submit(context.run, _timed, build), emit))
+
+    def flush(self):
+        """Emit every pending result in order and return the timings of this batch"""
+        pending, self._pending = self._pending, []
+        build_s = 0.0
+        for future, emit in pending:
+            result, elapsed = future.result()
+            build_s += elapsed
+            emit(result)
+        wall_s = time.perf_counter() - self._started if pending else 0.0
+        self._started = None
+        return {
+            'charts': len(pending),
+            'wall_s': wall_s,
+            'build_s': build_s,
+            'speedup': build_s / wall_s if wall_s > 0 else 1.0,
+        }
+
+
+def active():
+    """The scheduler of the current page render, or None (charts are then built inline)"""
+    return _active.get()
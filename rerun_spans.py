@@ -0,0 +1,325 @@
+"""
+Rerun Spans
+Per-rerun timing spans for the dashboard with JSON log and Prometheus export
+
+Each Streamlit rerun opens a RerunTrace and every instrumented stage
+(data loading, filtering, each create_* call, each st.plotly_chart)
+records a span with its duration and attributes such as the figure
+payload size and whether the figure came from the cache. The active
+trace lives in a context variable, so helpers deep in the page code can
+add spans without it being passed around, and concurrent sessions
+(one script thread each) never see each other's spans.
+
+Finished traces go to a process-wide SpanLog, which appends one JSON
+line per rerun to .telemetry/spans.jsonl and rewrites
+.telemetry/metrics.prom (Prometheus text format) with cumulative
+per-page, per-stage totals. The render thread only folds the trace into
+the in-memory metrics and queues it in a bounded buffer; a background
+writer does the file I/O. spans.jsonl is rotated by size
+(spans.jsonl.1 ... .N), so the log never grows without bound.
+
+Usage:
+    python rerun_spans.py [--last N]
+"""
+
+import argparse
+import atexit
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+TELEMETRY_DIR = '.telemetry'
+LOG_FILE = 'spans.jsonl'
+METRICS_FILE = 'metrics.prom'
+
+# spans.jsonl is rotated past this size, keeping this many older files
+MAX_LOG_BYTES = 10 * 1024 * 1024
+LOG_BACKUPS = 3
+# Traces waiting for the writer; the oldest are dropped (and counted) beyond this
+MAX_PENDING = 1000
+
+# Rerun latency histogram buckets (seconds)
+RERUN_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current = contextvars.ContextVar('rerun_trace', default=None)
+
+
+class RerunTrace:
+    """Spans recorded during one script rerun"""
+
+    def __init__(self, page=None, filters=None, payload_sizes=False):
+        self.page = page
+        self.filters = filters or {}
+        # Whether figure builds also measure their payload before optimization (one more serialization)
+        self.payload_sizes = payload_sizes
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.duration_s = None
+        self.spans = []
+
+    @contextlib.contextmanager
+    def span(self, name, **attrs):
+        """Time the enclosed block; attributes may be added to the yielded dict"""
+        record = {'name': name, 'offset_s': time.perf_counter() - self._start, **attrs}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['duration_s'] = time.perf_counter() - start
+            self.spans.append(record)
+
+    def finish(self):
+        self.duration_s = time.perf_counter() - self._start
+        return self
+
+    def filtered(self):
+        """Whether any filter narrows the data"""
+        return any(value is not None for value in self.filters.values())
+
+    def to_dict(self):
+        return {
+            'started': self.started,
+            'page': self.page,
+            'filters': self.filters,
+            'duration_s': self.duration_s,
+            'spans': self.spans,
+        }
+
+
+@contextlib.contextmanager
+def trace_rerun(**kwargs):
+    """Make a new RerunTrace the active trace for the enclosed block"""
+    trace = RerunTrace(**kwargs)
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+        trace.finish()
+
+
+def current():
+    """The active trace, or None outside trace_rerun"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def span(name, **attrs):
+    """Record a span on the active trace (a no-op outside trace_rerun)"""
+    trace = current()
+    if trace is None:
+        yield dict(attrs)
+        return
+    with trace.span(name, **attrs) as record:
+        yield record
+
+
+def _labels(**labels):
+    return ','.join(f'{name}="{str(value).replace(chr(34), chr(39))}"' for name, value in labels.items())
+
+
+class SpanLog:
+    """Process-wide sink for finished traces"""
+
+    def __init__(self, directory=TELEMETRY_DIR, max_bytes=MAX_LOG_BYTES, backups=LOG_BACKUPS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.reruns = defaultdict(lambda: [0, 0.0, [0] * len(RERUN_BUCKETS)])
+        self.stages = defaultdict(lambda: [0, 0.0])
+        self.cache = defaultdict(int)
+        self.figure_bytes = {}
+        self.figure_raw_bytes = {}
+        self.dropped = 0
+        self._pending = deque(maxlen=MAX_PENDING)
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='span-log', daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def record(self, trace):
+        """Fold a finished trace into the metrics and queue it for the writer (no file I/O)"""
+        page, filtered = trace.page or 'unknown', str(trace.filtered()).lower()
+        with self._lock:
+            rerun = self.reruns[(page, filtered)]
+            rerun[0] += 1
+            rerun[1] += trace.duration_s
+            for i, bound in enumerate(RERUN_BUCKETS):
+                if trace.duration_s <= bound:
+                    rerun[2][i] += 1
+            for record in trace.spans:
+                stage = self.stages[(page, record['name'].split('/')[0])]
+                stage[0] += 1
+                stage[1] += record['duration_s']
+                if 'cache' in record:
+                    self.cache[(record['chart'], record['cache'])] += 1
+                if record.get('bytes') is not None:
+                    self.figure_bytes[record['chart']] = record['bytes']
+                if record.get('bytes_raw') is not None:
+                    self.figure_raw_bytes[record['chart']] = record['bytes_raw']
+            if len(self._pending) == self._pending.maxlen:
+                self.dropped += 1
+            self._pending.append(trace.to_dict())
+        self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                # Telemetry must never break the dashboard; the next flush retries the metrics
+                pass
+
+    def close(self):
+        """Write the queued traces and stop the writer thread (later traces need flush())"""
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        atexit.unregister(self.flush)
+        self.flush()
+
+    def flush(self):
+        """Append the queued traces to the log (rotating it) and rewrite the metrics file"""
+        with self._write_lock:
+            with self._lock:
+                traces = list(self._pending)
+                self._pending.clear()
+            os.makedirs(self.directory, exist_ok=True)
+            if traces:
+                self._append(os.path.join(self.directory, LOG_FILE), traces)
+            self._write_metrics()
+
+    def _append(self, path, traces):
+        """Append one JSON line per trace, rotating whenever the file would pass max_bytes"""
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        f = open(path, 'a')
+        try:
+            for trace in traces:
+                line = json.dumps(trace, default=str) + '\n'
+                if size and size + len(line.encode()) > self.max_bytes:
+                    f.close()
+                    self._rotate(path)
+                    f, size = open(path, 'a'), 0
+                f.write(line)
+                size += len(line.encode())
+        finally:
+            f.close()
+
+    def _rotate(self, path):
+        """spans.jsonl -> .1 -> .2 ... (the oldest beyond `backups` is deleted)"""
+        if self.backups < 1:
+            os.remove(path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f'{path}.{i}'):
+                os.replace(f'{path}.{i}', f'{path}.{i + 1}')
+        os.replace(path, f'{path}.1')
+
+    def prometheus(self):
+        """Current metrics in the Prometheus text exposition format"""
+        with self._lock:
+            return self._prometheus()
+
+    def _prometheus(self):
+        lines = [
+            '# HELP dashboard_rerun_seconds Script rerun latency by page',
+            '# TYPE dashboard_rerun_seconds histogram',
+        ]
+        for (page, filtered), (count, total, buckets) in sorted(self.reruns.items()):
+            labels = _labels(page=page, filtered=filtered)
+            for bound, n in zip(RERUN_BUCKETS, buckets):
+                lines.append(f'dashboard_rerun_seconds_bucket{{{labels},le="{bound}"}} {n}')
+            lines.append(f'dashboard_rerun_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'dashboard_rerun_seconds_sum{{{labels}}} {total:.6f}')
+            lines.append(f'dashboard_rerun_seconds_count{{{labels}}} {count}')
+
+        lines += [
+            '# HELP dashboard_stage_seconds Time spent per instrumented stage',
+            '# TYPE dashboard_stage_seconds summary',
+        ]
+        for (page, stage), (count, total) in sorted(self.stages.items()):
+            labels = _labels(page=page, stage=stage)
+            lines.append(f'dashboard_stage_seconds_sum{{{labels}}} {total:.6f}')
+            lines.append(f'dashboard_stage_seconds_count{{{labels}}} {count}')
+
+        lines += [
+            '# HELP dashboard_figure_cache_total Figure cache lookups by chart and result',
+            '# TYPE dashboard_figure_cache_total counter',
+        ]
+        for (chart, result), count in sorted(self.cache.items()):
+            lines.append(f'dashboard_figure_cache_total{{{_labels(chart=chart, result=result)}}} {count}')
+
+        lines += [
+            '# HELP dashboard_figure_bytes Serialized size of the last figure sent per chart',
+            '# TYPE dashboard_figure_bytes gauge',
+        ]
+        for chart, size in sorted(self.figure_bytes.items()):
+            lines.append(f'dashboard_figure_bytes{{{_labels(chart=chart)}}} {size}')
+
+        lines += [
+            '# HELP dashboard_figure_raw_bytes Serialized size of the last figure built per chart, before payload optimization',
+            '# TYPE dashboard_figure_raw_bytes gauge',
+        ]
+        for chart, size in sorted(self.figure_raw_bytes.items()):
+            lines.append(f'dashboard_figure_raw_bytes{{{_labels(chart=chart)}}} {size}')
+
+        lines += [
+            '# HELP dashboard_span_log_dropped_total Traces dropped because the log writer fell behind',
+            '# TYPE dashboard_span_log_dropped_total counter',
+            f'dashboard_span_log_dropped_total {self.dropped}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def _write_metrics(self):
+        path = os.path.join(self.directory, METRICS_FILE)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus())
+        os.replace(tmp_path, path)
+
+
+def read_log(directory=TELEMETRY_DIR, backups=LOG_BACKUPS):
+    """Every logged rerun still on disk (rotated files included), oldest first"""
+    path = os.path.join(directory, LOG_FILE)
+    reruns = []
+    for name in [f'{path}.{i}' for i in range(backups, 0, -1)] + [path]:
+        if os.path.exists(name):
+            with open(name) as f:
+                reruns.extend(json.loads(line) for line in f if line.strip())
+    return reruns
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Summarize the logged dashboard reruns')
+    parser.add_argument('--last', type=int, default=0, help='only the last N reruns')
+    args = parser.parse_args()
+
+    reruns = read_log()[-args.last:] if args.last else read_log()
+    if not reruns:
+        raise SystemExit(f"No reruns logged in {TELEMETRY_DIR}/{LOG_FILE}")
+
+    pages = defaultdict(list)
+    stages = defaultdict(list)
+    for rerun in reruns:
+        pages[rerun['page']].append(rerun['duration_s'])
+        for record in rerun['spans']:
+            stages[record['name']].append(record['duration_s'])
+
+    print(f"{len(reruns)} reruns")
+    print(f"\n{'page':<32}{'reruns':>8}{'mean':>10}{'max':>10}")
+    for page, durations in sorted(pages.items(), key=lambda item: str(item[0])):
+        print(f"{str(page):<32}{len(durations):>8}{sum(durations) / len(durations) * 1000:>8.1f}ms"
+              f"{max(durations) * 1000:>8.1f}ms")
+    print(f"\n{'span':<48}{'count':>8}{'mean':>10}{'total':>10}")
+    for name, durations in sorted(stages.items(), key=lambda item: -sum(item[1])):
+        print(f"{name:<48}{len(durations):>8}{sum(durations) / len(durations) * 1000:>8.1f}ms"
+              f"{sum(durations) * 1000:>8.1f}ms")
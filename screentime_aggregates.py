@@ -0,0 +1,342 @@
+"""
+Screen-Time Aggregates
+Additive group-by tables behind the Screen Time Patterns views
+
+Every table is keyed by app category plus one more dimension and holds
+plain sums (events, minutes, launches, interactions, productive events).
+Sums are additive, so tables built from separate batches of rows can be
+merged, and each chart and KPI is finalized from a few hundred rows.
+A merge only touches the keys of the incoming batch (new keys are
+appended unsorted), so its cost follows the batch, not the history;
+finalizers order their own results.
+
+Per-app totals are not kept exactly: the app catalogue has a long tail,
+so each category holds bounded Space-Saving summaries of minutes and
+launches per app (see heavy_hitters.py) that answer the top-K queries.
+Reach (distinct users) is not additive either and is kept as mergeable
+HyperLogLog registers per category and day (see hyperloglog.py). Per-app
+registers are only kept for each category's REACH_TOP_APPS heaviest apps
+by minutes (from its Space-Saving summary), so reach memory is bounded by
+categories x REACH_TOP_APPS x 1 KiB however long the catalogue grows. An
+app that enters a category's top list only after some batches were
+merged has its reach counted from the batches where it was tracked.
+
+The usage trend is served from time rollups at hour, day and week
+resolution. A trend query reads the coarsest rollup whose buckets line
+up with the requested range and granularity, so long periods are
+answered from a few hundred pre-aggregated rows. Buckets without events
+are returned as zeros whichever rollup answers them. There is no minute
+rollup: trends range over whole days and a single day already has more
+minutes than MAX_TREND_POINTS, so it would never be read, yet it would
+hold almost every row of the aggregates (one per category and active
+minute).
+"""
+
+import pandas as pd
+
+from heavy_hitters import SpaceSaving
+from hyperloglog import DistinctCounter
+
+# Table name -> group-by keys (every table keeps 'category' for filtering)
+GROUPINGS = {
+    'by_category': ['category'],
+    'by_hour': ['category', 'hour'],
+    'by_productivity': ['category', 'is_productive'],
+    'by_day': ['category', 'day'],
+}
+VALUE_COLUMNS = ['events', 'screen_time_min', 'launches', 'interactions', 'productive_events']
+
+# Key -> table that carries it
+LEVEL_TABLES = {keys[-1]: name for name, keys in GROUPINGS.items()}
+
+# Trend rollups: granularity -> pandas frequency of its buckets (finest first);
+# each is stored as table 'rollup_<granularity>' keyed by category and period start
+ROLLUPS = {'hour': 'h', 'day': 'D', 'week': 'W-MON'}
+TREND_COLUMNS = ['events', 'screen_time_min', 'launches', 'interactions']
+MAX_TREND_POINTS = 500
+
+# Value columns summarized per app by a heavy-hitter sketch
+APP_MEASURES = ['screen_time_min', 'launches']
+
+# Reach level -> (group-by keys, HyperLogLog precision); apps use fewer
+# registers (1 KiB each) and only the heaviest ones per category are kept
+REACH_GROUPINGS = {
+    'category': (['category'], 12),
+    'day': (['category', 'day'], 12),
+    'app_name': (['category', 'app_name'], 10),
+}
+REACH_TOP_APPS = 32
+
+
+def _event_values(df):
+    """Return the keys and float64 value columns used by every table"""
+    return pd.DataFrame({
+        'user_id': df['user_id'].to_numpy(dtype='int64'),
+        'category': df['category'].astype(str).to_numpy(),
+        'hour': df['date'].dt.hour.to_numpy(),
+        'day': df['date'].dt.floor('D').to_numpy(),
+        'app_name': df['app_name'].astype(str).to_numpy(),
+        'is_productive': df['is_productive'].to_numpy(dtype=bool),
+        'events': 1.0,
+        'screen_time_min': df['screen_time_min'].to_numpy(dtype='float64'),
+        'launches': df['launches'].to_numpy(dtype='float64'),
+        'interactions': df['interactions'].to_numpy(dtype='float64'),
+        'productive_events': df['is_productive'].to_numpy(dtype='float64'),
+    })
+
+
+def _tracked_apps(app_sketches):
+    """(category, app) keys whose reach is kept: each category's REACH_TOP_APPS apps by minutes"""
+    pairs = [(category, app) for category, sketches in app_sketches.items()
+             for app in sketches['screen_time_min'].top(REACH_TOP_APPS).index]
+    return pd.MultiIndex.from_tuples(pairs, names=REACH_GROUPINGS['app_name'][0]) if pairs else []
+
+
+def _add_rows(left, right):
+    """left + right over the union of their keys, touching only the rows keyed in right
+
+    Shared keys are summed by position and new keys appended after the
+    existing rows, so merging a small batch does not realign or re-sort
+    the whole history; tables are therefore not kept in key order.
+    """
+    if right.empty:
+        return left
+    if left.empty:
+        return right
+    positions = left.index.get_indexer(right.index)
+    found = positions >= 0
+    values = left.to_numpy(copy=True)
+    values[positions[found]] += right.to_numpy()[found]
+    merged = pd.DataFrame(values, index=left.index, columns=left.columns)
+    if found.all():
+        return merged
+    return pd.concat([merged, right[~found]])
+
+
+def period_start(dates, granularity):
+    """Start of the rollup bucket containing each timestamp"""
+    if granularity == 'week':
+        return dates.dt.to_period('W-SUN').dt.start_time
+    return dates.dt.floor(ROLLUPS[granularity])
+
+
+def _is_aligned(timestamp, granularity):
+    """True when a timestamp falls on a bucket boundary of the granularity"""
+    return period_start(pd.Series([timestamp]), granularity).iloc[0] == timestamp
+
+
+class ScreenTimeAggregates:
+    """Additive screen-time tables, per-category app sketches and reach counters with chart finalizers"""
+
+    def __init__(self, tables, app_sketches, reach):
+        self.tables = tables
+        self.app_sketches = app_sketches
+        self.reach = reach
+
+    @classmethod
+    def from_frame(cls, df):
+        """Aggregate a frame of raw screen-time events"""
+        values = _event_values(df)
+        app_sketches = {
+            category: {
+                measure: SpaceSaving.from_weights(group['app_name'].to_numpy(), group[measure].to_numpy())
+                for measure in APP_MEASURES
+            }
+            for category, group in values.groupby('category')
+        }
+        tracked = _tracked_apps(app_sketches)
+        app_rows = pd.MultiIndex.from_arrays([values['category'], values['app_name']]).isin(tracked)
+        reach = {
+            level: DistinctCounter.from_frame(values[app_rows] if level == 'app_name' else values, keys,
+                                              precision=precision)
+            for level, (keys, precision) in REACH_GROUPINGS.items()
+        }
+        tables = {
+            name: values.groupby(keys)[VALUE_COLUMNS].sum()
+            for name, keys in GROUPINGS.items()
+        }
+        for granularity in ROLLUPS:
+            periods = values[['category'] + TREND_COLUMNS].assign(period=period_start(df['date'], granularity).to_numpy())
+            tables[f'rollup_{granularity}'] = periods.groupby(['category', 'period'])[TREND_COLUMNS].sum()
+        return cls(tables, app_sketches, reach)
+
+    @classmethod
+    def empty(cls):
+        return cls.from_frame(pd.DataFrame({
+            'user_id': pd.Series(dtype='int64'),
+            'category': pd.Series(dtype=str),
+            'date': pd.Series(dtype='datetime64[ns]'),
+            'app_name': pd.Series(dtype=str),
+            'is_productive': pd.Series(dtype=bool),
+            'screen_time_min': pd.Series(dtype='float64'),
+            'launches': pd.Series(dtype='float64'),
+            'interactions': pd.Series(dtype='float64'),
+        }))
+
+    def merge(self, other):
+        """Return the element-wise sum of two aggregate sets"""
+        merged = {name: _add_rows(self.tables[name], other.tables[name]) for name in self.tables}
+
+        app_sketches = dict(self.app_sketches)
+        for category, sketches in other.app_sketches.items():
+            if category in app_sketches:
+                app_sketches[category] = {
+                    measure: app_sketches[category][measure].merge(sketch)
+                    for measure, sketch in sketches.items()
+                }
+            else:
+                app_sketches[category] = sketches
+
+        reach = {level: self.reach[level].merge(other.reach[level]) for level in REACH_GROUPINGS}
+        reach['app_name'] = reach['app_name'].keep(_tracked_apps(app_sketches))
+        return ScreenTimeAggregates(merged, app_sketches, reach)
+
+    def for_category(self, category):
+        """Restrict every table to one app category (None keeps all)"""
+        if category is None:
+            return self
+        return ScreenTimeAggregates({
+            name: table[table.index.get_level_values('category') == category]
+            for name, table in self.tables.items()
+        }, {category: self.app_sketches[category]} if category in self.app_sketches else {}, {
+            level: counter.where('category', category)
+            for level, counter in self.reach.items()
+        })
+
+    def _sum_by(self, name, level):
+        """Collapse a table onto one of its non-category keys"""
+        return self.tables[name].groupby(level=level).sum()
+
+    def summary(self, level):
+        """Sums and per-event means of every value column per key of one level
+
+        Only levels with an exact table are available (see LEVEL_TABLES);
+        per-app values are summarized by the heavy-hitter sketches instead
+        (top_apps, app_sketch).
+        """
+        if level not in LEVEL_TABLES:
+            raise ValueError(f"No exact table per {level!r} (available: {', '.join(LEVEL_TABLES)})"
+                             + ("; use top_apps() for per-app totals" if level == 'app_name' else ''))
+        sums = self.tables[LEVEL_TABLES[level]].groupby(level=level).sum()
+        summary = sums.copy()
+        for col in VALUE_COLUMNS[1:]:
+            summary[f'{col}_mean'] = sums[col] / sums['events']
+        return summary
+
+    def categories(self):
+        return sorted(self.tables['by_category'].index.get_level_values('category').unique())
+
+    def totals(self):
+        """Grand totals of every value column"""
+        return self.tables['by_category'].sum()
+
+    def category_totals(self):
+        """Minutes, launches and interactions per category"""
+        return self.tables['by_category'][['screen_time_min', 'launches', 'interactions']].sort_index().reset_index()
+
+    def hourly_pivot(self):
+        """Minutes per hour (rows) and category (columns)"""
+        table = self.tables['by_hour']['screen_time_min'].reset_index()
+        return table.pivot(index='hour', columns='category', values='screen_time_min').fillna(0)
+
+    def app_sketch(self, column='screen_time_min'):
+        """Heavy-hitter summary of one app measure over the selected categories"""
+        sketches = [by_measure[column] for by_measure in self.app_sketches.values()]
+        if len(sketches) == 1:
+            return sketches[0]
+        merged = SpaceSaving()
+        for sketch in sketches:
+            merged = merged.merge(sketch)
+        return merged
+
+    def top_apps(self, n=15, column='screen_time_min'):
+        """Upper bounds of the n apps with the most minutes (or launches), largest first"""
+        return self.app_sketch(column).top(n)
+
+    def most_launched_app(self):
+        launches = self.top_apps(1, 'launches')
+        return launches.index[0] if len(launches) else None
+
+    def productivity_stats(self):
+        """Total minutes and mean launches/interactions per productivity flag"""
+        sums = self._sum_by('by_productivity', 'is_productive')
+        return pd.DataFrame({
+            'is_productive': sums.index,
+            'screen_time_min': sums['screen_time_min'].to_numpy(),
+            'launches': (sums['launches'] / sums['events']).to_numpy(),
+            'interactions': (sums['interactions'] / sums['events']).to_numpy(),
+        })
+
+    def time_range(self):
+        """First and last day with events, or (None, None) when empty"""
+        days = self.tables['rollup_day'].index.get_level_values('period')
+        return (days.min(), days.max()) if len(days) else (None, None)
+
+    def auto_granularity(self, start, end, max_points=MAX_TREND_POINTS):
+        """Finest granularity giving at most max_points buckets over [start, end)"""
+        return self.granularities(start, end, max_points)[0]
+
+    def granularities(self, start, end, max_points=MAX_TREND_POINTS):
+        """Granularities trend() honours over [start, end), finest first (week always is)"""
+        return [granularity for granularity, frequency in ROLLUPS.items()
+                if granularity == 'week'
+                or len(pd.date_range(start, end, freq=frequency, inclusive='left')) <= max_points]
+
+    def rollup_for(self, granularity, start=None, end=None):
+        """Name of the coarsest rollup that answers buckets of granularity over [start, end)"""
+        names = list(ROLLUPS)
+        for candidate in reversed(names[:names.index(granularity) + 1]):
+            if all(bound is None or _is_aligned(bound, candidate) for bound in (start, end)):
+                return f'rollup_{candidate}'
+        return f'rollup_{names[0]}'
+
+    def trend(self, start=None, end=None, granularity=None, max_points=MAX_TREND_POINTS):
+        """Minutes, launches and interactions per bucket over [start, end)
+
+        granularity=None picks the finest one that yields at most
+        max_points buckets; an explicit granularity finer than that is
+        coarsened (see granularities()). Every bucket of the range is
+        returned, zero when it has no events. Returns (frame indexed by
+        bucket start, granularity).
+        """
+        first, last = self.time_range()
+        if first is None:
+            return pd.DataFrame(columns=TREND_COLUMNS), granularity or 'day'
+        query_start = start if start is not None else first
+        query_end = end if end is not None else last + pd.Timedelta(days=1)
+        if max_points is not None:
+            finest = self.auto_granularity(query_start, query_end, max_points)
+            if granularity is None or list(ROLLUPS).index(granularity) < list(ROLLUPS).index(finest):
+                granularity = finest
+        elif granularity is None:
+            granularity = 'day'
+        if start is None:
+            # The first bucket may start before the first event (e.g. weeks start on Monday)
+            query_start = period_start(pd.Series([first]), granularity).iloc[0]
+
+        rollup = self.rollup_for(granularity, start, end)
+        table = self.tables[rollup]
+        periods = table.index.get_level_values('period')
+        rows = table[(periods >= query_start) & (periods < query_end)].groupby(level='period').sum()
+        if rollup != f'rollup_{granularity}':
+            rows = rows.resample(ROLLUPS[granularity], label='left', closed='left').sum()
+        buckets = pd.date_range(period_start(pd.Series([query_start]), granularity).iloc[0], query_end,
+                                freq=ROLLUPS[granularity], inclusive='left', name='period')
+        return rows.reindex(buckets, fill_value=0), granularity
+
+    def daily_totals(self):
+        """Minutes per calendar day"""
+        return self.trend(granularity='day', max_points=None)[0]['screen_time_min']
+
+    def unique_users(self):
+        """Estimated distinct users over the selected categories"""
+        return self.reach['category'].total()
+
+    def reach_by(self, level):
+        """Estimated distinct users per category, day or app (apps: the tracked heavy hitters only)"""
+        return self.reach[level].counts(level)
+
+    def daily_active_users(self):
+        """Mean estimated distinct users per calendar day"""
+        daily = self.reach_by('day')
+        return float(daily.mean()) if len(daily) else 0.0
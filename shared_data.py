@@ -0,0 +1,117 @@
+"""
+Shared Data
+Process-wide read-only datasets with copy-on-write derived columns
+
+A SharedFrame holds one loaded dataset for the whole process. Sessions
+never receive the frame itself, only view(): a shallow copy whose
+column arrays are the shared ones. With pandas copy-on-write enabled,
+writing to a view (a changed cell, a replaced or added column) copies
+just the affected column into that view, so the shared data can not be
+changed through it and sessions only pay for the columns they derive.
+Derived frames used by every session are built once with derived() and
+shared the same way.
+
+Usage:
+    python shared_data.py [--sessions 1 5 20] [--page NAME]
+"""
+
+import argparse
+import threading
+
+import pandas as pd
+
+
+def enable_copy_on_write():
+    """Turn on pandas copy-on-write (the default, and only mode, from pandas 3)"""
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+
+def frame_bytes(df):
+    """Deep memory footprint of a frame in bytes"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+class SharedFrame:
+    """One read-only frame shared by every session of the process"""
+
+    def __init__(self, df):
+        self._df = df
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._df)
+
+    def view(self):
+        """A shallow, copy-on-write view of the frame (no column data is copied)"""
+        return self._df.copy(deep=False)
+
+    def with_columns(self, **columns):
+        """A view with extra or replaced columns; the shared columns stay shared"""
+        return self.view().assign(**columns)
+
+    def derived(self, key, build):
+        """Return build(view()) computed once per key and shared (as views) afterwards"""
+        with self._lock:
+            frame = self._derived.get(key)
+            if frame is None:
+                frame = self._derived[key] = build(self.view())
+        return frame.copy(deep=False)
+
+    def nbytes(self):
+        """Memory held by the shared frame and its derived frames"""
+        return frame_bytes(self._df) + sum(frame_bytes(frame) for frame in self._derived.values())
+
+
+def measure_sessions(counts, page):
+    """Traced memory after opening each number of concurrent dashboard sessions on a page
+
+    Returns (shared dataset bytes, [(sessions, traced bytes above the first
+    warm session)]). AppTest keeps every rendered element in memory, so the
+    per-session figures are an upper bound on the server's.
+    """
+    import gc
+    import os
+    import tracemalloc
+    from streamlit.testing.v1 import AppTest
+
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'phone_addiction_dashboard.py')
+
+    def open_session():
+        app = AppTest.from_file(script, default_timeout=600)
+        app.run()
+        app.sidebar.radio[0].set_value(page).run()
+        if app.exception:
+            raise RuntimeError(f"{page} page failed: {app.exception[0].value}")
+        return app
+
+    import phone_addiction_dashboard as dashboard
+    sessions = [open_session()]
+    data = dashboard.get_warmup().wait()
+    shared = data.addiction.nbytes()
+
+    tracemalloc.start()
+    gc.collect()
+    baseline = tracemalloc.get_traced_memory()[0]
+    results = []
+    for count in sorted(counts):
+        while len(sessions) < count + 1:
+            sessions.append(open_session())
+        gc.collect()
+        results.append((count, tracemalloc.get_traced_memory()[0] - baseline))
+    tracemalloc.stop()
+    return shared, results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure dashboard memory per concurrent session')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 5, 20])
+    parser.add_argument('--page', default='Social Media Addiction')
+    args = parser.parse_args()
+
+    shared, results = measure_sessions(args.sessions, args.page)
+    print(f"Shared addiction dataset: {shared / 1024:,.0f} KB (held once per process)")
+    print(f"\n{'sessions':>9}{'traced growth':>16}{'per session':>14}")
+    for count, growth in results:
+        print(f"{count:>9}{growth / 1024:>13,.0f} KB{growth / count / 1024:>11,.0f} KB")
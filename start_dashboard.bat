@@ -54,6 +54,9 @@ echo.
 echo Press Ctrl+C to stop the dashboard.
 echo.
 
+REM Prebuild the Parquet and event-store caches (the dashboard warms up from them)
+python warmup.py
+
 REM Run Streamlit
 streamlit run phone_addiction_dashboard.py
 
@@ -53,5 +53,8 @@ echo ""
 echo "Press Ctrl+C to stop the dashboard."
 echo ""
 
+# Prebuild the Parquet and event-store caches (the dashboard warms up from them)
+python3 warmup.py
+
 # Run Streamlit
 streamlit run phone_addiction_dashboard.py
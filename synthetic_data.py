@@ -0,0 +1,265 @@
+"""
+Synthetic Data Generator
+Arbitrarily large datasets shaped like the two bundled CSVs
+
+Models are fitted once from the bundled data:
+
+- Addiction: categorical columns follow their empirical marginals, Age
+  is drawn per Academic_Level, and the numeric block (usage, sleep,
+  mental health, conflicts, Addicted_Score) comes from a per-platform
+  Gaussian copula. Its correlation is fitted from Spearman ranks, and
+  each column is mapped back through its empirical quantiles, so the
+  marginals and the usage-addiction relationship are kept.
+  Affects_Academic_Performance is drawn per Addicted_Score.
+- Screen time: apps follow the empirical app mix (category and
+  is_productive follow the app), timestamps follow the per-category
+  hour-of-day profile over the requested span, and minutes, launches,
+  interactions and the remaining columns are bootstrapped from events of
+  the same app.
+
+Rows are generated in chunks with independent seeds from one
+SeedSequence, so the output depends only on the seed and chunk size.
+Chunks are written in parallel worker processes to part files, which
+are then concatenated into one CSV or Parquet file.
+
+Usage:
+    python synthetic_data.py {addiction,screentime} ROWS --output PATH
+                             [--seed 42] [--workers N] [--chunk-rows N] [--days N]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import data_cache
+
+DEFAULT_CHUNK_ROWS = 250_000
+DEFAULT_SEED = 42
+MIN_COPULA_GROUP = 30
+
+ADDICTION_MARGINALS = ['Gender', 'Academic_Level', 'Country', 'Most_Used_Platform', 'Relationship_Status']
+ADDICTION_NUMERIC = ['Avg_Daily_Usage_Hours', 'Sleep_Hours_Per_Night', 'Mental_Health_Score',
+                     'Conflicts_Over_Social_Media', 'Addicted_Score']
+
+
+def _frequencies(series):
+    counts = series.value_counts()
+    return counts.index.to_numpy(), (counts / counts.sum()).to_numpy()
+
+
+def _copula(df, correlation_from=None):
+    """Correlation of the Gaussian copula fitted from Spearman ranks, and the sorted marginals"""
+    if correlation_from is not None:
+        return {
+            'correlation': correlation_from['correlation'],
+            'marginals': [np.sort(df[col].to_numpy(dtype=np.float64)) for col in ADDICTION_NUMERIC],
+        }
+    ranks = df[ADDICTION_NUMERIC].rank().to_numpy()
+    spearman = np.nan_to_num(np.corrcoef(ranks, rowvar=False))
+    np.fill_diagonal(spearman, 1.0)
+    correlation = 2 * np.sin(np.pi * spearman / 6)
+    # Clip to the nearest positive definite matrix
+    values, vectors = np.linalg.eigh(correlation)
+    correlation = vectors @ np.diag(np.maximum(values, 1e-6)) @ vectors.T
+    scale = np.sqrt(np.diag(correlation))
+    return {
+        'correlation': correlation / np.outer(scale, scale),
+        'marginals': [np.sort(df[col].to_numpy(dtype=np.float64)) for col in ADDICTION_NUMERIC],
+    }
+
+
+def fit_addiction_model(df):
+    """Fit the addiction generator from a Students_Social_Media_Addiction-style frame"""
+    overall = _copula(df)
+    # Small platforms keep their own marginals but borrow the overall correlation
+    copula_by_platform = {
+        platform: _copula(group, None if len(group) >= MIN_COPULA_GROUP else overall)
+        for platform, group in df.groupby('Most_Used_Platform')
+    }
+    return {
+        'marginals': {col: _frequencies(df[col]) for col in ADDICTION_MARGINALS},
+        'age_by_level': {level: group.to_numpy() for level, group in df.groupby('Academic_Level')['Age']},
+        'copula': overall,
+        'copula_by_platform': copula_by_platform,
+        'academic_yes_by_score': (df['Affects_Academic_Performance'] == 'Yes').groupby(df['Addicted_Score']).mean().to_dict(),
+        'academic_yes': float((df['Affects_Academic_Performance'] == 'Yes').mean()),
+        'integer_columns': [col for col in ADDICTION_NUMERIC if pd.api.types.is_integer_dtype(df[col])],
+    }
+
+
+def _sample_copula(copula, n, rng):
+    """Draw n rows of the numeric block; ranks of correlated normals pick empirical quantiles"""
+    z = rng.multivariate_normal(np.zeros(len(ADDICTION_NUMERIC)), copula['correlation'], size=n)
+    uniforms = (np.argsort(np.argsort(z, axis=0), axis=0) + rng.random(z.shape)) / n
+    return np.column_stack([
+        marginal[np.minimum((u * len(marginal)).astype(np.int64), len(marginal) - 1)]
+        for u, marginal in zip(uniforms.T, copula['marginals'])
+    ])
+
+
+def generate_addiction(model, n, rng, first_id=1):
+    """Generate n addiction rows"""
+    df = pd.DataFrame({'Student_ID': np.arange(first_id, first_id + n)})
+    for col in ADDICTION_MARGINALS:
+        values, probabilities = model['marginals'][col]
+        df[col] = rng.choice(values, size=n, p=probabilities)
+
+    ages = np.empty(n, dtype=np.int64)
+    for level, pool in model['age_by_level'].items():
+        rows = np.flatnonzero(df['Academic_Level'].to_numpy() == level)
+        ages[rows] = rng.choice(pool, size=len(rows))
+    df['Age'] = ages
+
+    numeric = np.empty((n, len(ADDICTION_NUMERIC)))
+    platforms = df['Most_Used_Platform'].to_numpy()
+    for platform in np.unique(platforms):
+        rows = np.flatnonzero(platforms == platform)
+        copula = model['copula_by_platform'].get(platform, model['copula'])
+        numeric[rows] = _sample_copula(copula, len(rows), rng)
+    for i, col in enumerate(ADDICTION_NUMERIC):
+        df[col] = numeric[:, i].round().astype(np.int64) if col in model['integer_columns'] else numeric[:, i]
+
+    p_yes = df['Addicted_Score'].map(model['academic_yes_by_score']).fillna(model['academic_yes']).to_numpy()
+    df['Affects_Academic_Performance'] = np.where(rng.random(n) < p_yes, 'Yes', 'No')
+    return df[data_cache.ADDICTION_SCHEMA.names]
+
+
+def fit_screentime_model(df):
+    """Fit the screen-time generator from a screen_time_app_usage-style frame"""
+    df = df.sort_values('app_name', kind='stable').reset_index(drop=True)
+    apps, probabilities = _frequencies(df['app_name'])
+    groups = df.groupby('app_name', sort=False)
+    hours = df['date'].dt.hour
+    hour_profile = pd.crosstab(df['category'], hours, normalize='index').reindex(columns=range(24), fill_value=0)
+    return {
+        'apps': apps,
+        'app_probabilities': probabilities,
+        'app_rows': {app: (rows.min(), len(rows)) for app, rows in groups.indices.items()},
+        'hour_profile': {category: row.to_numpy() for category, row in hour_profile.iterrows()},
+        'start': df['date'].min().floor('D'),
+        'days': max(1, (df['date'].max().floor('D') - df['date'].min().floor('D')).days),
+        'users': int(df['user_id'].nunique()),
+        'first_user': int(df['user_id'].min()),
+        'events': len(df),
+        'rows': df.drop(columns=['user_id', 'date']),
+    }
+
+
+def generate_screentime(model, n, rng, days=None, users=None):
+    """Generate n screen-time events spread over days with users distinct user ids"""
+    days = days or model['days']
+    users = users or max(model['users'], round(model['users'] * n / model['events']))
+    apps = rng.choice(model['apps'], size=n, p=model['app_probabilities'])
+
+    # Bootstrap every other column from a random event of the same app
+    source = np.empty(n, dtype=np.int64)
+    for app, (start, size) in model['app_rows'].items():
+        rows = np.flatnonzero(apps == app)
+        source[rows] = start + rng.integers(0, size, len(rows))
+    df = model['rows'].iloc[source].reset_index(drop=True)
+    df['screen_time_min'] = (df['screen_time_min'] * rng.lognormal(0, 0.05, n)).round(2)
+
+    hours = np.empty(n, dtype=np.int64)
+    categories = df['category'].to_numpy()
+    for category, profile in model['hour_profile'].items():
+        rows = np.flatnonzero(categories == category)
+        hours[rows] = rng.choice(24, size=len(rows), p=profile)
+    offsets = (rng.integers(0, days, n) * 86_400 + hours * 3_600 + rng.integers(0, 3_600, n)) * 1_000_000_000
+    df['date'] = model['start'] + pd.to_timedelta(offsets, unit='ns')
+    df['user_id'] = model['first_user'] + rng.integers(0, users, n)
+    return df.sort_values('date', kind='stable', ignore_index=True)[data_cache.SCREENTIME_SCHEMA.names]
+
+
+GENERATORS = {
+    'addiction': (fit_addiction_model, generate_addiction, data_cache.ADDICTION_SCHEMA),
+    'screentime': (fit_screentime_model, generate_screentime, data_cache.SCREENTIME_SCHEMA),
+}
+
+
+def _write_part(job):
+    """Generate one chunk and write it as a part file (runs in a worker process)"""
+    name, model, rows, seed, first_row, path, fmt, options = job
+    _, generate, schema = GENERATORS[name]
+    rng = np.random.default_rng(seed)
+    if name == 'addiction':
+        df = generate(model, rows, rng, first_id=first_row + 1)
+    else:
+        df = generate(model, rows, rng, **options)
+    if fmt == 'parquet':
+        pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False, header=first_row == 0)
+    return path
+
+
+def _concatenate(parts, output, fmt, schema):
+    """Join the part files into one output file in order"""
+    if fmt == 'parquet':
+        with pq.ParquetWriter(output, schema) as writer:
+            for part in parts:
+                writer.write_table(pq.read_table(part, schema=schema))
+    else:
+        with open(output, 'wb') as out:
+            for part in parts:
+                with open(part, 'rb') as f:
+                    shutil.copyfileobj(f, out)
+
+
+def write_dataset(name, rows, output, seed=DEFAULT_SEED, workers=None, chunk_rows=DEFAULT_CHUNK_ROWS,
+                  source=None, **options):
+    """Fit a model from the bundled dataset and write rows synthetic rows to output (.csv or .parquet)"""
+    fit, _, schema = GENERATORS[name]
+    fmt = 'parquet' if output.endswith('.parquet') else 'csv'
+    model = fit(source if source is not None else data_cache.read_dataset(name))
+    if name == 'screentime' and options.get('users') is None:
+        # Fix the user population for the whole file, not per chunk
+        options['users'] = max(model['users'], round(model['users'] * rows / model['events']))
+
+    sizes = [min(chunk_rows, rows - start) for start in range(0, rows, chunk_rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workdir = tempfile.mkdtemp(prefix='synthetic-', dir=os.path.dirname(os.path.abspath(output)))
+    try:
+        jobs = [
+            (name, model, size, seeds[i], i * chunk_rows, os.path.join(workdir, f'part-{i:05d}.{fmt}'), fmt, options)
+            for i, size in enumerate(sizes)
+        ]
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            parts = [_write_part(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_write_part, jobs))
+        tmp_path = f'{output}.{os.getpid()}.tmp'
+        _concatenate(parts, tmp_path, fmt, schema)
+        os.replace(tmp_path, output)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate large synthetic datasets shaped like the bundled CSVs')
+    parser.add_argument('dataset', choices=list(GENERATORS))
+    parser.add_argument('rows', type=int)
+    parser.add_argument('--output', required=True, help='.csv or .parquet file to write')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--days', type=int, help='screen time: span of the events in days (default: as bundled)')
+    parser.add_argument('--users', type=int, help='screen time: number of distinct users (default: scaled)')
+    args = parser.parse_args()
+
+    options = {'days': args.days, 'users': args.users} if args.dataset == 'screentime' else {}
+    write_dataset(args.dataset, args.rows, args.output, args.seed, args.workers, args.chunk_rows, **options)
+    print(f"✓ Wrote {args.rows:,} synthetic {args.dataset} rows to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Time Index
+Timestamp-sorted screen-time events with binary-search time slicing
+
+The event frame is sorted by 'date' once (skipped when it already is)
+and the timestamps are kept as a sorted int64 array. Any time window
+resolves to a start/stop row pair with np.searchsorted in O(log n), and
+the rows come back as a positional slice of the sorted frame, a view
+rather than a copy, so slices must be treated as read-only. Hour-of-day
+windows resolve to one contiguous run per day.
+
+Usage:
+    python time_index.py [--last-days N] [--start DATE --end DATE] [--hours H1 H2]
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+
+class TimeIndex:
+    """A frame sorted by a timestamp column with O(log n) window lookups"""
+
+    def __init__(self, df, column='date'):
+        timestamps = df[column]
+        if not timestamps.is_monotonic_increasing:
+            df = df.iloc[np.argsort(timestamps.to_numpy(), kind='stable')].reset_index(drop=True)
+        self.df = df
+        self.column = column
+        self.timestamps = df[column].to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+    def __len__(self):
+        return len(self.df)
+
+    def time_range(self):
+        """First and last timestamp, or (None, None) when empty"""
+        if len(self) == 0:
+            return None, None
+        return pd.Timestamp(self.timestamps[0]), pd.Timestamp(self.timestamps[-1])
+
+    def bounds(self, start=None, end=None):
+        """Row positions (first, stop) of the events with start <= date < end"""
+        first = 0 if start is None else np.searchsorted(self.timestamps, pd.Timestamp(start).value, side='left')
+        stop = len(self) if end is None else np.searchsorted(self.timestamps, pd.Timestamp(end).value, side='left')
+        return int(first), int(max(first, stop))
+
+    def between(self, start=None, end=None):
+        """Events with start <= date < end (a view of the sorted frame)"""
+        first, stop = self.bounds(start, end)
+        return self.df.iloc[first:stop]
+
+    def last(self, period):
+        """Events in the trailing period (a Timedelta or e.g. '7D') up to the newest event"""
+        if len(self) == 0:
+            return self.df
+        end = self.timestamps[-1] + 1
+        return self.between(pd.Timestamp(end) - pd.Timedelta(period), pd.Timestamp(end))
+
+    def last_days(self, days):
+        return self.last(pd.Timedelta(days=days))
+
+    def hour_positions(self, start_hour, end_hour, start=None, end=None):
+        """Row positions of events whose hour of day is in [start_hour, end_hour)
+
+        Each calendar day contributes one contiguous run found by binary
+        search, so the cost is O(days log n) plus the size of the result.
+        """
+        first, last = self.time_range()
+        if first is None:
+            return np.empty(0, dtype=np.intp)
+        days = pd.date_range(first.floor('D'), last.floor('D'), freq='D')
+        starts = np.searchsorted(self.timestamps, (days + pd.Timedelta(hours=start_hour)).asi8, side='left')
+        stops = np.searchsorted(self.timestamps, (days + pd.Timedelta(hours=end_hour)).asi8, side='left')
+        low, high = self.bounds(start, end)
+        starts, stops = np.clip(starts, low, high), np.clip(stops, low, high)
+        lengths = stops - starts
+        if lengths.sum() == 0:
+            return np.empty(0, dtype=np.intp)
+        # Expand the (start, length) runs into positions without a Python loop
+        offsets = np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+        return np.arange(lengths.sum()) + offsets
+
+    def hours(self, start_hour, end_hour, start=None, end=None):
+        """Events whose hour of day is in [start_hour, end_hour), optionally within [start, end)"""
+        return self.df.iloc[self.hour_positions(start_hour, end_hour, start, end)]
+
+
+if __name__ == '__main__':
+    from event_store import ScreenTimeStore
+    from screentime_aggregates import ScreenTimeAggregates
+
+    parser = argparse.ArgumentParser(description='Slice the screen-time events by time')
+    parser.add_argument('--last-days', type=float)
+    parser.add_argument('--start')
+    parser.add_argument('--end')
+    parser.add_argument('--hours', type=int, nargs=2, metavar=('FROM', 'TO'))
+    args = parser.parse_args()
+
+    index = ScreenTimeStore().time_index()
+    if args.hours:
+        events = index.hours(*args.hours, args.start, args.end)
+    elif args.last_days is not None:
+        events = index.last_days(args.last_days)
+    else:
+        events = index.between(args.start, args.end)
+
+    print(f"{len(events):,} of {len(index):,} events")
+    if len(events):
+        print(ScreenTimeAggregates.from_frame(events).summary('category').round(2).to_string())
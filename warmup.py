@@ -0,0 +1,118 @@
+"""
+Warm-up
+Background build of the dashboard data with atomic publication
+
+A Warmup runs a build function on a daemon thread and publishes its
+result with a single reference assignment once the build has finished,
+so readers see either the previous complete result or the new one,
+never a partial one. Until the first result is published, current()
+returns None and status() reports the step in progress, letting the
+page render a "warming" state instead of blocking on the build. When
+the published result goes stale (new data on disk) it is rebuilt in the
+background while the old result keeps being served.
+
+Run directly, it prebuilds the on-disk caches (Parquet datasets and the
+screen-time event store) so the in-process warm-up starts from them.
+
+Usage:
+    python warmup.py
+"""
+
+import threading
+import time
+
+DEFAULT_RETRY_AFTER_S = 30.0
+
+
+class Warmup:
+    """Builds a value in the background and publishes it atomically"""
+
+    def __init__(self, build, is_stale=None, steps=None, retry_after_s=DEFAULT_RETRY_AFTER_S, name='warmup'):
+        self._build = build
+        self._is_stale = is_stale
+        self.steps = steps
+        self.retry_after_s = retry_after_s
+        self.name = name
+        self._lock = threading.Lock()
+        self._thread = None
+        self._value = None
+        self._status = {'state': 'idle', 'step': None, 'done': 0, 'error': None,
+                        'started': None, 'duration_s': None}
+
+    def start(self):
+        """Start a build unless one is already running"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._status = {'state': 'warming', 'step': None, 'done': 0, 'error': None,
+                            'started': time.time(), 'duration_s': None}
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def _report(self, step):
+        """Called by the build at the start of each step"""
+        with self._lock:
+            if self._status['step'] is not None:
+                self._status['done'] += 1
+            self._status['step'] = step
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            value = self._build(self._report)
+        except Exception as exc:
+            with self._lock:
+                self._status.update(state='failed', error=f'{type(exc).__name__}: {exc}',
+                                    duration_s=time.perf_counter() - start)
+            return
+        with self._lock:
+            self._value = value
+            self._status.update(state='ready', step=None, done=self.steps or self._status['done'] + 1,
+                                duration_s=time.perf_counter() - start)
+
+    def current(self):
+        """The last published value (None until the first build finishes)
+
+        Starts a background rebuild when the value is missing or stale; a
+        failed build is retried after retry_after_s.
+        """
+        value = self._value
+        if value is None or (self._is_stale is not None and self._is_stale(value)):
+            with self._lock:
+                status = dict(self._status)
+            failed_recently = (status['state'] == 'failed'
+                               and time.time() - status['started'] < self.retry_after_s)
+            if status['state'] != 'warming' and not failed_recently:
+                self.start()
+        return value
+
+    def status(self):
+        """Copy of the build status with a 0-1 progress estimate"""
+        with self._lock:
+            status = dict(self._status)
+        status['ready'] = self._value is not None
+        status['progress'] = min(status['done'] / self.steps, 1.0) if self.steps else None
+        return status
+
+    def wait(self, timeout=None):
+        """Block until the running build (if any) finishes; returns the published value"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._value
+
+
+if __name__ == '__main__':
+    import data_cache
+    from event_store import ScreenTimeStore
+
+    for name in data_cache.DATASETS:
+        start = time.perf_counter()
+        data_cache.ensure_cache(name)
+        print(f"✓ {name} Parquet cache ready ({time.perf_counter() - start:.2f} s)")
+
+    start = time.perf_counter()
+    store = ScreenTimeStore()
+    store.refresh()
+    print(f"✓ Screen-time event store ready at version {store.version()} ({time.perf_counter() - start:.2f} s)")